@@ -0,0 +1,402 @@
+# atlas_cli.py
+
+"""
+Command-line answers without the GUI, e.g.:
+
+    python atlas_cli.py current --common 120 --rare 4 --badges 15 --boost-hours 4
+    python atlas_cli.py next-tier --common 120 --region "United States"
+    python atlas_cli.py goal --target 1 --timeframe day --assume-boosts --assumed-rent-boost 30
+    python atlas_cli.py custom-tier --count 600 --badges 15
+    python atlas_cli.py between --from 2024-01-01 --to 2025-01-01 --common 120
+    python atlas_cli.py calendar --from 2024-01-01 --to 2026-01-01 --common 120 --boost-hours 4
+    python atlas_cli.py when --target 100 --balance 12.5 --events purchases.csv --parcel-cost 0.1 --common 120
+    python atlas_cli.py fleet --store fleet.npy --import fleet.csv --target 100
+    python atlas_cli.py fleet --store fleet.npy --tier-edit "United States" 1 151 215 22
+    python atlas_cli.py calibrate --log rent_log.csv
+    python atlas_cli.py            (interactive REPL)
+
+Only constants and utils are imported (no tkinter, NumPy, openpyxl or fpdf) to keep
+cold start within STARTUP_BUDGET_MS; 'python atlas_cli.py --check-startup' verifies that, and
+test_atlas_cli.py runs the same check under unittest or pytest.
+"""
+
+import argparse
+import sys
+
+import constants
+import utils
+
+STARTUP_BUDGET_MS = 50
+STARTUP_CHECK_RUNS = 10
+# Modules whose import would blow the startup budget
+HEAVY_MODULES = ["tkinter", "numpy", "openpyxl", "fpdf"]
+
+
+def _add_account_arguments(parser):
+    """Flags describing the account, mirroring the main form of the GUI."""
+    for p_type in constants.PARCEL_RATES_PER_SECOND:
+        parser.add_argument(f"--{p_type}", type=int, default=0, metavar="N", help=f"{p_type.capitalize()} parcels owned")
+    parser.add_argument("--badges", type=int, default=0, metavar="N", help="Badges owned")
+    parser.add_argument("--boost-hours", type=float, default=0.0, metavar="H", help="Ad boost hours per day")
+    parser.add_argument("--region", default="United States", choices=list(constants.REGIONAL_AD_BOOST_DATA), metavar="REGION")
+    parser.add_argument("--srb", action="store_true", help=f"Force Super Rent Boost ({constants.SUPER_RENT_BOOST_MULTIPLIER}x)")
+    parser.add_argument("--fictive-badge-boost", type=float, default=None, metavar="PERCENT",
+                        help="Use this badge boost instead of the badge tier (e.g. 5 for 5%%)")
+    _add_profile_argument(parser)
+
+
+def _add_profile_argument(parser):
+    parser.add_argument("--profile", dest="profile_path", metavar="FILE.json",
+                        help="SRB hours and rarity mix saved by 'calibrate --save' (default: the built-in values)")
+
+
+def _build_parser():
+    parser = argparse.ArgumentParser(prog="atlas_cli", description="Atlas Earth Calculator (command line).")
+    parser.add_argument("--check-startup", action="store_true",
+                        help=f"Measure cold start and fail if it exceeds {STARTUP_BUDGET_MS} ms or loads GUI/NumPy modules")
+    commands = parser.add_subparsers(dest="command")
+
+    current = commands.add_parser("current", help="Earnings per timeframe for an account")
+    _add_account_arguments(current)
+
+    next_tier = commands.add_parser("next-tier", help="Current ad boost tier and the parcels needed for the next one")
+    _add_account_arguments(next_tier)
+
+    goal = commands.add_parser("goal", help="Parcels needed to reach an earnings goal")
+    goal.add_argument("--target", type=float, required=True, metavar="AMOUNT", help="Target earnings in $")
+    goal.add_argument("--timeframe", default="day", choices=["second", "minute", "hour", "day", "week", "month", "year"])
+    goal.add_argument("--rarity", choices=list(constants.PARCEL_RATES_PER_SECOND),
+                      help="Count parcels of this rarity only (default: the usual rarity mix)")
+    goal.add_argument("--assume-boosts", action="store_true", help="Apply the assumed badges and rent boost")
+    goal.add_argument("--assumed-badges", type=int, default=0, metavar="N")
+    goal.add_argument("--assumed-rent-boost", type=float, default=0.0, metavar="X", help="Assumed rent boost multiplier, e.g. 30")
+    _add_profile_argument(goal)
+
+    custom_tier = commands.add_parser("custom-tier", help="Monthly earnings at a hypothetical parcel count")
+    custom_tier.add_argument("--count", type=int, required=True, metavar="N", help="Hypothetical total parcels")
+    for p_type in constants.PARCEL_RATES_PER_SECOND:
+        custom_tier.add_argument(f"--mix-{p_type}", type=float, default=100.0 if p_type == "common" else 0.0,
+                                 metavar="PERCENT", help=f"Share of {p_type} parcels in the count")
+    _add_account_arguments(custom_tier)
+
+    between = commands.add_parser("between", help="Earnings between two dates, using the rate tables in force on each day")
+    between.add_argument("--from", dest="start_date", required=True, metavar="YYYY-MM-DD")
+    between.add_argument("--to", dest="end_date", required=True, metavar="YYYY-MM-DD", help="First day not counted")
+    _add_account_arguments(between)
+
+    calendar = commands.add_parser("calendar", help="Earnings per calendar month, with real month lengths")
+    calendar.add_argument("--from", dest="start_date", required=True, metavar="YYYY-MM-DD")
+    calendar.add_argument("--to", dest="end_date", required=True, metavar="YYYY-MM-DD", help="First day not counted")
+    calendar.add_argument("--srb-event", action="append", default=[], metavar="YYYY-MM-DD:HOURS",
+                          help=f"SRB hours on a date (repeatable); without any, every month gets the profile's "
+                               f"SRB hours ({constants.SRB_HOURS_PER_MONTH} h by default)")
+    _add_account_arguments(calendar)
+
+    when = commands.add_parser("when", help="Date on which the balance reaches a target, with planned purchases")
+    when.add_argument("--target", type=float, required=True, metavar="AMOUNT", help="Target balance in $")
+    when.add_argument("--balance", type=float, default=0.0, metavar="AMOUNT", help="Balance on the start date")
+    when.add_argument("--from", dest="start_date", metavar="YYYY-MM-DD", help="Start date (default: today)")
+    when.add_argument("--events", dest="events_path", metavar="FILE.csv", help="Planned purchases (date, common, rare, epic, legendary, badges)")
+    when.add_argument("--parcel-cost", type=float, default=0.0, metavar="AMOUNT", help="Paid from the balance per planned parcel")
+    when.add_argument("--srb-event", action="append", default=[], metavar="YYYY-MM-DD:HOURS",
+                      help=f"SRB hours on a date (repeatable); without any, the profile's SRB hours "
+                           f"({constants.SRB_HOURS_PER_MONTH} h/month by default) are spread evenly")
+    _add_account_arguments(when)
+
+    fleet = commands.add_parser("fleet", help="Monthly totals for a fleet stored as a memory-mapped portfolio file")
+    fleet.add_argument("--store", required=True, metavar="FILE.npy", help="Portfolio store to read (or to create with --import)")
+    fleet.add_argument("--import", dest="import_path", metavar="FILE.csv", help="Build the store from a fleet CSV first")
+    fleet.add_argument("--target", type=float, metavar="AMOUNT", help="Also report when the accounts' balances reach this amount")
+    fleet.add_argument("--tier-edit", nargs=5, metavar=("REGION", "ROW", "MIN", "MAX", "MULTIPLIER"),
+                       help="Report the impact of changing one ad boost tier row (a what-if; the table is left unchanged)")
+    _add_profile_argument(fleet)
+
+    calibrate = commands.add_parser("calibrate", help="Fit SRB hours, realized boost hours and rarity mix to a rent log")
+    calibrate.add_argument("--log", dest="log_path", required=True, metavar="FILE.csv",
+                           help="Daily rent log: date, amount, parcels (or per-rarity counts), optional badges, boost_hours, region")
+    calibrate.add_argument("--save", dest="save_path", metavar="FILE.json",
+                           help="Save the fitted profile for --profile and the GUI's File > Open Profile")
+
+    commands.add_parser("repl", help="Interactive prompt (the default without a command)")
+    return parser
+
+
+def _badge_multiplier(args):
+    """Badge multiplier from the flags; the fictive boost takes a percentage like the GUI field."""
+    if args.fictive_badge_boost is not None:
+        percent = args.fictive_badge_boost
+        return 1.0 + (percent / 100.0 if percent > 1.0 else percent)
+    return utils.get_passport_boost_multiplier(args.badges)
+
+
+def _parcels(args):
+    return {p_type: getattr(args, p_type) for p_type in constants.PARCEL_RATES_PER_SECOND}
+
+
+def _rate_profile(args):
+    """The RateProfile from --profile, or the built-in defaults."""
+    import rate_profile
+
+    return rate_profile.load_profile(args.profile_path) if args.profile_path else rate_profile.DEFAULT_PROFILE
+
+
+def _run_current(args, out):
+    earnings, _ = utils.calculate_timeframe_earnings(_parcels(args), _badge_multiplier(args), args.boost_hours,
+                                                     args.srb, args.region,
+                                                     srb_hours_per_month=_rate_profile(args).srb_hours_per_month)
+    out.write(f"{'Timeframe':<12}{'Base Earnings':>20}{'With Ad Boost':>20}\n")
+    for tf, (base, boosted) in earnings.items():
+        decimals = 8 if tf in ("month", "year") else 10
+        out.write(f"{'Per ' + tf.capitalize() + ':':<12}{'$' + format(base, f'.{decimals}f'):>20}{'$' + format(boosted, f'.{decimals}f'):>20}\n")
+
+
+def _run_next_tier(args, out):
+    total_parcels = sum(_parcels(args).values())
+    current_tier, next_tier = utils.get_next_ad_boost_tier(total_parcels, args.region)
+    out.write(f"Total parcels: {total_parcels:,} ({args.region})\n")
+    if current_tier:
+        out.write(f"Current tier: {current_tier['min']:,}-{current_tier['max']:,} parcels at {current_tier['multiplier']}x\n")
+    else:
+        out.write("Current tier: none\n")
+    if next_tier:
+        out.write(f"Next tier: {next_tier['min']:,}-{next_tier['max']:,} parcels at {next_tier['multiplier']}x\n")
+        out.write(f"Parcels needed: {next_tier['min'] - total_parcels:,}\n")
+    else:
+        out.write("Next tier: already at the highest tier\n")
+
+
+def _run_goal(args, out):
+    multiplier = 1.0
+    if args.assume_boosts:
+        multiplier = args.assumed_rent_boost * utils.get_passport_boost_multiplier(args.assumed_badges)
+    mode = "specific" if args.rarity else "mixed"
+    try:
+        total, breakdown = utils.calculate_parcels_for_goal(args.target, args.timeframe, multiplier, mode, args.rarity or "common",
+                                                            _rate_profile(args).parcel_probabilities)
+    except ZeroDivisionError:
+        raise ValueError("The boosted parcel rate is zero; check the assumed boosts.")
+    out.write(f"Target: ${args.target:.2f} per {args.timeframe} (rate multiplier {multiplier:g}x)\n")
+    out.write(f"Total parcels needed: {total:,.0f}" + (f" {args.rarity}\n" if args.rarity else "\n"))
+    for p_type, count in breakdown.items():
+        out.write(f"  {p_type.capitalize()}: {count:,.0f}\n")
+
+
+def _run_custom_tier(args, out):
+    mix = {p_type: getattr(args, f"mix_{p_type}") for p_type in constants.PARCEL_RATES_PER_SECOND}
+    mix_total = sum(mix.values())
+    if mix_total <= 0:
+        mix, mix_total = {"common": 1.0}, 1.0
+    rate_per_parcel = sum(constants.PARCEL_RATES_PER_SECOND[p_type] * share for p_type, share in mix.items()) / mix_total
+    ad_multiplier, base_monthly, boosted_monthly = utils.calculate_custom_tier_monthly(
+        args.count, rate_per_parcel, _badge_multiplier(args), args.boost_hours, args.srb, args.region,
+        _rate_profile(args).srb_hours_per_month)
+    out.write(f"Ad boost multiplier at {args.count:,} parcels: {ad_multiplier:.2f}x\n")
+    out.write(f"Estimated base monthly: ${base_monthly:.8f}\n")
+    out.write(f"Estimated boosted monthly: ${boosted_monthly:.8f}\n")
+
+
+def _run_between(args, out):
+    import rate_epochs
+
+    fictive_multiplier = _badge_multiplier(args) if args.fictive_badge_boost is not None else None
+    projection = rate_epochs.EarningsProjection(_parcels(args), args.badges, args.boost_hours, args.srb, args.region,
+                                                fictive_badge_multiplier=fictive_multiplier,
+                                                srb_hours_per_month=_rate_profile(args).srb_hours_per_month)
+    out.write(f"From {args.start_date} to {args.end_date} (excluded):\n")
+    out.write(f"Base earnings: ${projection.earnings_between(args.start_date, args.end_date, boosted=False):.8f}\n")
+    out.write(f"With ad boost: ${projection.earnings_between(args.start_date, args.end_date):.8f}\n")
+
+
+def _run_calendar(args, out):
+    import earnings_model
+
+    parcels = _parcels(args)
+    total_parcels = sum(parcels.values())
+    rent_per_second = utils.calculate_base_earnings_per_second(parcels) * _badge_multiplier(args)
+    ad_multiplier = utils.get_ad_boost_multiplier(total_parcels, args.region) if total_parcels > 0 else 1.0
+    srb_events = earnings_model.parse_srb_events(",".join(args.srb_event)) if args.srb_event else None
+    months, days, base, boosted = earnings_model.calendar_month_earnings(
+        rent_per_second, ad_multiplier, args.boost_hours, args.srb, args.start_date, args.end_date, srb_events,
+        _rate_profile(args).srb_hours_per_month)
+    out.write(f"{'Month':<10}{'Days':>6}{'Base Earnings':>20}{'With Ad Boost':>20}\n")
+    for month, month_days, month_base, month_boosted in zip(months.astype(str), days, base, boosted):
+        out.write(f"{month:<10}{month_days:>6}{'$' + format(month_base, '.8f'):>20}{'$' + format(month_boosted, '.8f'):>20}\n")
+    out.write(f"{'Total':<10}{days.sum():>6}{'$' + format(base.sum(), '.8f'):>20}{'$' + format(boosted.sum(), '.8f'):>20}\n")
+
+
+def _run_when(args, out):
+    import datetime
+
+    import earnings_model
+    import rate_epochs
+    import target_solver
+    import timeline
+
+    start_date = rate_epochs.parse_date(args.start_date) if args.start_date else datetime.date.today()
+    events = timeline.read_events_file(args.events_path) if args.events_path else ([], [], [])
+    fictive_multiplier = _badge_multiplier(args) if args.fictive_badge_boost is not None else None
+    srb_hours_per_month = _rate_profile(args).srb_hours_per_month
+    account = timeline.AcquisitionTimeline(start_date, _parcels(args), args.badges, *events, args.region,
+                                           args.boost_hours, args.srb, fictive_multiplier, srb_hours_per_month)
+    srb_events = earnings_model.parse_srb_events(",".join(args.srb_event)) if args.srb_event else None
+    reached = target_solver.date_reaching(account, args.target, args.balance, args.boost_hours, args.srb,
+                                          srb_events, args.parcel_cost, srb_hours_per_month)
+    out.write(f"Target ${args.target:.2f} from ${args.balance:.2f} on {start_date.isoformat()}:\n")
+    if reached is None:
+        out.write("Never reached: the balance stops growing below the target.\n")
+    else:
+        out.write(f"Reached on {reached.isoformat()} ({(reached - start_date).days:,} days)\n")
+
+
+def _run_fleet(args, out):
+    import portfolio_store
+
+    if args.import_path:
+        portfolio_store.PortfolioStore.from_fleet_file(args.import_path).save(args.store)
+    store = portfolio_store.PortfolioStore.open(args.store)
+    srb_hours_per_month = _rate_profile(args).srb_hours_per_month
+    base, boosted = store.monthly_earnings(srb_hours_per_month=srb_hours_per_month)
+    out.write(f"Accounts: {len(store):,} ({store.records.nbytes / 1e6:.1f} MB)\n")
+    out.write(f"Total parcels: {int(store.total_parcels().sum()):,}\n")
+    out.write(f"Monthly base earnings: ${base.sum():.8f}\n")
+    out.write(f"Monthly boosted earnings: ${boosted.sum():.8f}\n")
+    if args.target is not None:
+        import datetime
+
+        import numpy as np
+        import target_solver
+
+        today = datetime.date.today()
+        days = target_solver.fleet_days_to_target(store, args.target, today,
+                                                  srb_hours_per_month=srb_hours_per_month) - today.toordinal()
+        reached = days[np.isfinite(days)]
+        out.write(f"Reaching ${args.target:.2f} from today: {len(reached):,} accounts")
+        if len(reached):
+            earliest, median, latest = np.ceil(np.percentile(reached, [0, 50, 100])).astype(int).tolist()
+            out.write(f", earliest in {earliest:,} days, median {median:,}, latest {latest:,}")
+        out.write(f" ({len(days) - len(reached):,} never)\n")
+    if args.tier_edit:
+        region, row, tier_min, tier_max, multiplier = args.tier_edit
+        if region not in constants.REGIONAL_AD_BOOST_DATA:
+            raise ValueError(f"Unknown region '{region}'.")
+        index = portfolio_store.FleetIndex(store, srb_hours_per_month)
+        report = index.apply_tier_edit(region, int(row), int(tier_min), int(tier_max), float(multiplier))
+        out.write(portfolio_store.describe_tier_edit(report) + "\n")
+
+
+def _run_calibrate(args, out):
+    import calibration
+
+    profile = calibration.fit_rent_log(calibration.read_rent_log(args.log_path))
+    out.write(calibration.describe_profile(profile) + "\n")
+    if args.save_path:
+        import rate_profile
+
+        rate_profile.save_profile(args.save_path, profile)
+        out.write(f"Profile saved to {args.save_path}; use it with --profile {args.save_path}\n")
+
+
+COMMANDS = {
+    "current": _run_current,
+    "next-tier": _run_next_tier,
+    "goal": _run_goal,
+    "custom-tier": _run_custom_tier,
+    "between": _run_between,
+    "calendar": _run_calendar,
+    "when": _run_when,
+    "fleet": _run_fleet,
+    "calibrate": _run_calibrate,
+}
+
+
+def run_repl(parser, out=sys.stdout):
+    """
+    Reads commands from stdin until 'quit'. 'set <flags>' remembers account flags
+    (e.g. 'set --common 120 --badges 15') for every following command.
+    """
+    import shlex
+
+    saved_flags = []
+    out.write("Atlas Earth Calculator. Commands: " + ", ".join(COMMANDS) + ", set, help, quit\n")
+    while True:
+        try:
+            line = input("atlas> ")
+        except EOFError:
+            out.write("\n")
+            return
+        try:
+            tokens = shlex.split(line)
+        except ValueError as e:
+            out.write(f"Error: {e}\n")
+            continue
+        if not tokens:
+            continue
+        if tokens[0] in ("quit", "exit"):
+            return
+        if tokens[0] == "set":
+            saved_flags = tokens[1:]
+            continue
+        if tokens[0] == "help":
+            parser.print_help(out)
+            continue
+        if tokens[0] in ("current", "next-tier", "custom-tier", "between", "calendar", "when"):
+            # Flags typed with the command come after the saved ones, so they win
+            tokens = tokens[:1] + saved_flags + tokens[1:]
+        try:
+            args = parser.parse_args(tokens)
+            COMMANDS[args.command](args, out)
+        except SystemExit:
+            pass  # argparse already printed the usage error
+        except (KeyError, ValueError, OSError) as e:
+            out.write(f"Error: {e}\n")
+
+
+def check_startup(runs=STARTUP_CHECK_RUNS):
+    """
+    Starts the tool in fresh interpreters and returns True if the fastest cold start of a
+    typical query is within STARTUP_BUDGET_MS and none of HEAVY_MODULES was imported.
+    """
+    import os
+    import subprocess
+    import time
+
+    script = os.path.abspath(__file__)
+    query = [sys.executable, script, "current", "--common", "100"]
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(query, check=True, stdout=subprocess.DEVNULL)
+        timings.append((time.perf_counter() - start) * 1000)
+    best = min(timings)
+
+    probe = ("import sys, io, contextlib; sys.argv = ['atlas_cli']; import atlas_cli\n"
+             "with contextlib.redirect_stdout(io.StringIO()): atlas_cli.main(['current', '--common', '100'])\n"
+             f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    loaded = subprocess.run([sys.executable, "-c", probe], cwd=os.path.dirname(script),
+                            check=True, capture_output=True, text=True).stdout.split()
+
+    print(f"Cold start: best {best:.1f} ms of {runs} runs (budget {STARTUP_BUDGET_MS} ms, "
+          f"a bare interpreter is part of it)")
+    if loaded:
+        print(f"Heavy modules imported: {', '.join(loaded)}")
+    return best <= STARTUP_BUDGET_MS and not loaded
+
+
+def main(argv=None):
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if args.check_startup:
+        return 0 if check_startup() else 1
+    if args.command in (None, "repl"):
+        run_repl(parser)
+        return 0
+    try:
+        COMMANDS[args.command](args, sys.stdout)
+    except (KeyError, ValueError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+# badge_planner.py
+
+import numpy as np
+
+import constants
+import earnings_model
+
+# Badge counts at which the passport boost steps up (0 gives no boost), ascending
+BADGE_BREAKPOINTS = np.array(sorted(count for count in constants.BADGE_BOOST_TIERS if count > 0), dtype=np.int64)
+BADGE_BREAKPOINTS.setflags(write=False)
+
+
+def monthly_earnings(base_rate, parcels, added_parcels, badges, rate_per_parcel, region, boost_hours, srb_forced,
+                     srb_hours_per_month=None):
+    """
+    Boosted monthly earnings of the portfolio after buying added_parcels (at rate_per_parcel each)
+    and holding 'badges' badges; added_parcels and badges broadcast, so a whole (badge, parcel)
+    candidate grid is one call. base_rate is the current unboosted rent per second.
+    """
+    added_parcels = np.asarray(added_parcels, dtype=np.int64)
+    rent_per_second = (base_rate + added_parcels * rate_per_parcel) * earnings_model.passport_boost_multipliers(badges)
+    ad_multiplier = earnings_model.ad_boost_multipliers(parcels + added_parcels, region)
+    return rent_per_second * earnings_model.boosted_seconds_factor(ad_multiplier, boost_hours, srb_forced, "month",
+                                                                   srb_hours_per_month)
+
+
+def next_badge_tier(badge_count):
+    """The smallest badge count above badge_count that raises the passport boost, or None past the last tier."""
+    index = np.searchsorted(BADGE_BREAKPOINTS, badge_count, side="right")
+    return int(BADGE_BREAKPOINTS[index]) if index < len(BADGE_BREAKPOINTS) else None
+
+
+def _parcel_candidates(parcels, region, most):
+    """
+    Parcel purchases worth checking, up to 'most': none, all of them, and the purchases that
+    end at a tier boundary. Between two boundaries the ad multiplier is constant, so earnings
+    grow linearly with the parcels bought and the best purchase is always one of these.
+    """
+    table = earnings_model.compile_tier_table(region)
+    boundaries = np.concatenate([table.mins - 1, table.maxs]) - parcels
+    return np.unique(np.concatenate([[0, most], boundaries[(boundaries > 0) & (boundaries < most)]]))
+
+
+def compare_next_steps(parcel_counts, badge_count, region, boost_hours, srb_forced, rate_per_parcel,
+                       parcel_cost, badge_cost, parcels_to_compare, srb_hours_per_month=None):
+    """
+    The monthly gain of the next badge tier against buying parcels_to_compare parcels and against
+    spending the badge tier's cost on parcels instead. Returns a list of option dicts: 'option',
+    'badges', 'parcels', 'cost', 'monthly_gain' and 'payback_days' (inf where the option earns
+    nothing, e.g. parcels that fall off an ad tier cliff).
+    """
+    base_rate = sum(count * constants.PARCEL_RATES_PER_SECOND[p_type] for p_type, count in parcel_counts.items())
+    parcels = sum(parcel_counts.values())
+    target = next_badge_tier(badge_count)
+    badges_needed = target - badge_count if target is not None else 0
+
+    steps = []
+    if target is not None:
+        steps.append((f"Reach {target} badges", badges_needed, 0))
+    steps.append((f"Buy {parcels_to_compare:,} parcel{'s' if parcels_to_compare != 1 else ''}", 0, parcels_to_compare))
+    if target is not None and parcel_cost > 0:
+        same_spend = int(badges_needed * badge_cost // parcel_cost)
+        if same_spend > 0 and same_spend != parcels_to_compare:
+            steps.append((f"Buy {same_spend:,} parcel{'s' if same_spend != 1 else ''} (same spend)", 0, same_spend))
+
+    added_badges = np.array([badges for _, badges, _ in steps])
+    added_parcels = np.array([bought for _, _, bought in steps])
+    before = monthly_earnings(base_rate, parcels, 0, badge_count, rate_per_parcel, region, boost_hours, srb_forced,
+                              srb_hours_per_month)
+    gains = monthly_earnings(base_rate, parcels, added_parcels, badge_count + added_badges,
+                             rate_per_parcel, region, boost_hours, srb_forced, srb_hours_per_month) - before
+    costs = added_badges * badge_cost + added_parcels * parcel_cost
+    with np.errstate(divide="ignore", invalid="ignore"):
+        payback_days = np.where(gains > 0, costs / (gains / constants.AVG_DAYS_PER_MONTH), np.inf)
+
+    return [{"option": option, "badges": int(badges), "parcels": int(bought), "cost": float(cost),
+             "monthly_gain": float(gain), "payback_days": float(days)}
+            for (option, badges, bought), cost, gain, days in zip(steps, costs, gains, payback_days)]
+
+
+def optimal_plan(parcel_counts, badge_count, region, boost_hours, srb_forced, rate_per_parcel,
+                 parcel_cost, badge_cost, budget, horizon_months, srb_hours_per_month=None):
+    """
+    The mix of badges and parcels, within budget, that earns the most over horizon_months net
+    of what it costs. Badge candidates are the passport tier breakpoints above badge_count (and
+    none); for each, the parcel candidates are the tier boundaries the remaining budget reaches,
+    so the whole search is one (badges x parcels) broadcast over the breakpoint arrays.
+
+    Returns a list of plan dicts, one per badge candidate with its best parcel purchase, ordered
+    best first: 'badges' (added), 'badge_count', 'parcels' (added), 'cost', 'monthly_gain' and
+    'net' (gain over the horizon minus the cost).
+    """
+    base_rate = sum(count * constants.PARCEL_RATES_PER_SECOND[p_type] for p_type, count in parcel_counts.items())
+    parcels = sum(parcel_counts.values())
+
+    added_badges = np.concatenate([[0], BADGE_BREAKPOINTS[BADGE_BREAKPOINTS > badge_count] - badge_count])
+    remaining = budget - added_badges * badge_cost
+    added_badges, remaining = added_badges[remaining >= 0], remaining[remaining >= 0]
+    most_parcels = np.floor(remaining / parcel_cost).astype(np.int64) if parcel_cost > 0 else np.zeros(len(remaining), dtype=np.int64)
+
+    # Boundaries within the largest purchase, clipped to what each badge candidate leaves
+    candidates = _parcel_candidates(parcels, region, int(most_parcels.max()) if len(most_parcels) else 0)
+    added_parcels = np.column_stack([np.minimum(candidates[np.newaxis, :], most_parcels[:, np.newaxis]), most_parcels])
+
+    before = monthly_earnings(base_rate, parcels, 0, badge_count, rate_per_parcel, region, boost_hours, srb_forced,
+                              srb_hours_per_month)
+    gains = monthly_earnings(base_rate, parcels, added_parcels, badge_count + added_badges[:, np.newaxis],
+                             rate_per_parcel, region, boost_hours, srb_forced, srb_hours_per_month) - before
+    costs = added_badges[:, np.newaxis] * badge_cost + added_parcels * parcel_cost
+    net = gains * horizon_months - costs
+
+    best = np.argmax(net, axis=1)
+    rows = np.arange(len(added_badges))
+    plans = [{"badges": int(added_badges[row]), "badge_count": int(badge_count + added_badges[row]),
+              "parcels": int(added_parcels[row, column]), "cost": float(costs[row, column]),
+              "monthly_gain": float(gains[row, column]), "net": float(net[row, column])}
+             for row, column in zip(rows, best)]
+    return sorted(plans, key=lambda plan: -plan["net"])
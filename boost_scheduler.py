@@ -0,0 +1,199 @@
+# boost_scheduler.py
+
+import csv
+import functools
+import math
+from collections import namedtuple
+
+import constants
+import utils
+
+# A run of ad views: 'count' views, the first at 'start' seconds after midnight, then one every 'every' seconds
+ViewRun = namedtuple("ViewRun", ["start", "count", "every"])
+
+# The schedule for one set of boost/SRB windows, shared by every account that uses the same windows
+DaySchedule = namedtuple("DaySchedule", ["view_runs", "ad_views", "ad_boosted_seconds", "srb_seconds"])
+
+# One account's day: its schedule plus what that schedule earns
+AccountPlan = namedtuple("AccountPlan", ["account", "schedule", "ad_multiplier", "base_daily", "planned_daily"])
+
+# Columns of a fleet file; every column but 'account' is optional
+FLEET_FILE_DEFAULTS = {
+    "account": None,
+    "common": "0",
+    "rare": "0",
+    "epic": "0",
+    "legendary": "0",
+    "badges": "0",
+    "region": "United States",
+    "boost_windows": "",
+    "srb_windows": "",
+}
+
+
+def parse_time_of_day(text):
+    """Parses 'HH:MM' or 'HH:MM:SS' (24h, '24:00' allowed) into seconds after midnight."""
+    parts = [int(part) for part in text.strip().split(":")]
+    if not 2 <= len(parts) <= 3:
+        raise ValueError(f"Invalid time of day: '{text}' (expected HH:MM)")
+    hours, minutes, seconds = parts + [0] * (3 - len(parts))
+    total = hours * constants.SECONDS_PER_HOUR + minutes * constants.SECONDS_PER_MINUTE + seconds
+    if not (0 <= minutes < 60 and 0 <= seconds < 60 and 0 <= total <= constants.SECONDS_PER_DAY):
+        raise ValueError(f"Invalid time of day: '{text}'")
+    return total
+
+
+def format_time_of_day(seconds):
+    seconds = int(round(seconds))
+    return f"{seconds // constants.SECONDS_PER_HOUR:02d}:{seconds % constants.SECONDS_PER_HOUR // 60:02d}:{seconds % 60:02d}"
+
+
+def parse_windows(text):
+    """
+    Parses windows like '08:00-12:00, 18:30-20:00' into a tuple of (start, end) seconds.
+    A window that wraps past midnight (e.g. '22:00-02:00') is split into two.
+    """
+    windows = []
+    for part in text.replace(";", ",").split(","):
+        if not part.strip():
+            continue
+        start_text, separator, end_text = part.partition("-")
+        if not separator:
+            raise ValueError(f"Invalid window: '{part.strip()}' (expected HH:MM-HH:MM)")
+        start, end = parse_time_of_day(start_text), parse_time_of_day(end_text)
+        if end > start:
+            windows.append((start, end))
+        elif end < start:
+            windows.extend([(start, constants.SECONDS_PER_DAY), (0, end)])
+    return tuple(windows)
+
+
+def merge_intervals(intervals):
+    """Returns the union of (start, end) intervals as a sorted list of disjoint intervals."""
+    merged = []
+    for start, end in sorted(intervals):
+        if end <= start:
+            continue
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def subtract_intervals(intervals, removed):
+    """Returns the parts of the disjoint sorted 'intervals' not covered by the disjoint sorted 'removed'."""
+    result = []
+    j = 0
+    for start, end in intervals:
+        # Skip removed intervals that end before this one starts
+        while j < len(removed) and removed[j][1] <= start:
+            j += 1
+        k = j
+        while k < len(removed) and removed[k][0] < end:
+            if removed[k][0] > start:
+                result.append((start, removed[k][0]))
+            start = max(start, removed[k][1])
+            k += 1
+        if start < end:
+            result.append((start, end))
+    return result
+
+
+def total_length(intervals):
+    return sum(end - start for start, end in intervals)
+
+
+@functools.lru_cache(maxsize=1024)
+def schedule_ad_views(boost_windows, srb_windows=(), boost_seconds=constants.PAY_PER_BOOST_SECONDS):
+    """
+    Plans the ad views that keep an ad boost running through every boost window of a day.
+    Each view grants 'boost_seconds' of boost from the moment it is watched. SRB windows already
+    pay the SRB multiplier, which an ad boost does not add to, so no views are planned there.
+    Both window arguments are tuples of (start, end) seconds after midnight, e.g. from parse_windows.
+    """
+    if boost_seconds <= 0:
+        raise ValueError("Each ad boost must last a positive number of seconds.")
+    srb = merge_intervals(srb_windows)
+    wanted = subtract_intervals(merge_intervals(boost_windows), srb)
+
+    view_runs = []
+    covered = []
+    for start, end in wanted:
+        # Back-to-back views from the start of the window; the last one may run past its end
+        count = math.ceil((end - start) / boost_seconds)
+        view_runs.append(ViewRun(start, count, boost_seconds))
+        covered.append((start, min(start + count * boost_seconds, constants.SECONDS_PER_DAY)))
+
+    # Overhang from the last view of a run counts too, except where an SRB window takes over
+    ad_boosted = subtract_intervals(merge_intervals(covered), srb)
+    return DaySchedule(tuple(view_runs), sum(run.count for run in view_runs), total_length(ad_boosted), total_length(srb))
+
+
+def plan_account_day(account, parcels, badge_count, region, boost_windows, srb_windows=(),
+                     boost_seconds=constants.PAY_PER_BOOST_SECONDS, badge_mult=None):
+    """
+    Plans one account's ad views for a day and prices the day from its time segments:
+    unboosted time at the badge-boosted rate, ad-boosted time at the regional ad multiplier on
+    top of that, and SRB time at SUPER_RENT_BOOST_MULTIPLIER.
+    badge_mult overrides the badge tier (e.g. a fictive badge boost).
+    """
+    schedule = schedule_ad_views(boost_windows, srb_windows, boost_seconds)
+    if badge_mult is None:
+        badge_mult = utils.get_passport_boost_multiplier(badge_count)
+    rate = utils.calculate_base_earnings_per_second(parcels) * badge_mult
+    ad_multiplier = utils.get_ad_boost_multiplier(sum(parcels.values()), region)
+
+    unboosted_seconds = constants.SECONDS_PER_DAY - schedule.ad_boosted_seconds - schedule.srb_seconds
+    planned_daily = rate * (unboosted_seconds + ad_multiplier * schedule.ad_boosted_seconds +
+                            constants.SUPER_RENT_BOOST_MULTIPLIER * schedule.srb_seconds)
+    return AccountPlan(account, schedule, ad_multiplier, rate * constants.SECONDS_PER_DAY, planned_daily)
+
+
+def read_fleet_file(file_path):
+    """Reads a CSV fleet file (one account per row, columns from FLEET_FILE_DEFAULTS) into a list of dicts."""
+    with open(file_path, newline='') as fleet_file:
+        rows = list(csv.DictReader(fleet_file))
+    accounts = []
+    for line_number, row in enumerate(rows, start=2):
+        row = {key.strip(): (value or "").strip() for key, value in row.items() if key}
+        if not row.get("account"):
+            raise ValueError(f"Line {line_number}: every account needs a name in the 'account' column.")
+        account = {name: row.get(name) or default for name, default in FLEET_FILE_DEFAULTS.items()}
+        if account["region"] not in constants.REGIONAL_AD_BOOST_DATA:
+            raise ValueError(f"Line {line_number}: unknown region '{account['region']}'.")
+        accounts.append(account)
+    return accounts
+
+
+def plan_fleet(accounts, boost_seconds=constants.PAY_PER_BOOST_SECONDS):
+    """
+    Plans the day for every account from read_fleet_file. Accounts that share the same windows
+    share one cached schedule, so a fleet costs little more than pricing each account.
+    """
+    plans = []
+    for account in accounts:
+        parcels = {p_type: int(account[p_type]) for p_type in constants.PARCEL_RATES_PER_SECOND}
+        plans.append(plan_account_day(account["account"], parcels, int(account["badges"]), account["region"],
+                                      parse_windows(account["boost_windows"]), parse_windows(account["srb_windows"]),
+                                      boost_seconds))
+    return plans
+
+
+def write_fleet_plan(file_path, plans):
+    """Writes one row per run of ad views (or one summary row for an account without views) to a CSV file."""
+    with open(file_path, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["Account", "Ad Views", "Ad Boosted Hours", "SRB Hours", "Base Daily", "Planned Daily",
+                         "Run Start", "Run Views", "View Every (s)", "Last View"])
+        for plan in plans:
+            summary = [plan.account, plan.schedule.ad_views,
+                       f"{plan.schedule.ad_boosted_seconds / constants.SECONDS_PER_HOUR:.2f}",
+                       f"{plan.schedule.srb_seconds / constants.SECONDS_PER_HOUR:.2f}",
+                       f"{plan.base_daily:.8f}", f"{plan.planned_daily:.8f}"]
+            if not plan.schedule.view_runs:
+                writer.writerow(summary + ["", "", "", ""])
+            for run in plan.schedule.view_runs:
+                writer.writerow(summary + [format_time_of_day(run.start), run.count, run.every,
+                                           format_time_of_day(run.start + (run.count - 1) * run.every)])
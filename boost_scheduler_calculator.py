@@ -0,0 +1,162 @@
+# boost_scheduler_calculator.py
+
+import time
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+
+import constants
+import earnings_model
+import boost_scheduler
+from widgets import IntegerEntry
+
+class BoostSchedulerCalculator:
+    def __init__(self, parent_frame, get_user_inputs_callback, job_runner):
+        self.parent_frame = parent_frame
+        self.get_user_inputs_callback = get_user_inputs_callback
+        self.job_runner = job_runner
+
+        self.boost_windows_var = tk.StringVar(value="08:00-12:00")
+        self.srb_windows_var = tk.StringVar(value="")
+        self.boost_seconds_var = tk.StringVar(value=str(constants.PAY_PER_BOOST_SECONDS))
+
+        self._create_widgets()
+
+    def _create_widgets(self):
+        row = 0
+        header_font = ("Helvetica", 10, "bold")
+        value_font = ("Courier", 10)
+
+        ttk.Label(self.parent_frame, text="Boost Windows (HH:MM-HH:MM, ...):").grid(row=row, column=0, sticky="w", padx=5, pady=2)
+        boost_entry = ttk.Entry(self.parent_frame, width=40, textvariable=self.boost_windows_var)
+        boost_entry.grid(row=row, column=1, sticky="w", padx=5, pady=2)
+        boost_entry.bind("<KeyRelease>", lambda event: self.update_display())
+        row += 1
+        ttk.Label(self.parent_frame, text="SRB Windows (HH:MM-HH:MM, ...):").grid(row=row, column=0, sticky="w", padx=5, pady=2)
+        srb_entry = ttk.Entry(self.parent_frame, width=40, textvariable=self.srb_windows_var)
+        srb_entry.grid(row=row, column=1, sticky="w", padx=5, pady=2)
+        srb_entry.bind("<KeyRelease>", lambda event: self.update_display())
+        row += 1
+        ttk.Label(self.parent_frame, text="Boost Seconds per Ad View:").grid(row=row, column=0, sticky="w", padx=5, pady=2)
+        IntegerEntry(self.parent_frame, width=8, textvariable=self.boost_seconds_var).grid(row=row, column=1, sticky="w", padx=5, pady=2)
+        row += 1
+
+        ttk.Label(self.parent_frame, text="--- Today's Plan ---", font=header_font).grid(row=row, column=0, columnspan=2, sticky="w", pady=(15, 5))
+        row += 1
+        self.output_labels = {}
+        for key, text in [("ad_views", "Ad Views Needed:"), ("ad_boosted", "Ad Boosted Time:"), ("srb", "SRB Time:"),
+                          ("base_daily", "Daily Earnings (No Boosts):"), ("planned_daily", "Daily Earnings (Planned):")]:
+            ttk.Label(self.parent_frame, text=text, font=value_font).grid(row=row, column=0, sticky="w", padx=5, pady=1)
+            self.output_labels[key] = ttk.Label(self.parent_frame, text="N/A", font=value_font)
+            self.output_labels[key].grid(row=row, column=1, sticky="ew", padx=5, pady=1)
+            row += 1
+
+        # One row per run of back-to-back ad views
+        run_columns = ("start", "views", "every", "last_view", "boost_until")
+        self.runs_tree = ttk.Treeview(self.parent_frame, columns=run_columns, show="headings", height=6)
+        self.runs_tree.heading("start", text="First View")
+        self.runs_tree.heading("views", text="Views")
+        self.runs_tree.heading("every", text="Every (s)")
+        self.runs_tree.heading("last_view", text="Last View")
+        self.runs_tree.heading("boost_until", text="Boosted Until")
+        for column in run_columns:
+            self.runs_tree.column(column, width=110, anchor="e")
+        self.runs_tree.grid(row=row, column=0, columnspan=2, sticky="ew", padx=5, pady=(5, 10))
+        row += 1
+
+        self.status_label = ttk.Label(self.parent_frame, text="")
+        self.status_label.grid(row=row, column=0, columnspan=2, sticky="w", padx=5, pady=2)
+        row += 1
+
+        self.fleet_button = ttk.Button(self.parent_frame, text="Plan Fleet from File...", command=self._plan_fleet_file)
+        self.fleet_button.grid(row=row, column=0, columnspan=2, pady=(5, 10))
+
+        self.parent_frame.grid_columnconfigure(1, weight=1)
+
+    def _read_schedule_inputs(self):
+        """Returns (boost_windows, srb_windows, boost_seconds); raises ValueError for invalid input."""
+        boost_seconds = int(self.boost_seconds_var.get() or 0)
+        if boost_seconds <= 0:
+            raise ValueError("Boost seconds per ad view must be at least 1.")
+        return (boost_scheduler.parse_windows(self.boost_windows_var.get()),
+                boost_scheduler.parse_windows(self.srb_windows_var.get()), boost_seconds)
+
+    def update_display(self):
+        inputs = self.get_user_inputs_callback()
+        if inputs is None:
+            self._clear_labels()
+            return
+        try:
+            boost_windows, srb_windows, boost_seconds = self._read_schedule_inputs()
+        except ValueError as e:
+            # Shown inline rather than in a dialog, since this runs while the user is typing
+            self._clear_labels()
+            self.status_label.config(text=str(e))
+            return
+
+        plan = boost_scheduler.plan_account_day("", inputs["parcels"], inputs["badge_count"], inputs["selected_region"],
+                                                boost_windows, srb_windows, boost_seconds,
+                                                badge_mult=earnings_model.badge_multiplier(inputs))
+        schedule = plan.schedule
+        self.output_labels["ad_views"].config(text=f"{schedule.ad_views:,}")
+        self.output_labels["ad_boosted"].config(text=f"{schedule.ad_boosted_seconds / constants.SECONDS_PER_HOUR:.2f} h at {plan.ad_multiplier}x")
+        self.output_labels["srb"].config(text=f"{schedule.srb_seconds / constants.SECONDS_PER_HOUR:.2f} h at {constants.SUPER_RENT_BOOST_MULTIPLIER}x")
+        self.output_labels["base_daily"].config(text=f"${plan.base_daily:.8f}")
+        self.output_labels["planned_daily"].config(text=f"${plan.planned_daily:.8f}")
+
+        self.runs_tree.delete(*self.runs_tree.get_children())
+        for run in schedule.view_runs:
+            last_view = run.start + (run.count - 1) * run.every
+            boost_until = min(last_view + run.every, constants.SECONDS_PER_DAY)
+            self.runs_tree.insert("", "end", values=(boost_scheduler.format_time_of_day(run.start), f"{run.count:,}", run.every,
+                                                     boost_scheduler.format_time_of_day(last_view),
+                                                     boost_scheduler.format_time_of_day(boost_until)))
+        self.status_label.config(text="")
+
+    def _plan_fleet_file(self):
+        """Plans a day for every account in a CSV fleet file and writes the view schedule to another CSV."""
+        try:
+            boost_seconds = self._read_schedule_inputs()[2]
+        except ValueError as e:
+            messagebox.showerror("Input Error", str(e))
+            return
+        input_path = filedialog.askopenfilename(filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+                                                title="Open Fleet File")
+        if not input_path:
+            return
+        output_path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files", "*.csv")],
+                                                   title="Save Fleet Day Plan")
+        if not output_path:
+            return
+
+        def plan_fleet(job):
+            accounts = boost_scheduler.read_fleet_file(input_path)
+            start = time.perf_counter()
+            plans = boost_scheduler.plan_fleet(accounts, boost_seconds)
+            elapsed = time.perf_counter() - start
+            boost_scheduler.write_fleet_plan(output_path, plans)
+            return len(plans), elapsed
+
+        def on_done(job, result):
+            account_count, elapsed = result
+            messagebox.showinfo("Fleet Planned", f"Planned {account_count:,} accounts in {elapsed * 1000:.1f} ms.\nPlan saved to {output_path}")
+
+        def on_error(job, e):
+            if isinstance(e, (ValueError, KeyError)):
+                messagebox.showerror("Input Error", f"Could not plan the fleet file: {e}")
+            else:
+                messagebox.showerror("Calculation Error", f"An unexpected error occurred: {e}")
+
+        self.job_runner.run_in_thread("Planning fleet", plan_fleet, on_done=on_done, on_error=on_error)
+
+    def _clear_labels(self):
+        for label in self.output_labels.values():
+            label.config(text="N/A")
+        self.runs_tree.delete(*self.runs_tree.get_children())
+
+    def get_session_variables(self):
+        """Returns the tab's input variables, keyed by name, for session save/restore."""
+        return {
+            "boost_windows": self.boost_windows_var,
+            "srb_windows": self.srb_windows_var,
+            "boost_seconds": self.boost_seconds_var,
+        }
@@ -0,0 +1,181 @@
+# calibration.py
+
+import csv
+
+import numpy as np
+
+import constants
+import earnings_model
+import rate_profile
+
+PARCEL_TYPES = list(constants.PARCEL_RATES_PER_SECOND)
+
+# A day is an SRB day when it earned this much more than the fit (0.25 = 25%) and stands out
+# from the spread of ordinary days by SRB_SPIKE_SPREADS robust standard deviations
+SRB_SPIKE_MIN_EXCESS = 0.25
+SRB_SPIKE_SPREADS = 4.0
+# Refits after re-flagging SRB days; the flags normally settle after two or three
+FIT_ITERATIONS = 8
+
+
+def read_rent_log(file_path):
+    """
+    Reads a CSV log of rent actually earned, one row per day: 'date' and 'amount' are required;
+    holdings come from a 'parcels' total or from per-rarity columns (common, rare, epic, legendary).
+    Optional 'badges', 'boost_hours' (ad boost hours used that day) and 'region' columns.
+    Returns a dict of NumPy arrays: days (datetime64[D]), amounts, parcels, badges, boost_hours
+    (NaN when the log has no boost column) and regions.
+    """
+    with open(file_path, newline='') as log_file:
+        reader = csv.reader(log_file)
+        header = [name.strip().lower() for name in next(reader, [])]
+        columns = {name: index for index, name in enumerate(header)}
+        if "date" not in columns or "amount" not in columns:
+            raise ValueError("The rent log needs 'date' (YYYY-MM-DD) and 'amount' columns.")
+        if "parcels" not in columns and not any(p_type in columns for p_type in PARCEL_TYPES):
+            raise ValueError("The rent log needs a 'parcels' column or per-rarity parcel columns.")
+        rows = [row for row in reader if any(cell.strip() for cell in row)]
+
+    def column(name, default):
+        index = columns.get(name)
+        return [row[index].strip() if index is not None and index < len(row) and row[index].strip() else default
+                for row in rows]
+
+    try:
+        days = np.array(column("date", ""), dtype="datetime64[D]")
+        amounts = np.array(column("amount", "0"), dtype=np.float64)
+        if "parcels" in columns:
+            parcels = np.array(column("parcels", "0"), dtype=np.int64)
+        else:
+            parcels = sum(np.array(column(p_type, "0"), dtype=np.int64) for p_type in PARCEL_TYPES)
+        badges = np.array(column("badges", "0"), dtype=np.int64)
+        boost_hours = np.array(column("boost_hours", "nan"), dtype=np.float64)
+    except ValueError as e:
+        raise ValueError(f"Invalid value in the rent log: {e}")
+    regions = np.array(column("region", "United States"))
+    unknown = set(regions.tolist()) - set(constants.REGIONAL_AD_BOOST_DATA)
+    if unknown:
+        raise ValueError(f"Unknown region in the rent log: {sorted(unknown)[0]}")
+    return {"days": days, "amounts": amounts, "parcels": parcels, "badges": badges,
+            "boost_hours": boost_hours, "regions": regions}
+
+
+def mix_for_rate(rate_per_parcel):
+    """
+    The rarity mix whose average rate is rate_per_parcel: commons are traded for the other
+    rarities in their default proportions. Rates outside what that can reach are clipped.
+    """
+    default = rate_profile.DEFAULT_PROFILE.parcel_probabilities
+    common_rate = constants.PARCEL_RATES_PER_SECOND["common"]
+    others = {p_type: share for p_type, share in default.items() if p_type != "common"}
+    other_rate = sum(constants.PARCEL_RATES_PER_SECOND[p_type] * share for p_type, share in others.items()) / sum(others.values())
+    weight = float(np.clip((rate_per_parcel - common_rate) / (other_rate - common_rate), 0.0, 1.0))
+    mix = {"common": 1.0 - weight}
+    mix.update({p_type: weight * share / sum(others.values()) for p_type, share in others.items()})
+    return mix
+
+
+def fit_rent_log(log):
+    """
+    Fits the effective parameters behind a rent log (from read_rent_log) by least squares over
+    every day at once. Normalized per parcel, badge multiplier and second, an ordinary day earns
+        y = r + r x rho x (ad_multiplier - 1) x logged_hours / 24
+    which is linear in (r, r x rho): r is the effective base rate per parcel (an effective rarity
+    mix) and rho the share of the logged boost hours actually realized. Without a boost column
+    logged_hours is 1, so rho is the realized hours per day. SRB days show up as spikes above
+    the fit; they are flagged robustly (median absolute deviation), left out of the refit, and
+    their excess over the fit gives the SRB hours at 50x. If the log never varies its boost
+    exposure, r and rho cannot be told apart and the logged hours (or the default mix rate)
+    are taken at face value.
+
+    Returns a profile dict: srb_hours_per_month, boost_hours (realized per day), boost_realization
+    (None without a boost column), rate_per_parcel, parcel_probabilities, and the fit's days,
+    srb_days, residual_rms and 'held' (parameters fixed instead of fitted). Calculations take
+    its SRB hours and mix as a rate_profile.RateProfile (rate_profile.profile_from_dict).
+    """
+    days, amounts = log["days"], log["amounts"]
+    usable = (log["parcels"] > 0) & np.isfinite(amounts)
+    if usable.sum() < 2:
+        raise ValueError("The rent log needs at least two days with parcels to fit.")
+    days, amounts = days[usable], amounts[usable]
+    parcels, badges, regions = log["parcels"][usable], log["badges"][usable], log["regions"][usable]
+    logged = np.nan_to_num(log["boost_hours"][usable], nan=0.0)
+    has_boost_column = not np.isnan(log["boost_hours"]).all()
+    exposure_hours = logged if has_boost_column else np.ones(len(amounts))
+
+    ad_multiplier = np.ones(len(amounts))
+    for region in np.unique(regions):
+        in_region = regions == region
+        ad_multiplier[in_region] = earnings_model.ad_boost_multipliers(parcels[in_region], str(region))
+    # Rent per second for one unit of per-parcel rate
+    unit_rent = parcels * earnings_model.passport_boost_multipliers(badges)
+    y = amounts / (unit_rent * constants.SECONDS_PER_DAY)
+    x = (ad_multiplier - 1.0) * exposure_hours / 24.0
+
+    held = []
+    separable = np.ptp(x) > 1e-9
+    default_rate = earnings_model.mix_rate_per_second(rate_profile.DEFAULT_PROFILE.parcel_probabilities)
+    ordinary = np.ones(len(y), dtype=bool)
+    for _ in range(FIT_ITERATIONS):
+        if separable:
+            design = np.column_stack([np.ones(ordinary.sum()), x[ordinary]])
+            (rate, boosted_rate), *_ = np.linalg.lstsq(design, y[ordinary], rcond=None)
+        elif has_boost_column:
+            # Logged hours taken as realized: y = r x (1 + x)
+            rate = np.dot(1.0 + x[ordinary], y[ordinary]) / np.dot(1.0 + x[ordinary], 1.0 + x[ordinary])
+            boosted_rate = rate
+        else:
+            # One level only: keep the default mix rate and give the rest to the boost
+            rate = default_rate
+            x_level = x[ordinary][0] if ordinary.any() else 0.0
+            boosted_rate = (np.mean(y[ordinary]) - rate) / x_level if x_level else 0.0
+        rate = max(rate, 1e-12)
+        boosted_rate = max(boosted_rate, 0.0)
+        predicted = rate + boosted_rate * x
+        excess = y / predicted - 1.0
+        spread = 1.4826 * np.median(np.abs(excess[ordinary] - np.median(excess[ordinary])))
+        flagged = excess > max(SRB_SPIKE_MIN_EXCESS, SRB_SPIKE_SPREADS * spread)
+        # Never flag so many days that there is nothing left to fit
+        next_ordinary = ~flagged if (~flagged).sum() >= 2 else np.ones(len(y), dtype=bool)
+        if np.array_equal(next_ordinary, ordinary):
+            break
+        ordinary = next_ordinary
+    if not separable:
+        held.append("boost_realization" if has_boost_column else "rate_per_parcel")
+
+    realization = boosted_rate / rate
+    # SRB time replaces unboosted time, so each SRB second adds (SRB multiplier - 1) x r
+    srb_seconds = np.where(~ordinary, (y - predicted) * constants.SECONDS_PER_DAY /
+                           (rate * (constants.SUPER_RENT_BOOST_MULTIPLIER - 1)), 0.0)
+    span_days = int((days.max() - days.min()).astype(np.int64)) + 1
+    srb_hours_per_month = srb_seconds.sum() / constants.SECONDS_PER_HOUR / (span_days / constants.AVG_DAYS_PER_MONTH)
+    residuals = (y - predicted)[ordinary] / predicted[ordinary]
+
+    return {
+        "srb_hours_per_month": float(srb_hours_per_month),
+        "boost_hours": float(np.clip(realization * exposure_hours.mean(), 0.0, 24.0)),
+        "boost_realization": float(realization) if has_boost_column else None,
+        "rate_per_parcel": float(rate),
+        "parcel_probabilities": mix_for_rate(rate),
+        "days": int(len(y)),
+        "srb_days": int((~ordinary).sum()),
+        "residual_rms": float(np.sqrt(np.mean(residuals ** 2))),
+        "held": held,
+    }
+
+
+def describe_profile(profile):
+    """Multi-line summary of a fitted profile for dialogs and the command line."""
+    mix = ", ".join(f"{p_type.capitalize()} {share * 100:.1f}%" for p_type, share in profile["parcel_probabilities"].items())
+    lines = [
+        f"Fitted over {profile['days']:,} days ({profile['srb_days']:,} with SRB), residual {profile['residual_rms'] * 100:.2f}%",
+        f"Effective SRB hours per month: {profile['srb_hours_per_month']:.1f} (default {rate_profile.DEFAULT_PROFILE.srb_hours_per_month})",
+        f"Realized ad boost hours per day: {profile['boost_hours']:.2f}",
+    ]
+    if profile["boost_realization"] is not None:
+        lines.append(f"Share of logged boost hours realized: {profile['boost_realization'] * 100:.1f}%")
+    lines.append(f"Effective rate per parcel: ${profile['rate_per_parcel']:.4e}/s")
+    lines.append(f"Effective rarity mix: {mix}")
+    if profile["held"]:
+        lines.append(f"Not separable from this log, held at face value: {', '.join(profile['held'])}")
+    return "\n".join(lines)
@@ -151,4 +151,17 @@ PARCEL_PROBABILITIES = {
     "rare": 0.30,   # 30% probability for rare parcels
     "epic": 0.15,   # 15% probability for epic parcels
     "legendary": 0.05, # 5% probability for legendary parcels
-}
\ No newline at end of file
+}
+
+# Rate tables by the date they took effect, oldest first. When the game changes rates, add an
+# entry with its start date ("YYYY-MM-DD") and the tables as they are from then on; projections
+# across dates use the tables that were in force on each day. The first entry has no start date
+# and covers everything before the second one.
+RATE_EPOCHS = [
+    {
+        "start": None,
+        "parcel_rates": PARCEL_RATES_PER_SECOND,
+        "badge_tiers": BADGE_BOOST_TIERS,
+        "ad_boost_data": REGIONAL_AD_BOOST_DATA,
+    },
+]
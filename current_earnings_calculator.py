@@ -1,16 +1,75 @@
 # current_earnings_calculator.py
 
+import datetime
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
 
-import constants
+import numpy as np
+
 import utils
+import rate_epochs
+import earnings_model
+
+# Refresh rate of the live ticker; each frame is one multiply-add and one label update
+TICKER_FPS = 10
+
+# Live ticker boost states, mapped to the rate each one earns at
+TICKER_STATES = {
+    "Unboosted": "unboosted",
+    "Ad Boosted": "ad_boosted",
+    "Super Rent Boost": "srb",
+    "Day Average": "day_average",
+}
+
+# Uncertainty bands: distribution choices, and a fixed seed so the bands do not jitter between updates
+DISTRIBUTIONS = {"Normal": "normal", "Uniform": "uniform", "Fixed": "fixed"}
+MONTE_CARLO_SEED = 0
+# The bands take about 0.1 s, so they are recomputed once typing pauses for this long
+BANDS_DELAY_MS = 300
 
 class CurrentEarningsCalculator:
     def __init__(self, parent_frame, get_user_inputs_callback):
         self.parent_frame = parent_frame
         self.get_user_inputs_callback = get_user_inputs_callback
 
+        # Per-second rates from the last update_display, reused by the live ticker,
+        # the matching projection across rate epochs for date ranges, and the inputs behind
+        # both for the calendar month table
+        self._rates = None
+        self._projection = None
+        self._calendar_inputs = None
+
+        # Live ticker state: earnings accrued up to _segment_start, plus the current rate since then
+        self.ticker_state_var = tk.StringVar(value="Day Average")
+        self.ticker_start_var = tk.StringVar(value="")
+        self._ticker_job = None
+        self._ticker_accrued = 0.0
+        self._ticker_rate = 0.0
+        self._segment_start = 0.0
+        self._ticker_since = ""
+
+        # Pending band recomputation (an 'after' id) and the inputs it will use
+        self._bands_job = None
+        self._bands_inputs = None
+
+        # Date range for earnings across rate epochs; defaults to the next 30 days
+        today = datetime.date.today()
+        self.range_start_var = tk.StringVar(value=today.isoformat())
+        self.range_end_var = tk.StringVar(value=(today + datetime.timedelta(days=30)).isoformat())
+        # Dated SRB events for the calendar months; blank gives every month the profile's SRB hours
+        self.srb_events_var = tk.StringVar(value="")
+
+        # Monte Carlo bands for month/year: daily boost hours and monthly SRB hours as distributions.
+        # A blank boost mean uses the Boost Hours input, a blank SRB mean the profile's SRB hours.
+        self.uncertainty_enabled_var = tk.BooleanVar(value=False)
+        self.boost_distribution_var = tk.StringVar(value="Normal")
+        self.boost_param_a_var = tk.StringVar(value="")
+        self.boost_param_b_var = tk.StringVar(value="1")
+        self.srb_distribution_var = tk.StringVar(value="Normal")
+        self.srb_param_a_var = tk.StringVar(value="")
+        self.srb_param_b_var = tk.StringVar(value="16")
+
         self._create_widgets()
 
     def _create_widgets(self):
@@ -48,158 +107,253 @@ class CurrentEarningsCalculator:
         self.parent_frame.grid_columnconfigure(1, weight=1, minsize=180) # Base Earnings column, expands, increased minsize
         self.parent_frame.grid_columnconfigure(2, weight=1, minsize=180) # With Ad Boost column, expands, increased minsize
 
+        # P10 / P50 / P90 of the boosted month and year, next to their point estimates
+        ttk.Label(self.parent_frame, text="Boosted P10 / P50 / P90", font=header_font, anchor="e").grid(row=row - 1, column=3, sticky="e", pady=2, padx=5)
+        self.band_labels = {}
+        for tf in ("month", "year"):
+            self.band_labels[tf] = ttk.Label(self.parent_frame, text="", anchor="e", font=value_font)
+            self.band_labels[tf].grid(row=row + timeframes.index(tf.capitalize()), column=3, sticky="ew", pady=1, padx=(5, 5))
+        row += len(timeframes)
+
+        # --- Projection Uncertainty ---
+        band_frame = ttk.LabelFrame(self.parent_frame, text="Projection Uncertainty (Monte Carlo)")
+        band_frame.grid(row=row, column=0, columnspan=4, sticky="ew", padx=5, pady=(15, 5))
+        ttk.Checkbutton(band_frame, text=f"Show P10 / P50 / P90 over {earnings_model.MONTE_CARLO_SAMPLES:,} simulated months",
+                        variable=self.uncertainty_enabled_var, command=self._update_bands).grid(row=0, column=0, columnspan=5, sticky="w", padx=5, pady=2)
+        for band_row, (text, distribution_var, a_var, b_var) in enumerate([
+                ("Boost Hours per Day:", self.boost_distribution_var, self.boost_param_a_var, self.boost_param_b_var),
+                ("SRB Hours per Month:", self.srb_distribution_var, self.srb_param_a_var, self.srb_param_b_var)], start=1):
+            ttk.Label(band_frame, text=text).grid(row=band_row, column=0, sticky="w", padx=5, pady=2)
+            distribution_combo = ttk.Combobox(band_frame, textvariable=distribution_var, values=list(DISTRIBUTIONS),
+                                              width=8, state="readonly")
+            distribution_combo.grid(row=band_row, column=1, sticky="w", padx=5, pady=2)
+            distribution_combo.bind("<<ComboboxSelected>>", lambda event: self._update_bands())
+            for column, var in ((2, a_var), (3, b_var)):
+                entry = ttk.Entry(band_frame, width=8, textvariable=var)
+                entry.grid(row=band_row, column=column, sticky="w", padx=5, pady=2)
+                entry.bind("<KeyRelease>", lambda event: self._update_bands())
+        ttk.Label(band_frame, text="Normal: mean, SD   Uniform: low, high   Fixed: value").grid(row=3, column=0, columnspan=5, sticky="w", padx=5, pady=(1, 5))
+        row += 1
+
+        # --- Live Ticker ---
+        ticker_frame = ttk.LabelFrame(self.parent_frame, text="Live Earnings Ticker")
+        ticker_frame.grid(row=row, column=0, columnspan=4, sticky="ew", padx=5, pady=(15, 5))
+        ttk.Label(ticker_frame, text="Start (HH:MM today, blank = now):").grid(row=0, column=0, sticky="w", padx=5, pady=2)
+        ttk.Entry(ticker_frame, width=8, textvariable=self.ticker_start_var).grid(row=0, column=1, sticky="w", padx=5, pady=2)
+        ttk.Label(ticker_frame, text="Boost State:").grid(row=0, column=2, sticky="w", padx=5, pady=2)
+        state_combo = ttk.Combobox(ticker_frame, textvariable=self.ticker_state_var, values=list(TICKER_STATES),
+                                   width=16, state="readonly")
+        state_combo.grid(row=0, column=3, sticky="w", padx=5, pady=2)
+        state_combo.bind("<<ComboboxSelected>>", lambda event: self._update_ticker_rate())
+        self.ticker_button = ttk.Button(ticker_frame, text="Start", command=self._toggle_ticker)
+        self.ticker_button.grid(row=0, column=4, padx=5, pady=2)
+
+        self.ticker_rate_label = ttk.Label(ticker_frame, text="Not running.", font=value_font)
+        self.ticker_rate_label.grid(row=1, column=0, columnspan=5, sticky="w", padx=5, pady=1)
+        self.ticker_label = ttk.Label(ticker_frame, text="$0.0000000000", font=("Courier", 16, "bold"))
+        self.ticker_label.grid(row=2, column=0, columnspan=5, sticky="w", padx=5, pady=(1, 5))
+        row += 1
+
+        # --- Earnings Between Dates (each day at the rate tables in force on it) ---
+        range_frame = ttk.LabelFrame(self.parent_frame, text="Earnings Between Dates")
+        range_frame.grid(row=row, column=0, columnspan=4, sticky="ew", padx=5, pady=(5, 5))
+        ttk.Label(range_frame, text="From (YYYY-MM-DD):").grid(row=0, column=0, sticky="w", padx=5, pady=2)
+        from_entry = ttk.Entry(range_frame, width=12, textvariable=self.range_start_var)
+        from_entry.grid(row=0, column=1, sticky="w", padx=5, pady=2)
+        ttk.Label(range_frame, text="To (excluded):").grid(row=0, column=2, sticky="w", padx=5, pady=2)
+        to_entry = ttk.Entry(range_frame, width=12, textvariable=self.range_end_var)
+        to_entry.grid(row=0, column=3, sticky="w", padx=5, pady=2)
+        for entry in (from_entry, to_entry):
+            entry.bind("<KeyRelease>", lambda event: self._update_date_range())
+        self.range_base_label = ttk.Label(range_frame, text="Base: N/A", font=value_font)
+        self.range_base_label.grid(row=1, column=0, columnspan=2, sticky="w", padx=5, pady=1)
+        self.range_boosted_label = ttk.Label(range_frame, text="With Ad Boost: N/A", font=value_font)
+        self.range_boosted_label.grid(row=1, column=2, columnspan=2, sticky="w", padx=5, pady=(1, 5))
+
+        # The same range split into real calendar months, with SRB hours in the months they land in
+        ttk.Label(range_frame, text="SRB Events (YYYY-MM-DD:hours, ...):").grid(row=2, column=0, sticky="w", padx=5, pady=2)
+        srb_events_entry = ttk.Entry(range_frame, width=40, textvariable=self.srb_events_var)
+        srb_events_entry.grid(row=2, column=1, columnspan=3, sticky="w", padx=5, pady=2)
+        srb_events_entry.bind("<KeyRelease>", lambda event: self._update_date_range())
+        month_columns = ("month", "days", "base", "boosted")
+        self.calendar_tree = ttk.Treeview(range_frame, columns=month_columns, show="headings", height=6)
+        for column, text, width in [("month", "Calendar Month", 110), ("days", "Days", 60),
+                                    ("base", "Base Earnings", 150), ("boosted", "With Ad Boost", 150)]:
+            self.calendar_tree.heading(column, text=text)
+            self.calendar_tree.column(column, width=width, anchor="w" if column == "month" else "e")
+        self.calendar_tree.grid(row=3, column=0, columnspan=4, sticky="ew", padx=5, pady=(2, 5))
+
     def update_display(self):
         inputs = self.get_user_inputs_callback()
         if inputs is None:
             self._clear_labels()
             return
 
-        parcels = inputs["parcels"]
-        total_parcels = inputs["total_parcels"]
-        boost_hours = inputs["boost_hours"]
-        badge_count = inputs["badge_count"]
-        srb_boost_enabled = inputs["srb_boost_enabled"]
-        fictive_badge_enabled = inputs["fictive_badge_boost_enabled"]
-        fictive_badge_percent = inputs["fictive_badge_boost_percent"]
-        selected_region = inputs["selected_region"]
-
-        # --- Base Earnings Calculation (Raw) ---
-        raw_base_earnings_per_second = utils.calculate_base_earnings_per_second(parcels)
-
-        # --- Earnings Per Second AFTER Permanent Badge Boost (Base for 'With Ad Boost' calculations) ---
-        badge_multiplier = utils.get_passport_boost_multiplier(badge_count)
-        if fictive_badge_enabled:
-            # Fictive percentage should be treated as a decimal (e.g., 0.25 for 25%)
-            badge_multiplier = 1.0 + (fictive_badge_percent / 100.0)
-        
-        earnings_per_second_after_badges = raw_base_earnings_per_second * badge_multiplier
-
-        # --- Determine the Instantaneous Ad Boost Multiplier ---
-        effective_ad_multiplier = 1.0 # Default to 1x if no ad boost or no parcels
-        if total_parcels > 0: # Only get a relevant multiplier if parcels exist
-            if srb_boost_enabled:
-                effective_ad_multiplier = constants.SUPER_RENT_BOOST_MULTIPLIER
-            else:
-                effective_ad_multiplier = utils.get_ad_boost_multiplier(total_parcels, selected_region)
-
-        # --- Calculate Average Daily Earnings for "With Ad Boost" Column (Short Timeframes) ---
-        final_boosted_earnings_per_second = earnings_per_second_after_badges # Default if no boost_hours
-
-        if boost_hours > 0:
-            # Rate during boosted hours
-            rate_during_ad_boosted_time = earnings_per_second_after_badges * effective_ad_multiplier
-            
-            # Calculate weighted average based on hours in a 24-hour day
-            total_seconds_in_day = constants.SECONDS_PER_DAY
-            boosted_seconds = boost_hours * constants.SECONDS_PER_HOUR
-            unboosted_seconds = total_seconds_in_day - boosted_seconds
-
-            # Ensure no negative seconds if boost_hours somehow exceeds 24
-            if unboosted_seconds < 0:
-                unboosted_seconds = 0
-                boosted_seconds = total_seconds_in_day # Cap boosted seconds at a full day
-
-            final_boosted_earnings_per_second = (rate_during_ad_boosted_time * boosted_seconds + \
-                                                earnings_per_second_after_badges * unboosted_seconds) / total_seconds_in_day
-        
-        # --- Update Labels for Short Timeframes (Second, Minute, Hour, Day, Week) ---
-        timeframes_for_direct_calc = ["second", "minute", "hour", "day", "week"]
-        for tf in timeframes_for_direct_calc:
-            # "Base Earnings" column shows earnings with only permanent badge boost
-            self.earnings_output_labels[f"{tf}_base"].config(
-                text=f"${utils.convert_seconds_to_timeframe(earnings_per_second_after_badges, tf):.10f}"
-            )
-            # "With Ad Boost" column shows the time-averaged earnings (including hourly boost)
-            self.earnings_output_labels[f"{tf}_boosted"].config(
-                text=f"${utils.convert_seconds_to_timeframe(final_boosted_earnings_per_second, tf):.10f}"
-            )
-
-        # --- Monthly and Yearly Calculations for "With Ad Boost" Column ---
-        # These calculations factor in both user-defined boost_hours and potential global SRB events (if not forced by user)
-
-        # Define the rates based on the earnings after permanent badge boost
-        rate_unboosted_time_actual = earnings_per_second_after_badges
-        rate_normal_ad_boosted_time_actual = earnings_per_second_after_badges * effective_ad_multiplier # Use the determined multiplier
-        rate_srb_boosted_time_actual = earnings_per_second_after_badges * constants.SUPER_RENT_BOOST_MULTIPLIER
-
-        monthly_ad_boosted_earnings = 0
-        yearly_ad_boosted_earnings = 0
-
-        if srb_boost_enabled: # User has checked "Force Super Rent Boost (50x)"
-            # If forced, all 'boosted' time based on user input is at 50x. Ignore global SRB constants.
-            total_boosted_seconds_daily = boost_hours * constants.SECONDS_PER_HOUR
-            total_unboosted_seconds_daily = constants.SECONDS_PER_DAY - total_boosted_seconds_daily
-
-            # Ensure no negative seconds if boost_hours > 24
-            if total_unboosted_seconds_daily < 0:
-                total_unboosted_seconds_daily = 0
-                total_boosted_seconds_daily = constants.SECONDS_PER_DAY
-
-            # Calculate monthly/yearly based purely on user's forced 50x hours
-            monthly_ad_boosted_earnings = (rate_srb_boosted_time_actual * total_boosted_seconds_daily * constants.AVG_DAYS_PER_MONTH) + \
-                                        (rate_unboosted_time_actual * total_unboosted_seconds_daily * constants.AVG_DAYS_PER_MONTH)
-            
-            yearly_ad_boosted_earnings = (rate_srb_boosted_time_actual * total_boosted_seconds_daily * constants.AVG_DAYS_PER_YEAR) + \
-                                        (rate_unboosted_time_actual * total_unboosted_seconds_daily * constants.AVG_DAYS_PER_YEAR)
-        elif boost_hours == 0: # FIX: If no ad boost hours AND not forcing SRB, then show base earnings (after badges)
-            monthly_ad_boosted_earnings = utils.convert_seconds_to_timeframe(earnings_per_second_after_badges, 'month')
-            yearly_ad_boosted_earnings = utils.convert_seconds_to_timeframe(earnings_per_second_after_badges, 'year')
-        else: # User has NOT checked "Force Super Rent Boost (50x)" and has boost_hours > 0
-            # Account for user's normal daily ad boost AND global SRB events
-            user_boosted_seconds_daily = boost_hours * constants.SECONDS_PER_HOUR
-            
-            # Monthly Calculation
-            total_monthly_seconds = constants.AVG_DAYS_PER_MONTH * constants.SECONDS_PER_DAY
-            srb_seconds_monthly = constants.SRB_HOURS_PER_MONTH * constants.SECONDS_PER_HOUR
-
-            # Calculate normal boosted and unboosted time for the month
-            # This assumes SRB time takes precedence, then user's boost, then unboosted
-            
-            # Total seconds from user's daily boost over the month
-            monthly_user_boosted_seconds = user_boosted_seconds_daily * constants.AVG_DAYS_PER_MONTH
-            
-            # Time remaining after accounting for fixed SRB hours
-            remaining_seconds_monthly = total_monthly_seconds - srb_seconds_monthly
-            
-            # Normal boosted time is the lesser of user's total boosted time or remaining time
-            normal_boosted_seconds_monthly_capped = min(monthly_user_boosted_seconds, remaining_seconds_monthly)
-            
-            unboosted_seconds_monthly = total_monthly_seconds - srb_seconds_monthly - normal_boosted_seconds_monthly_capped
-            if unboosted_seconds_monthly < 0: unboosted_seconds_monthly = 0 # Defensive check
-
-            monthly_ad_boosted_earnings = \
-                (rate_unboosted_time_actual * unboosted_seconds_monthly) + \
-                (rate_normal_ad_boosted_time_actual * normal_boosted_seconds_monthly_capped) + \
-                (rate_srb_boosted_time_actual * srb_seconds_monthly)
-
-            # Yearly Calculation (similar logic)
-            total_yearly_seconds = constants.AVG_DAYS_PER_YEAR * constants.SECONDS_PER_DAY
-            srb_seconds_yearly = constants.SRB_HOURS_PER_YEAR * constants.SECONDS_PER_HOUR
-
-            # Total seconds from user's daily boost over the year
-            yearly_user_boosted_seconds = user_boosted_seconds_daily * constants.AVG_DAYS_PER_YEAR
-
-            # Time remaining after accounting for fixed SRB hours
-            remaining_seconds_yearly = total_yearly_seconds - srb_seconds_yearly
-            
-            # Normal boosted time is the lesser of user's total boosted time or remaining time
-            normal_boosted_seconds_yearly_capped = min(yearly_user_boosted_seconds, remaining_seconds_yearly)
-            
-            unboosted_seconds_yearly = total_yearly_seconds - srb_seconds_yearly - normal_boosted_seconds_yearly_capped
-            if unboosted_seconds_yearly < 0: unboosted_seconds_yearly = 0 # Defensive check
-
-            yearly_ad_boosted_earnings = \
-                (rate_unboosted_time_actual * unboosted_seconds_yearly) + \
-                (rate_normal_ad_boosted_time_actual * normal_boosted_seconds_yearly_capped) + \
-                (rate_srb_boosted_time_actual * srb_seconds_yearly)
-
-        # --- Update Monthly and Yearly Labels ---
-        self.earnings_output_labels["month_base"].config(text=f"${utils.convert_seconds_to_timeframe(earnings_per_second_after_badges, 'month'):.8f}")
-        self.earnings_output_labels["month_boosted"].config(text=f"${monthly_ad_boosted_earnings:.8f}")
+        # --- Badge Multiplier (Base for 'With Ad Boost' calculations) ---
+        badge_multiplier = earnings_model.badge_multiplier(inputs)
+        srb_hours_per_month = inputs["rate_profile"].srb_hours_per_month
+
+        earnings, self._rates = utils.calculate_timeframe_earnings(
+            inputs["parcels"], badge_multiplier, inputs["boost_hours"],
+            inputs["srb_boost_enabled"], inputs["selected_region"], srb_hours_per_month=srb_hours_per_month)
+        self._calendar_inputs = inputs
+        self._projection = rate_epochs.EarningsProjection(
+            inputs["parcels"], inputs["badge_count"], inputs["boost_hours"], inputs["srb_boost_enabled"],
+            inputs["selected_region"], fictive_badge_multiplier=badge_multiplier if inputs["fictive_badge_boost_enabled"] else None,
+            srb_hours_per_month=srb_hours_per_month)
+
+        # Short timeframes show 10 decimals, months and years 8
+        for tf, (base, boosted) in earnings.items():
+            decimals = 8 if tf in ("month", "year") else 10
+            self.earnings_output_labels[f"{tf}_base"].config(text=f"${base:.{decimals}f}")
+            self.earnings_output_labels[f"{tf}_boosted"].config(text=f"${boosted:.{decimals}f}")
+
+        if self._ticker_job is not None:
+            self._update_ticker_rate()
+        self._update_date_range()
+        self._update_bands(inputs)
+
+    def _read_distribution(self, distribution_var, a_var, b_var, default_a):
+        """Returns a distribution tuple for earnings_model.sample_distribution; raises ValueError for invalid input."""
+        a_text = a_var.get().strip()
+        a = float(a_text) if a_text else default_a
+        b = float(b_var.get() or 0)
+        if DISTRIBUTIONS[distribution_var.get()] == "normal" and b < 0:
+            raise ValueError("The SD cannot be negative.")
+        return DISTRIBUTIONS[distribution_var.get()], a, b
+
+    def _update_bands(self, inputs=None):
+        """Schedules the bands BANDS_DELAY_MS from now, replacing any pending run, so keystrokes do not queue up simulations."""
+        if self._bands_job is not None:
+            self.parent_frame.after_cancel(self._bands_job)
+            self._bands_job = None
+        if not self.uncertainty_enabled_var.get():
+            self._compute_bands()
+            return
+        self._bands_inputs = inputs
+        self._bands_job = self.parent_frame.after(BANDS_DELAY_MS, self._run_scheduled_bands)
+
+    def _run_scheduled_bands(self):
+        self._bands_job = None
+        self._compute_bands(self._bands_inputs)
+
+    def _compute_bands(self, inputs=None):
+        """P10/P50/P90 of the boosted month and year; about 0.1 s, so it only runs when enabled."""
+        if self.uncertainty_enabled_var.get() and inputs is None:
+            inputs = self.get_user_inputs_callback()
+        if not self.uncertainty_enabled_var.get() or inputs is None or self._rates is None:
+            for label in self.band_labels.values():
+                label.config(text="")
+            return
+        try:
+            boost_distribution = self._read_distribution(self.boost_distribution_var, self.boost_param_a_var,
+                                                         self.boost_param_b_var, inputs["boost_hours"])
+            srb_distribution = self._read_distribution(self.srb_distribution_var, self.srb_param_a_var,
+                                                       self.srb_param_b_var, inputs["rate_profile"].srb_hours_per_month)
+        except (ValueError, KeyError):
+            for label in self.band_labels.values():
+                label.config(text="Invalid distribution")
+            return
 
-        self.earnings_output_labels["year_base"].config(text=f"${utils.convert_seconds_to_timeframe(earnings_per_second_after_badges, 'year'):.8f}")
-        self.earnings_output_labels["year_boosted"].config(text=f"${yearly_ad_boosted_earnings:.8f}")
+        ad_multiplier = utils.get_ad_boost_multiplier(inputs["total_parcels"], inputs["selected_region"]) if inputs["total_parcels"] > 0 else 1.0
+        month_factors, year_factors = earnings_model.monte_carlo_boosted_factors(
+            ad_multiplier, boost_distribution, srb_distribution, inputs["srb_boost_enabled"], seed=MONTE_CARLO_SEED)
+        rent_per_second = self._rates["unboosted"]
+        for tf, factors in (("month", month_factors), ("year", year_factors)):
+            p10, p50, p90 = np.percentile(factors, earnings_model.MONTE_CARLO_PERCENTILES) * rent_per_second
+            self.band_labels[tf].config(text=f"${p10:.6f} / ${p50:.6f} / ${p90:.6f}")
+
+    def _update_date_range(self):
+        """Totals for the date range; O(log epochs) per query, so it follows every keystroke."""
+        if self._projection is None:
+            return
+        try:
+            start_date = rate_epochs.parse_date(self.range_start_var.get())
+            end_date = rate_epochs.parse_date(self.range_end_var.get())
+        except ValueError:
+            self.range_base_label.config(text="Base: enter dates as YYYY-MM-DD")
+            self.range_boosted_label.config(text="With Ad Boost: N/A")
+            return
+        days = (end_date - start_date).days
+        self.range_base_label.config(text=f"Base ({days:,} days): ${self._projection.earnings_between(start_date, end_date, boosted=False):.8f}")
+        self.range_boosted_label.config(text=f"With Ad Boost: ${self._projection.earnings_between(start_date, end_date):.8f}")
+        self._update_calendar_months(start_date, end_date)
+
+    def _update_calendar_months(self, start_date, end_date):
+        """Fills the calendar month table; one vectorized call, so it follows every keystroke."""
+        self.calendar_tree.delete(*self.calendar_tree.get_children())
+        inputs = self._calendar_inputs
+        if inputs is None or end_date <= start_date:
+            return
+        try:
+            srb_events = earnings_model.parse_srb_events(self.srb_events_var.get()) if self.srb_events_var.get().strip() else None
+        except ValueError as e:
+            self.calendar_tree.insert("", "end", values=(str(e), "", "", ""))
+            return
+        total_parcels = inputs["total_parcels"]
+        ad_multiplier = utils.get_ad_boost_multiplier(total_parcels, inputs["selected_region"]) if total_parcels > 0 else 1.0
+        months, days, base, boosted = earnings_model.calendar_month_earnings(
+            self._rates["unboosted"], ad_multiplier, inputs["boost_hours"], inputs["srb_boost_enabled"],
+            start_date, end_date, srb_events, inputs["rate_profile"].srb_hours_per_month)
+        for month, month_days, month_base, month_boosted in zip(months.astype(str), days, base, boosted):
+            self.calendar_tree.insert("", "end", values=(month, month_days, f"${month_base:.8f}", f"${month_boosted:.8f}"))
+        self.calendar_tree.insert("", "end", values=("Total", days.sum(), f"${base.sum():.8f}", f"${boosted.sum():.8f}"))
+
+    def _toggle_ticker(self):
+        if self._ticker_job is not None:
+            self.parent_frame.after_cancel(self._ticker_job)
+            self._ticker_job = None
+            self.ticker_button.config(text="Start")
+            self.ticker_rate_label.config(text="Stopped.")
+            return
+        if self._rates is None:
+            return
 
+        now = time.time()
+        start_text = self.ticker_start_var.get().strip()
+        if start_text:
+            try:
+                start_time = datetime.datetime.strptime(start_text, "%H:%M").time()
+            except ValueError:
+                messagebox.showerror("Input Error", "Enter the ticker start as HH:MM (24h), or leave it blank to start now.")
+                return
+            start_moment = datetime.datetime.combine(datetime.date.today(), start_time).timestamp()
+            if start_moment > now:
+                messagebox.showerror("Input Error", "The ticker start must not be in the future.")
+                return
+        else:
+            start_moment = now
+
+        # Time before pressing Start is credited at the chosen state's rate; from then on the
+        # monotonic clock is used so a system clock change cannot make earnings jump
+        self._ticker_rate = self._rates[TICKER_STATES[self.ticker_state_var.get()]]
+        self._ticker_accrued = self._ticker_rate * (now - start_moment)
+        self._segment_start = time.monotonic()
+        self._show_ticker_rate(start_moment)
+        self.ticker_button.config(text="Stop")
+        self._tick()
+
+    def _update_ticker_rate(self):
+        """Folds the earnings so far into the total, then continues at the rate of the current state and inputs."""
+        if self._ticker_job is None or self._rates is None:
+            return
+        now = time.monotonic()
+        self._ticker_accrued += self._ticker_rate * (now - self._segment_start)
+        self._segment_start = now
+        self._ticker_rate = self._rates[TICKER_STATES[self.ticker_state_var.get()]]
+        self._show_ticker_rate()
+
+    def _show_ticker_rate(self, start_moment=None):
+        if start_moment is not None:
+            self._ticker_since = datetime.datetime.fromtimestamp(start_moment).strftime("%H:%M:%S")
+        self.ticker_rate_label.config(
+            text=f"{self.ticker_state_var.get()} at ${self._ticker_rate:.10f}/s since {self._ticker_since}")
+
+    def _tick(self):
+        # Deliberately nothing but a multiply-add and one label update per frame
+        total = self._ticker_accrued + self._ticker_rate * (time.monotonic() - self._segment_start)
+        self.ticker_label.config(text=f"${total:.10f}")
+        self._ticker_job = self.parent_frame.after(1000 // TICKER_FPS, self._tick)
 
     def get_export_data(self):
         """Returns the current earnings data in a dictionary format for export."""
@@ -214,4 +368,20 @@ class CurrentEarningsCalculator:
 
     def _clear_labels(self):
         for label in self.earnings_output_labels.values():
-            label.config(text="$0.0000000000")
\ No newline at end of file
+            label.config(text="$0.0000000000")
+        for label in self.band_labels.values():
+            label.config(text="")
+        self.calendar_tree.delete(*self.calendar_tree.get_children())
+
+    def get_session_variables(self):
+        """Returns the tab's input variables, keyed by name, for session save/restore."""
+        return {
+            "uncertainty_enabled": self.uncertainty_enabled_var,
+            "boost_distribution": self.boost_distribution_var,
+            "boost_param_a": self.boost_param_a_var,
+            "boost_param_b": self.boost_param_b_var,
+            "srb_distribution": self.srb_distribution_var,
+            "srb_param_a": self.srb_param_a_var,
+            "srb_param_b": self.srb_param_b_var,
+            "srb_events": self.srb_events_var,
+        }
\ No newline at end of file
@@ -1,16 +1,21 @@
 # custom_tier_calculator.py
 
 import tkinter as tk
-from tkinter import ttk, messagebox
-from widgets import IntegerEntry
+from tkinter import ttk, messagebox, filedialog
+from widgets import IntegerEntry, EarningsChart, HeatmapChart
+
+import numpy as np
 
 import constants
 import utils
+import earnings_model
+import exporters
 
 class CustomTierCalculator:
-    def __init__(self, parent_frame, get_user_inputs_callback):
+    def __init__(self, parent_frame, get_user_inputs_callback, job_runner):
         self.parent_frame = parent_frame
         self.get_user_inputs_callback = get_user_inputs_callback
+        self.job_runner = job_runner
 
         # Tkinter variables for inputs and outputs specific to this tab
         self.custom_parcel_count_var = tk.StringVar(value="0") # Input for custom parcel count
@@ -18,6 +23,13 @@ class CustomTierCalculator:
         self.custom_base_earnings_label = None
         self.custom_boosted_earnings_label = None
 
+        # Rarity mix (in percent) of the custom parcel count; 100% common unless the user changes it
+        self.mix_vars = {p_type: tk.StringVar(value="100" if p_type == "common" else "0")
+                         for p_type in constants.PARCEL_RATES_PER_SECOND.keys()}
+        self.range_from_var = tk.StringVar(value="0")
+        self.range_to_var = tk.StringVar(value="10000")
+        self._sweep_inputs = None
+
         self._create_widgets()
 
     def _create_widgets(self):
@@ -36,6 +48,13 @@ class CustomTierCalculator:
         # self.custom_parcel_entry.bind("<FocusOut>", self._on_input_change)   # Update on losing focus
         # self.custom_parcel_entry.bind("<Return>", self._on_input_change)     # Update on Enter key
 
+        ttk.Label(input_frame, text="Rarity Mix (%):").grid(row=1, column=0, sticky="w", padx=5, pady=5)
+        mix_frame = ttk.Frame(input_frame)
+        mix_frame.grid(row=1, column=1, sticky="w", padx=5, pady=5)
+        for p_type, mix_var in self.mix_vars.items():
+            ttk.Label(mix_frame, text=f"{p_type.capitalize()}:").pack(side="left", padx=(0, 2))
+            IntegerEntry(mix_frame, width=4, textvariable=mix_var).pack(side="left", padx=(0, 8))
+
         # Output Section
         output_frame = ttk.LabelFrame(self.parent_frame, text="Custom Tier Calculations")
         output_frame.pack(padx=10, pady=10, fill="x")
@@ -71,6 +90,35 @@ class CustomTierCalculator:
         output_frame.grid_columnconfigure(0, weight=0, minsize=180)
         output_frame.grid_columnconfigure(1, weight=1, minsize=150)
 
+        # Range Sweep Section
+        range_frame = ttk.LabelFrame(self.parent_frame, text="Parcel Count Range Sweep")
+        range_frame.pack(padx=10, pady=10, fill="both", expand=True)
+
+        range_input_frame = ttk.Frame(range_frame)
+        range_input_frame.pack(fill="x", padx=5, pady=5)
+        ttk.Label(range_input_frame, text="From:").pack(side="left", padx=(0, 2))
+        IntegerEntry(range_input_frame, width=10, textvariable=self.range_from_var).pack(side="left", padx=(0, 8))
+        ttk.Label(range_input_frame, text="To:").pack(side="left", padx=(0, 2))
+        IntegerEntry(range_input_frame, width=10, textvariable=self.range_to_var).pack(side="left", padx=(0, 8))
+        ttk.Button(range_input_frame, text="Plot Range", command=self._plot_range).pack(side="left", padx=5)
+        ttk.Button(range_input_frame, text="Export Sweep (Binary)", command=self._export_sweep_to_columnar).pack(side="left", padx=5)
+        ttk.Label(range_input_frame, text="(wheel: zoom, drag: pan, double-click: reset)").pack(side="left", padx=5)
+
+        self.range_chart = EarningsChart(range_frame, fetch_series=self._fetch_sweep,
+                                         colors={"Base Monthly": "steelblue", "Boosted Monthly": "darkorange"})
+        self.range_chart.pack(fill="both", expand=True, padx=5, pady=5)
+
+        # Heatmap of the same range against every boost hours setting
+        heatmap_frame = ttk.LabelFrame(self.parent_frame, text="Boosted Monthly Earnings: Parcel Count x Ad Boost Hours/Day")
+        heatmap_frame.pack(padx=10, pady=10, fill="both", expand=True)
+        heatmap_input_frame = ttk.Frame(heatmap_frame)
+        heatmap_input_frame.pack(fill="x", padx=5, pady=5)
+        ttk.Button(heatmap_input_frame, text="Plot Heatmap", command=self._plot_heatmap).pack(side="left", padx=5)
+        ttk.Label(heatmap_input_frame, text="(uses the From/To range above; dashed lines mark where a tier starts, hover for values)").pack(side="left", padx=5)
+        self.heatmap = HeatmapChart(heatmap_frame, fetch_grid=self._fetch_heatmap_grid, describe_point=self._describe_heatmap_point,
+                                    fetch_markers=self._fetch_tier_starts, y_range=(0.0, 24.0), y_steps=49)
+        self.heatmap.pack(fill="both", expand=True, padx=5, pady=5)
+
     # def _on_input_change(self, event=None):
     #     """Called when the custom parcel count input changes."""
     #     self.update_display()
@@ -112,60 +160,150 @@ class CustomTierCalculator:
         # Let's use a simplified base rate calculation for the custom tier:
         # Assume common parcel rate for the custom count for base earnings calculation
         # This is a simplification; a real app might need parcel type distribution for custom tiers.
-        base_rate_per_common_parcel_per_second = constants.PARCEL_RATES_PER_SECOND['common']
-        estimated_base_earnings_per_second_custom_tier = base_rate_per_common_parcel_per_second * custom_parcel_count
-
-        # Apply user's current badge boost (from main app inputs) to the base rate
-        base_rate_with_badge_per_second = estimated_base_earnings_per_second_custom_tier * \
-                                          utils.get_passport_boost_multiplier(user_inputs["badge_count"])
-        if user_inputs["fictive_badge_boost_enabled"]:
-            base_rate_with_badge_per_second = estimated_base_earnings_per_second_custom_tier * (1.0 + user_inputs["fictive_badge_boost_percent"])
-
-
-        # Calculate Ad Boost Multiplier for the custom parcel count and selected region
-        custom_ad_boost_multiplier = utils.get_ad_boost_multiplier(custom_parcel_count, user_inputs["selected_region"])
-        
-        # Calculate the fully boosted rate per second at this custom tier
-        # This is the rate when ad boost is active at the custom tier.
-        fully_boosted_rate_per_second_custom_tier = base_rate_with_badge_per_second * custom_ad_boost_multiplier
-        
-        # If SRB is forced in main inputs, apply SRB multiplier instead
-        if user_inputs["srb_boost_enabled"]:
-            fully_boosted_rate_per_second_custom_tier = base_rate_with_badge_per_second * constants.SUPER_RENT_BOOST_MULTIPLIER
-
-        # Calculate estimated monthly earnings
-        # Base monthly earnings (unboosted, but with badge boost)
-        est_base_monthly_earnings = utils.convert_seconds_to_timeframe(base_rate_with_badge_per_second, 'month')
-
-        # Boosted monthly earnings (considering user's boost hours and SRB events)
-        # This part reuses the logic from CurrentEarningsCalculator for consistency
-        total_monthly_seconds = constants.AVG_DAYS_PER_MONTH * constants.SECONDS_PER_DAY
-        srb_seconds_monthly = constants.SRB_HOURS_PER_MONTH * constants.SECONDS_PER_HOUR
-        
-        normal_ad_boost_seconds_monthly = min(user_inputs["boost_hours"] * constants.SECONDS_PER_HOUR * constants.AVG_DAYS_PER_MONTH,
-                                              total_monthly_seconds - srb_seconds_monthly)
-        normal_ad_boost_seconds_monthly = max(0, normal_ad_boost_seconds_monthly)
-
-        unboosted_seconds_monthly = max(0, total_monthly_seconds - srb_seconds_monthly - normal_ad_boost_seconds_monthly)
+        # The rarity mix inputs refine this: the default mix is 100% common.
+        base_rate_per_parcel_per_second = earnings_model.mix_rate_per_second(self._get_rarity_mix())
 
-        if user_inputs["srb_boost_enabled"]:
-            est_boosted_monthly_earnings = fully_boosted_rate_per_second_custom_tier * total_monthly_seconds
-        else:
-            est_boosted_monthly_earnings = \
-                (base_rate_with_badge_per_second * unboosted_seconds_monthly) + \
-                (fully_boosted_rate_per_second_custom_tier * normal_ad_boost_seconds_monthly) + \
-                (base_rate_with_badge_per_second * constants.SUPER_RENT_BOOST_MULTIPLIER * srb_seconds_monthly) # SRB time uses SRB rate
+        # Apply user's current badge boost (from main app inputs) and boost hours/SRB events
+        custom_ad_boost_multiplier, est_base_monthly_earnings, est_boosted_monthly_earnings = utils.calculate_custom_tier_monthly(
+            custom_parcel_count, base_rate_per_parcel_per_second, earnings_model.badge_multiplier(user_inputs),
+            user_inputs["boost_hours"], user_inputs["srb_boost_enabled"], user_inputs["selected_region"],
+            user_inputs["rate_profile"].srb_hours_per_month)
 
         # Update labels
         self.custom_ad_boost_multiplier_label.config(text=f"{custom_ad_boost_multiplier:.2f}x")
         self.custom_base_earnings_label.config(text=f"${est_base_monthly_earnings:.8f}")
         self.custom_boosted_earnings_label.config(text=f"${est_boosted_monthly_earnings:.8f}")
 
+        # Keep an open range sweep in step with the main inputs
+        if self.range_chart.visible_range is not None or self.heatmap.visible_range is not None:
+            self._sweep_inputs = user_inputs
+            self.range_chart.redraw()
+            self.heatmap.redraw()
+
+    def _get_rarity_mix(self):
+        """Returns the rarity mix percentages, treating empty entries as 0."""
+        return {p_type: int(mix_var.get()) if mix_var.get().strip() != "" else 0
+                for p_type, mix_var in self.mix_vars.items()}
+
+    def _plot_range(self):
+        """Sweeps the From/To parcel range and plots base and boosted monthly earnings."""
+        user_inputs = self.get_user_inputs_callback()
+        if user_inputs is None:
+            return
+        try:
+            range_from = int(self.range_from_var.get())
+            range_to = int(self.range_to_var.get())
+        except ValueError:
+            messagebox.showerror("Input Error", "The sweep range must be whole numbers.")
+            return
+        if range_to <= range_from:
+            messagebox.showerror("Input Error", "'To' must be greater than 'From' for a range sweep.")
+            return
+
+        self._sweep_inputs = user_inputs
+        self.range_chart.set_range(range_from, range_to)
+
+    def _plot_heatmap(self):
+        """Renders boosted monthly earnings over the From/To parcel range and 0-24 boost hours."""
+        user_inputs = self.get_user_inputs_callback()
+        if user_inputs is None:
+            return
+        try:
+            range_from = int(self.range_from_var.get())
+            range_to = int(self.range_to_var.get())
+        except ValueError:
+            messagebox.showerror("Input Error", "The sweep range must be whole numbers.")
+            return
+        if range_to <= range_from:
+            messagebox.showerror("Input Error", "'To' must be greater than 'From' for the heatmap.")
+            return
+
+        self._sweep_inputs = user_inputs
+        self.heatmap.set_range(range_from, range_to)
+
+    def _fetch_heatmap_grid(self, counts, boost_hours):
+        """Heatmap callback: the whole grid in one broadcast call (boost hours follow the heatmap, not the main input)."""
+        user_inputs = self._sweep_inputs
+        return earnings_model.custom_tier_grid(
+            user_inputs["selected_region"], counts, boost_hours,
+            earnings_model.mix_rate_per_second(self._get_rarity_mix()),
+            badge_mult=earnings_model.badge_multiplier(user_inputs), srb_forced=user_inputs["srb_boost_enabled"],
+            srb_hours_per_month=user_inputs["rate_profile"].srb_hours_per_month)
+
+    def _describe_heatmap_point(self, count, boost_hours):
+        """Exact values at the hovered parcel count and boost hours."""
+        monthly = self._fetch_heatmap_grid(np.array([count]), np.array([boost_hours]))[0, 0]
+        multiplier = earnings_model.ad_boost_multipliers(count, self._sweep_inputs["selected_region"])
+        return f"{count:,} parcels, {boost_hours:g} h/day: ${monthly:,.4f}/month ({float(multiplier):g}x)"
+
+    def _fetch_tier_starts(self, first, last):
+        table = earnings_model.compile_tier_table(self._sweep_inputs["selected_region"])
+        return table.mins[(table.mins > first) & (table.mins <= last)]
+
+    def _fetch_sweep(self, first, last, samples):
+        """Computes the sweep for the chart's visible window only, at about one count per pixel plus the tier boundaries."""
+        user_inputs = self._sweep_inputs
+        counts, base_monthly, boosted_monthly = earnings_model.custom_tier_sweep(
+            user_inputs["selected_region"], first, last,
+            earnings_model.mix_rate_per_second(self._get_rarity_mix()),
+            badge_mult=earnings_model.badge_multiplier(user_inputs),
+            boost_hours=user_inputs["boost_hours"], srb_forced=user_inputs["srb_boost_enabled"], samples=samples,
+            srb_hours_per_month=user_inputs["rate_profile"].srb_hours_per_month)
+        return counts, {"Base Monthly": base_monthly, "Boosted Monthly": boosted_monthly}
+
+    def _export_sweep_to_columnar(self):
+        """Exports the full plotted sweep range as columns of parcel count, base and boosted monthly earnings."""
+        if self._sweep_inputs is None or self.range_chart.full_range is None:
+            messagebox.showinfo("Nothing to Export", "Plot a range first, then export it.")
+            return
+        file_path = filedialog.asksaveasfilename(defaultextension=".npz", filetypes=exporters.COLUMNAR_FILETYPES,
+                                                title="Save Custom Tier Sweep (Columnar Binary)")
+        if not file_path:
+            return
+
+        # Everything that reads Tk variables is gathered here; the sweep and the write run on a worker thread
+        first, last = self.range_chart.full_range
+        sweep_metadata = {
+            "region": self._sweep_inputs["selected_region"],
+            "rarity_mix_percent": self._get_rarity_mix(),
+            "badge_multiplier": earnings_model.badge_multiplier(self._sweep_inputs),
+            "boost_hours": self._sweep_inputs["boost_hours"],
+            "srb_forced": self._sweep_inputs["srb_boost_enabled"],
+            "srb_hours_per_month": self._sweep_inputs["rate_profile"].srb_hours_per_month,
+        }
+
+        def export_sweep(job):
+            counts, base_monthly, boosted_monthly = earnings_model.custom_tier_sweep(
+                sweep_metadata["region"], first, last,
+                earnings_model.mix_rate_per_second(sweep_metadata["rarity_mix_percent"]),
+                badge_mult=sweep_metadata["badge_multiplier"],
+                boost_hours=sweep_metadata["boost_hours"], srb_forced=sweep_metadata["srb_forced"],
+                srb_hours_per_month=sweep_metadata["srb_hours_per_month"])
+            job.report_progress(None, "writing file")
+            columns = {"parcel_count": counts, "base_monthly": base_monthly, "boosted_monthly": boosted_monthly}
+            return exporters.write_columnar(file_path, columns, "custom_tier_sweep", sweep_metadata)
+
+        self.job_runner.run_in_thread(
+            "Sweep export", export_sweep,
+            on_done=lambda job, stats: messagebox.showinfo("Export Success", f"Data successfully exported to {file_path}\n"
+                                                           f"{stats.rows:,} rows in {stats.seconds:.2f} s"),
+            on_error=lambda job, e: messagebox.showerror("Export Error", f"Failed to export columnar data: {e}"))
+
     def _clear_labels(self):
         self.custom_ad_boost_multiplier_label.config(text="N/A")
         self.custom_base_earnings_label.config(text="$0.00")
         self.custom_boosted_earnings_label.config(text="$0.00")
 
+    def get_session_variables(self):
+        """Returns the tab's input variables, keyed by name, for session save/restore."""
+        variables = {
+            "custom_parcel_count": self.custom_parcel_count_var,
+            "range_from": self.range_from_var,
+            "range_to": self.range_to_var,
+        }
+        variables.update({f"mix_{p_type}": mix_var for p_type, mix_var in self.mix_vars.items()})
+        return variables
+
     def get_export_data(self):
         """Returns the custom tier data in a dictionary format for export."""
         data = {
@@ -0,0 +1,522 @@
+# earnings_model.py
+
+import functools
+from collections import namedtuple
+
+import numpy as np
+
+import constants
+import utils
+
+# A region's ad boost tiers compiled into parallel arrays, sorted by 'min'.
+TierTable = namedtuple("TierTable", ["mins", "maxs", "multipliers"])
+
+TIMEFRAMES = ["second", "minute", "hour", "day", "week", "month", "year"]
+
+# Monte Carlo projections: simulated months per run, and months sampled per batch
+MONTE_CARLO_SAMPLES = 100_000
+MONTE_CARLO_BATCH = 16_384
+MONTE_CARLO_PERCENTILES = (10, 50, 90)
+
+
+def compile_tiers(tiers):
+    """Compiles a list of tier dicts ('min', 'max', 'multiplier') into a read-only TierTable."""
+    tiers = sorted(tiers, key=lambda tier: tier['min'])
+    mins = np.array([tier['min'] for tier in tiers], dtype=np.int64)
+    maxs = np.array([tier['max'] for tier in tiers], dtype=np.int64)
+    multipliers = np.array([tier['multiplier'] for tier in tiers], dtype=np.float64)
+    for array in (mins, maxs, multipliers):
+        array.setflags(write=False)
+    return TierTable(mins, maxs, multipliers)
+
+
+@functools.lru_cache(maxsize=None)
+def compile_tier_table(region):
+    """
+    Compiles REGIONAL_AD_BOOST_DATA for a region into NumPy arrays.
+    Falls back to United States data, like utils.get_ad_boost_multiplier.
+    """
+    region_data = constants.REGIONAL_AD_BOOST_DATA.get(region)
+    if not region_data:
+        region_data = constants.REGIONAL_AD_BOOST_DATA.get("United States", [])
+    return compile_tiers(region_data)
+
+
+def dense_ad_multipliers(region, max_parcels):
+    """
+    Returns an array where index n holds the ad boost multiplier at n total parcels,
+    for n = 0..max_parcels. Built from a difference array over the compiled tier table,
+    so the cost is one cumulative sum instead of one tier lookup per parcel count.
+    Counts outside every tier get the same 1x default as get_ad_boost_multiplier.
+    """
+    table = compile_tier_table(region)
+    diff = np.zeros(max_parcels + 2, dtype=np.float64)
+    # Everything starts at the 1x default; each tier adds (multiplier - 1) over its range.
+    diff[0] = 1.0
+    lo = np.clip(table.mins, 0, max_parcels + 1)
+    hi = np.clip(table.maxs + 1, 0, max_parcels + 1)
+    np.add.at(diff, lo, table.multipliers - 1.0)
+    np.add.at(diff, hi, 1.0 - table.multipliers)
+    return np.cumsum(diff)[:max_parcels + 1]
+
+
+def ad_boost_multipliers(total_parcels, region):
+    """Vectorized get_ad_boost_multiplier for an array of parcel counts."""
+    return tier_table_multipliers(compile_tier_table(region), total_parcels)
+
+
+def tier_table_multipliers(table, total_parcels):
+    """ad_boost_multipliers against a given TierTable, e.g. a what-if copy from edit_tier_row."""
+    total_parcels = np.asarray(total_parcels)
+    idx = np.searchsorted(table.mins, total_parcels, side="right") - 1
+    safe_idx = np.clip(idx, 0, len(table.mins) - 1)
+    in_tier = (idx >= 0) & (total_parcels <= table.maxs[safe_idx])
+    return np.where(in_tier, table.multipliers[safe_idx], 1.0)
+
+
+def passport_boost_multipliers(badge_counts):
+    """Vectorized get_passport_boost_multiplier for an array of badge counts."""
+    tiers = sorted(constants.BADGE_BOOST_TIERS.items())
+    tier_counts = np.array([count for count, _ in tiers])
+    tier_boosts = np.array([boost for _, boost in tiers], dtype=np.float64)
+    badge_counts = np.asarray(badge_counts)
+    idx = np.searchsorted(tier_counts, badge_counts, side="right") - 1
+    boosts = np.where(idx >= 0, tier_boosts[np.clip(idx, 0, None)], 0.0)
+    return np.where(badge_counts < 1, 1.0, 1.0 + boosts)
+
+
+def badge_multiplier(inputs):
+    """Returns the badge multiplier for a get_user_inputs() dict, honouring the fictive boost."""
+    if inputs["fictive_badge_boost_enabled"]:
+        return 1.0 + inputs["fictive_badge_boost_percent"]
+    return utils.get_passport_boost_multiplier(inputs["badge_count"])
+
+
+def rarity_rate_per_second(rarity, mix=None):
+    """
+    Base rate per parcel for a rarity, or the probability-weighted average for 'mixed'
+    (over 'mix', a {rarity: weight} mapping, or PARCEL_PROBABILITIES when it is None).
+    """
+    if rarity == "mixed":
+        if mix is not None:
+            return mix_rate_per_second(mix)
+        return utils.calculate_average_mixed_parcel_rate_per_second()
+    return constants.PARCEL_RATES_PER_SECOND[rarity]
+
+
+def boosted_seconds_factor(ad_multiplier, boost_hours, srb_forced, timeframe, srb_hours_per_month=None):
+    """
+    Returns the 'With Ad Boost' earnings for one timeframe per unit of badge-boosted
+    rent per second. Mirrors CurrentEarningsCalculator.update_display:
+    - up to a week, boost hours are averaged over the day with no SRB events;
+    - month/year add SRB_HOURS_PER_MONTH of 50x time unless boost hours are zero,
+      and a forced SRB turns every boosted hour into a 50x hour.
+    srb_hours_per_month (from the active rate_profile.RateProfile) defaults to SRB_HOURS_PER_MONTH.
+    All arguments broadcast, so the whole earnings model is one array expression.
+    """
+    ad_multiplier = np.asarray(ad_multiplier, dtype=np.float64)
+    boost_hours = np.asarray(boost_hours, dtype=np.float64)
+    srb_forced = np.asarray(srb_forced, dtype=bool)
+    srb = constants.SUPER_RENT_BOOST_MULTIPLIER
+
+    day_seconds = constants.SECONDS_PER_DAY
+    boosted_daily = np.clip(boost_hours * constants.SECONDS_PER_HOUR, 0, day_seconds)
+    unboosted_daily = day_seconds - boosted_daily
+    multiplier = np.where(srb_forced, srb, ad_multiplier)
+
+    if timeframe not in ("month", "year"):
+        day_factor = (multiplier * boosted_daily + unboosted_daily) / day_seconds
+        return day_factor * utils.get_seconds_in_timeframe(timeframe)
+
+    if srb_hours_per_month is None:
+        srb_hours_per_month = constants.SRB_HOURS_PER_MONTH
+    if timeframe == "month":
+        days = constants.AVG_DAYS_PER_MONTH
+        srb_seconds = srb_hours_per_month * constants.SECONDS_PER_HOUR
+    else:
+        days = constants.AVG_DAYS_PER_YEAR
+        srb_seconds = srb_hours_per_month * 12 * constants.SECONDS_PER_HOUR
+    total_seconds = days * day_seconds
+
+    forced = (srb * boosted_daily + unboosted_daily) * days
+    normal_boosted = np.minimum(boosted_daily * days, total_seconds - srb_seconds)
+    unboosted = np.maximum(total_seconds - srb_seconds - normal_boosted, 0)
+    with_events = unboosted + ad_multiplier * normal_boosted + srb * srb_seconds
+
+    return np.where(srb_forced, forced, np.where(boost_hours == 0, total_seconds, with_events))
+
+
+def monthly_boosted_curve(region, rate_per_parcel, max_parcels, badge_mult=1.0,
+                          boost_hours=0.0, srb_forced=False, srb_hours_per_month=None):
+    """
+    Boosted monthly earnings for n = 0..max_parcels parcels that all earn rate_per_parcel.
+    Returns (earnings, ad_multipliers).
+    """
+    multipliers = dense_ad_multipliers(region, max_parcels)
+    counts = np.arange(max_parcels + 1, dtype=np.float64)
+    factor = boosted_seconds_factor(multipliers, boost_hours, srb_forced, "month", srb_hours_per_month)
+    return counts * (rate_per_parcel * badge_mult) * factor, multipliers
+
+
+def marginal_value_curve(region, rarity, max_parcels, badge_mult=1.0, boost_hours=0.0, srb_forced=False,
+                         srb_hours_per_month=None, mix=None):
+    """
+    Computes the marginal change in boosted monthly earnings from buying one more parcel,
+    for every parcel count 0..max_parcels-1, plus every "cliff" where that change is negative.
+
+    Returns a dict with:
+    - 'earnings': monthly boosted earnings at n parcels (prefix of per-parcel contributions),
+    - 'marginal': earnings[n + 1] - earnings[n] (difference array),
+    - 'cliffs': list of dicts with the parcel count before the drop, the multipliers on
+      either side, the monthly loss and how many extra parcels it takes to recover
+      (None if the range ends before earnings recover).
+    """
+    rate = rarity_rate_per_second(rarity, mix)
+    earnings, multipliers = monthly_boosted_curve(region, rate, max_parcels, badge_mult,
+                                                  boost_hours, srb_forced, srb_hours_per_month)
+    marginal = np.diff(earnings)
+
+    # A running maximum of earnings past each cliff lets it find its recovery point
+    # with one binary search: the first count at or after the drop that earns as much again.
+    cliffs = []
+    for n in np.flatnonzero(marginal < 0):
+        running_best = np.maximum.accumulate(earnings[n + 1:])
+        recovered_at = np.searchsorted(running_best, earnings[n], side="left")
+        parcels_to_recover = int(recovered_at) + 1 if recovered_at < len(running_best) else None
+        cliffs.append({
+            "parcels": int(n),
+            "multiplier_before": float(multipliers[n]),
+            "multiplier_after": float(multipliers[n + 1]),
+            "monthly_loss": float(-marginal[n]),
+            "parcels_to_recover": parcels_to_recover,
+        })
+
+    return {"earnings": earnings, "marginal": marginal, "cliffs": cliffs}
+
+
+def payback_table(parcel_cost, portfolio_sizes, regions, rarity="mixed", badge_mult=1.0,
+                  boost_hours=0.0, srb_forced=False, batch_size=1, srb_hours_per_month=None, mix=None):
+    """
+    Days needed to recoup buying batch_size more parcels, for every portfolio size in every region.
+    All regions and sizes go through boosted_seconds_factor in a single broadcast call.
+    srb_hours_per_month and mix (the rarity mix behind 'mixed') default to the constants.
+
+    Returns a dict of equal-length columns (region-major order): 'region', 'portfolio_size',
+    'monthly_earnings', 'monthly_gain' (extra boosted monthly earnings from the batch) and
+    'payback_days' (inf where the batch lowers earnings because of a tier cliff).
+    """
+    sizes = np.asarray(portfolio_sizes, dtype=np.int64)
+    regions = list(regions)
+    after_sizes = sizes + batch_size
+
+    # Shape (2, regions, sizes): portfolio before and after buying the batch
+    counts = np.stack([np.broadcast_to(sizes, (len(regions), len(sizes))),
+                       np.broadcast_to(after_sizes, (len(regions), len(sizes)))])
+    multipliers = np.stack([np.stack([ad_boost_multipliers(c, region) for region in regions])
+                            for c in (sizes, after_sizes)])
+    monthly = counts * (rarity_rate_per_second(rarity, mix) * badge_mult) * \
+        boosted_seconds_factor(multipliers, boost_hours, srb_forced, "month", srb_hours_per_month)
+
+    monthly_gain = monthly[1] - monthly[0]
+    daily_gain = monthly_gain / constants.AVG_DAYS_PER_MONTH
+    with np.errstate(divide="ignore", invalid="ignore"):
+        payback_days = np.where(daily_gain > 0, parcel_cost * batch_size / daily_gain, np.inf)
+
+    return {
+        "region": np.repeat(np.array(regions, dtype=object), len(sizes)),
+        "portfolio_size": np.tile(sizes, len(regions)),
+        "monthly_earnings": monthly[0].ravel(),
+        "monthly_gain": monthly_gain.ravel(),
+        "payback_days": payback_days.ravel(),
+    }
+
+
+def scenario_earnings(parcel_matrix, badge_multipliers, boost_hours, srb_forced, regions, srb_hours_per_month=None):
+    """
+    Earnings of many what-if scenarios in one pass. Row i of parcel_matrix holds scenario i's
+    counts in PARCEL_RATES_PER_SECOND order; the other arguments give one value per scenario.
+    Ad boost tiers are looked up once per region present, and every timeframe is one broadcast
+    boosted_seconds_factor call over all scenarios.
+
+    Returns (total_parcels, ad_multipliers, earnings) with earnings mapping each of TIMEFRAMES
+    to a (base, boosted) pair of arrays.
+    """
+    rates = np.array(list(constants.PARCEL_RATES_PER_SECOND.values()))
+    parcel_matrix = np.asarray(parcel_matrix, dtype=np.int64).reshape(-1, len(rates))
+    regions = np.asarray(regions, dtype=object)
+    total_parcels = parcel_matrix.sum(axis=1)
+    ad_multipliers = np.ones(len(parcel_matrix))
+    for region in set(regions.tolist()):
+        in_region = regions == region
+        ad_multipliers[in_region] = ad_boost_multipliers(total_parcels[in_region], region)
+
+    rent_per_second = (parcel_matrix @ rates) * np.asarray(badge_multipliers, dtype=np.float64)
+    earnings = {}
+    for tf in TIMEFRAMES:
+        base = rent_per_second * utils.get_seconds_in_timeframe(tf)
+        boosted = rent_per_second * boosted_seconds_factor(ad_multipliers, boost_hours, srb_forced, tf, srb_hours_per_month)
+        earnings[tf] = (base, boosted)
+    return total_parcels, ad_multipliers, earnings
+
+
+def find_tier_index(region, total_parcels):
+    """Index of the compiled tier containing total_parcels, or -1 if no tier does."""
+    table = compile_tier_table(region)
+    idx = int(np.searchsorted(table.mins, total_parcels, side="right")) - 1
+    if idx >= 0 and total_parcels <= table.maxs[idx]:
+        return idx
+    return -1
+
+
+def edit_tier_row(table, row, tier_min, tier_max, multiplier):
+    """
+    A copy of a compiled TierTable with one row replaced, for what-if edits. The edit must keep
+    the tiers in order without overlap. The shipped tables are never changed; a real change to
+    the tiers belongs in a new constants.RATE_EPOCHS entry.
+    """
+    if not 0 <= row < len(table.mins):
+        raise ValueError(f"There is no tier row {row}.")
+    if not 1 <= tier_min <= tier_max or multiplier <= 0:
+        raise ValueError("A tier needs 1 <= min <= max and a positive multiplier.")
+    if (row > 0 and tier_min <= table.maxs[row - 1]) or (row + 1 < len(table.mins) and tier_max >= table.mins[row + 1]):
+        raise ValueError("The edited tier would overlap its neighbours.")
+
+    edited = TierTable(table.mins.copy(), table.maxs.copy(), table.multipliers.copy())
+    edited.mins[row], edited.maxs[row], edited.multipliers[row] = tier_min, tier_max, multiplier
+    for array in edited:
+        array.setflags(write=False)
+    return edited
+
+
+@functools.lru_cache(maxsize=256)
+def _tier_ladder_factors(region, badge_mult):
+    """
+    Per-tier daily earnings per unit of base rate at each tier's first and last parcel,
+    cached per region and badge tier since only the base rate differs between users.
+    """
+    table = compile_tier_table(region)
+    day_factor = badge_mult * table.multipliers * constants.SECONDS_PER_DAY
+    start_factor = table.mins * day_factor
+    end_factor = table.maxs * day_factor
+    for array in (start_factor, end_factor):
+        array.setflags(write=False)
+    return start_factor, end_factor
+
+
+def tier_ladder(region, total_parcels, rate_per_parcel, badge_mult=1.0):
+    """
+    Every ad boost tier still ahead of total_parcels, computed in one pass over the compiled tier arrays.
+
+    Earnings follow the 'Next Tier Info' estimate: all parcels earn rate_per_parcel with the badge
+    and tier multipliers applied around the clock. Returns a dict of equal-length columns:
+    'min', 'max', 'multiplier', 'parcels_needed' (from the previous rung, or from now for the first),
+    'cumulative_parcels' (from now to the tier start), and 'daily_start', 'daily_end',
+    'monthly_start', 'monthly_end' earnings at the tier's first and last parcel.
+    """
+    table = compile_tier_table(region)
+    start_factor, end_factor = _tier_ladder_factors(region, badge_mult)
+    first = int(np.searchsorted(table.mins, total_parcels, side="right"))
+
+    mins = table.mins[first:]
+    cumulative_parcels = mins - total_parcels
+    daily_start = start_factor[first:] * rate_per_parcel
+    daily_end = end_factor[first:] * rate_per_parcel
+    return {
+        "min": mins,
+        "max": table.maxs[first:],
+        "multiplier": table.multipliers[first:],
+        "parcels_needed": np.diff(cumulative_parcels, prepend=0),
+        "cumulative_parcels": cumulative_parcels,
+        "daily_start": daily_start,
+        "daily_end": daily_end,
+        "monthly_start": daily_start * constants.AVG_DAYS_PER_MONTH,
+        "monthly_end": daily_end * constants.AVG_DAYS_PER_MONTH,
+    }
+
+
+def mix_rate_per_second(mix):
+    """
+    Average base rate per parcel for a rarity mix such as {"common": 70, "rare": 30}.
+    Weights are normalised, so percentages and fractions both work; an empty mix means all common.
+    """
+    total_weight = sum(mix.values())
+    if total_weight <= 0:
+        return constants.PARCEL_RATES_PER_SECOND["common"]
+    return sum(constants.PARCEL_RATES_PER_SECOND[p_type] * weight for p_type, weight in mix.items()) / total_weight
+
+
+def custom_tier_boosted_factor(ad_multiplier, boost_hours, srb_forced, srb_hours_per_month=None):
+    """
+    Boosted monthly earnings per unit of badge-boosted rent per second, as estimated by
+    CustomTierCalculator: srb_hours_per_month (default SRB_HOURS_PER_MONTH) of 50x time are
+    always included, and a forced SRB applies 50x to the whole month.
+    """
+    if srb_hours_per_month is None:
+        srb_hours_per_month = constants.SRB_HOURS_PER_MONTH
+    ad_multiplier = np.asarray(ad_multiplier, dtype=np.float64)
+    boost_hours = np.asarray(boost_hours, dtype=np.float64)
+    srb = constants.SUPER_RENT_BOOST_MULTIPLIER
+
+    total_seconds = constants.AVG_DAYS_PER_MONTH * constants.SECONDS_PER_DAY
+    srb_seconds = srb_hours_per_month * constants.SECONDS_PER_HOUR
+    normal_boosted = np.maximum(np.minimum(boost_hours * constants.SECONDS_PER_HOUR * constants.AVG_DAYS_PER_MONTH,
+                                           total_seconds - srb_seconds), 0)
+    unboosted = np.maximum(total_seconds - srb_seconds - normal_boosted, 0)
+    with_events = unboosted + ad_multiplier * normal_boosted + srb * srb_seconds
+    return np.where(np.asarray(srb_forced, dtype=bool), srb * total_seconds, with_events)
+
+
+def custom_tier_sweep(region, first, last, rate_per_parcel, badge_mult=1.0, boost_hours=0.0, srb_forced=False,
+                      samples=None, srb_hours_per_month=None):
+    """
+    Custom Tier monthly earnings for every parcel count from first to last (inclusive), or with
+    'samples' for about that many evenly spaced counts plus both sides of every tier boundary.
+    Earnings are linear in the count within a tier, so the sampled curve drawn as a polyline is
+    the exact one. Returns (counts, base_monthly, boosted_monthly) arrays.
+    """
+    if samples is None or last - first + 1 <= samples:
+        counts = np.arange(first, last + 1, dtype=np.int64)
+    else:
+        table = compile_tier_table(region)
+        boundaries = np.concatenate([table.mins - 1, table.mins, table.maxs, table.maxs + 1])
+        counts = np.unique(np.concatenate([np.linspace(first, last, samples).round().astype(np.int64),
+                                           boundaries[(boundaries >= first) & (boundaries <= last)]]))
+    rate_with_badge = counts * (rate_per_parcel * badge_mult)
+    base_monthly = rate_with_badge * utils.get_seconds_in_timeframe("month")
+    boosted_monthly = rate_with_badge * custom_tier_boosted_factor(
+        ad_boost_multipliers(counts, region), boost_hours, srb_forced, srb_hours_per_month)
+    return counts, base_monthly, boosted_monthly
+
+
+def custom_tier_grid(region, counts, boost_hours, rate_per_parcel, badge_mult=1.0, srb_forced=False,
+                     srb_hours_per_month=None):
+    """
+    Custom Tier boosted monthly earnings for every (boost hours, parcel count) pair in one
+    broadcast call: rows follow boost_hours and columns follow counts.
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    boost_hours = np.asarray(boost_hours, dtype=np.float64)
+    factor = custom_tier_boosted_factor(ad_boost_multipliers(counts, region)[np.newaxis, :],
+                                        boost_hours[:, np.newaxis], srb_forced, srb_hours_per_month)
+    return counts * (rate_per_parcel * badge_mult) * factor
+
+
+def sample_distribution(rng, distribution, size):
+    """
+    Draws from ('normal', mean, sd), ('uniform', low, high) or ('fixed', value, _).
+    The caller clips the draws to the valid range.
+    """
+    kind, a, b = distribution
+    if kind == "normal":
+        return rng.normal(a, b, size) if b > 0 else np.full(size, float(a))
+    if kind == "uniform":
+        return rng.uniform(min(a, b), max(a, b), size)
+    if kind == "fixed":
+        return np.full(size, float(a))
+    raise ValueError(f"Unknown distribution '{kind}' (expected normal, uniform or fixed).")
+
+
+def monte_carlo_boosted_factors(ad_multiplier, boost_hours_dist, srb_hours_dist, srb_forced,
+                                samples=MONTE_CARLO_SAMPLES, seed=None):
+    """
+    Stochastic version of boosted_seconds_factor for months and years. Each simulated month
+    draws its daily boost hours from boost_hours_dist, one draw per day and clipped to 0-24,
+    and its SRB hours from srb_hours_dist, clipped at 0. Both are distributions for
+    sample_distribution. As in the point estimate, a month without any boosted time gets no
+    SRB hours, and a forced SRB runs every boosted hour at 50x instead.
+    Months are simulated MONTE_CARLO_BATCH at a time. Each simulated year is the sum of 12
+    months resampled from them, which is exact while the boosted time fits beside the SRB time.
+    Returns (month_factors, year_factors): 'With Ad Boost' earnings per unit of rent per second.
+    """
+    rng = np.random.default_rng(seed)
+    srb = constants.SUPER_RENT_BOOST_MULTIPLIER
+    days = constants.AVG_DAYS_PER_MONTH
+    total_seconds = days * constants.SECONDS_PER_DAY
+    # One draw per started day; the last, partial day counts for its fraction
+    day_weights = np.ones(int(np.ceil(days)))
+    day_weights[-1] = days - (len(day_weights) - 1)
+
+    month_factors = np.empty(samples)
+    for first in range(0, samples, MONTE_CARLO_BATCH):
+        size = min(MONTE_CARLO_BATCH, samples - first)
+        daily_hours = np.clip(sample_distribution(rng, boost_hours_dist, (size, len(day_weights))), 0, 24)
+        boosted = daily_hours @ day_weights * constants.SECONDS_PER_HOUR
+        if srb_forced:
+            factors = srb * boosted + (total_seconds - boosted)
+        else:
+            srb_seconds = np.minimum(np.maximum(sample_distribution(rng, srb_hours_dist, size), 0) * constants.SECONDS_PER_HOUR,
+                                     total_seconds)
+            srb_seconds = np.where(boosted > 0, srb_seconds, 0.0)
+            normal_boosted = np.minimum(boosted, total_seconds - srb_seconds)
+            unboosted = np.maximum(total_seconds - srb_seconds - normal_boosted, 0)
+            factors = unboosted + ad_multiplier * normal_boosted + srb * srb_seconds
+        month_factors[first:first + size] = factors
+
+    year_factors = month_factors[rng.integers(0, samples, (samples, 12))].sum(axis=1)
+    return month_factors, year_factors
+
+
+def parse_srb_events(text):
+    """
+    Parses SRB events like '2025-03-14:8, 2025-04-02:16' (date:hours) into
+    (dates as datetime64[D], hours) arrays for calendar_month_earnings.
+    """
+    dates, hours = [], []
+    for part in text.replace(";", ",").split(","):
+        if not part.strip():
+            continue
+        date_text, separator, hours_text = part.strip().rpartition(":")
+        if not separator:
+            raise ValueError(f"Invalid SRB event: '{part.strip()}' (expected YYYY-MM-DD:HOURS)")
+        dates.append(np.datetime64(date_text.strip(), "D"))
+        hours.append(float(hours_text))
+    return np.array(dates, dtype="datetime64[D]"), np.array(hours, dtype=np.float64)
+
+
+def calendar_month_earnings(rent_per_second, ad_multiplier, boost_hours, srb_forced, start_date, end_date, srb_events=None,
+                            srb_hours_per_month=None):
+    """
+    Earnings per calendar month from start_date up to (excluding) end_date, using real
+    month lengths instead of AVG_DAYS_PER_MONTH. The months at either end are counted only
+    for their days inside the range. Everything is datetime64 arithmetic over the month
+    array, so a multi-year range is a few array operations.
+    Without srb_events each month gets srb_hours_per_month (default SRB_HOURS_PER_MONTH),
+    prorated for partial months.
+    srb_events is a (dates, hours) pair from parse_srb_events; each event's hours land in
+    its own month, if its date is inside the range. The split between SRB, ad-boosted and
+    unboosted time follows boosted_seconds_factor.
+    Returns (months as datetime64[M], days, base, boosted) arrays.
+    """
+    start, end = np.datetime64(start_date, "D"), np.datetime64(end_date, "D")
+    if end <= start:
+        raise ValueError("The end date must be after the start date.")
+    months = np.arange(start.astype("datetime64[M]"), (end - 1).astype("datetime64[M]") + 1)
+    month_first = months.astype("datetime64[D]")
+    month_next = (months + 1).astype("datetime64[D]")
+    days = (np.minimum(month_next, end) - np.maximum(month_first, start)).astype(np.int64)
+
+    if srb_events is None:
+        if srb_hours_per_month is None:
+            srb_hours_per_month = constants.SRB_HOURS_PER_MONTH
+        srb_hours = srb_hours_per_month * days / (month_next - month_first).astype(np.int64)
+    else:
+        event_dates, event_hours = srb_events
+        in_range = (event_dates >= start) & (event_dates < end)
+        event_months = (event_dates[in_range].astype("datetime64[M]") - months[0]).astype(np.int64)
+        srb_hours = np.bincount(event_months, weights=event_hours[in_range], minlength=len(months))
+
+    srb = constants.SUPER_RENT_BOOST_MULTIPLIER
+    day_seconds = constants.SECONDS_PER_DAY
+    total_seconds = days * day_seconds
+    boosted_daily = min(max(boost_hours * constants.SECONDS_PER_HOUR, 0), day_seconds)
+    base = rent_per_second * total_seconds
+    if srb_forced:
+        boosted = rent_per_second * (srb * boosted_daily + (day_seconds - boosted_daily)) * days
+    elif boost_hours == 0:
+        boosted = base.astype(np.float64)
+    else:
+        srb_seconds = np.minimum(np.maximum(srb_hours, 0) * constants.SECONDS_PER_HOUR, total_seconds)
+        normal_boosted = np.minimum(boosted_daily * days, total_seconds - srb_seconds)
+        unboosted = np.maximum(total_seconds - srb_seconds - normal_boosted, 0)
+        boosted = rent_per_second * (unboosted + ad_multiplier * normal_boosted + srb * srb_seconds)
+    return months, days, base, boosted
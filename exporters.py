@@ -0,0 +1,252 @@
+# exporters.py
+
+import datetime
+import hashlib
+import json
+import os
+import struct
+import time
+import zipfile
+from collections import namedtuple
+
+import numpy as np
+
+import constants
+
+# External libraries for export (will need to be installed)
+try:
+    import openpyxl
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+except ImportError:
+    openpyxl = None
+
+try:
+    import pyarrow
+    import pyarrow.feather
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+# Excel number formats for typed numeric cells
+CURRENCY_FORMAT = '"$"#,##0.00000000'
+COUNT_FORMAT = '#,##0'
+DAYS_FORMAT = '#,##0.0'
+
+# Rows converted from NumPy columns to Python values per step of a streaming export
+EXPORT_CHUNK_ROWS = 10000
+
+# One worksheet of a streaming export: 'rows' is any iterable of row sequences and is consumed
+# once, so it can be a generator; 'number_formats' maps header names to Excel number formats.
+XlsxSheet = namedtuple("XlsxSheet", ["title", "header", "rows", "number_formats"])
+
+# Returned by the large-export writers so callers can report throughput
+ExportStats = namedtuple("ExportStats", ["rows", "seconds"])
+
+# Identifies files written by write_columnar, and the metadata layout they use
+COLUMNAR_FORMAT = "atlas-earth-columns"
+COLUMNAR_FORMAT_VERSION = 1
+# Name of the JSON metadata entry inside .npz files
+NPZ_METADATA_KEY = "__metadata__"
+# File dialog choices for write_columnar; Arrow and Parquet need pyarrow
+COLUMNAR_FILETYPES = [("NumPy archive", "*.npz")] + (
+    [("Arrow IPC files", "*.arrow"), ("Parquet files", "*.parquet")] if pyarrow else [])
+
+
+def iter_column_rows(columns, chunk_rows=EXPORT_CHUNK_ROWS):
+    """
+    Yields the rows of a dict of equal-length columns (NumPy arrays or lists) a chunk at a time,
+    so only one chunk of Python objects exists at once. Non-finite floats become None (empty cells).
+    """
+    columns = list(columns.values())
+    total_rows = len(columns[0]) if columns else 0
+    for start in range(0, total_rows, chunk_rows):
+        chunk = []
+        for column in columns:
+            part = column[start:start + chunk_rows]
+            if isinstance(part, np.ndarray):
+                if part.dtype.kind == "f":
+                    part = np.where(np.isfinite(part), part, None)
+                part = part.tolist()
+            chunk.append(part)
+        yield from zip(*chunk)
+
+
+def write_xlsx_streaming(file_path, sheets, progress=None):
+    """
+    Writes sheets with openpyxl's write-only worksheets, which stream rows to disk instead of
+    keeping every cell in memory. Numeric columns are written as numbers with their number format
+    (no pre-formatted '$' strings). If given, progress(rows_written) is called every
+    EXPORT_CHUNK_ROWS rows. Returns ExportStats with the data row count and elapsed time.
+    """
+    if not openpyxl:
+        raise RuntimeError("openpyxl library not found. Please install it using 'pip install openpyxl'")
+
+    start = time.perf_counter()
+    workbook = openpyxl.Workbook(write_only=True)
+    total_rows = 0
+    for sheet in sheets:
+        worksheet = workbook.create_sheet(sheet.title)
+
+        header_row = []
+        for name in sheet.header:
+            cell = WriteOnlyCell(worksheet, value=name)
+            cell.font = Font(bold=True)
+            header_row.append(cell)
+        worksheet.append(header_row)
+
+        # One reusable cell per formatted column: write-only sheets serialise each row as it is
+        # appended, so updating the value in place avoids creating a styled cell per value.
+        formatted = {}
+        for col_idx, name in enumerate(sheet.header):
+            if name in sheet.number_formats:
+                cell = WriteOnlyCell(worksheet)
+                cell.number_format = sheet.number_formats[name]
+                formatted[col_idx] = cell
+
+        for row in sheet.rows:
+            if formatted:
+                row = list(row)
+                for col_idx, cell in formatted.items():
+                    cell.value = row[col_idx]
+                    row[col_idx] = cell
+            worksheet.append(row)
+            total_rows += 1
+            if progress is not None and total_rows % EXPORT_CHUNK_ROWS == 0:
+                progress(total_rows)
+
+    workbook.save(file_path)
+    return ExportStats(total_rows, time.perf_counter() - start)
+
+
+def constants_fingerprint():
+    """
+    Short hash of the rate, badge, tier and SRB tables in constants, stored with columnar exports
+    so downstream analysis can tell which tables produced a file.
+    """
+    tables = [constants.PARCEL_RATES_PER_SECOND, constants.BADGE_BOOST_TIERS, constants.REGIONAL_AD_BOOST_DATA,
+              constants.SUPER_RENT_BOOST_MULTIPLIER, constants.SRB_HOURS_PER_MONTH, constants.PARCEL_PROBABILITIES]
+    return hashlib.sha256(json.dumps(tables, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def _as_column_array(values):
+    """
+    Converts a column to a NumPy array that can be memory-mapped. Text columns are dictionary
+    encoded: returns (integer codes, list of categories) instead of (array, None).
+    """
+    array = np.asarray(values)
+    if array.dtype == object or array.dtype.kind == "U":
+        categories, codes = np.unique(array.astype(str), return_inverse=True)
+        code_dtype = np.uint8 if len(categories) <= 0xFF else np.uint32
+        return codes.astype(code_dtype), categories.tolist()
+    return np.ascontiguousarray(array), None
+
+
+def write_columnar(file_path, columns, kind, extra_metadata=None):
+    """
+    Writes a dict of equal-length columns to a columnar binary file, chosen by extension:
+    '.npz' (always available; stored uncompressed so load_columnar can memory-map it), or
+    '.arrow'/'.feather' and '.parquet' when pyarrow is installed.
+    The metadata records the table kind (e.g. 'payback_table'), a schema and constants_fingerprint().
+    Text columns are stored as integer codes, with their categories listed in the schema.
+    Returns ExportStats.
+    """
+    start = time.perf_counter()
+    arrays = {}
+    schema = []
+    for name, values in columns.items():
+        arrays[name], categories = _as_column_array(values)
+        schema.append({"name": name, "dtype": arrays[name].dtype.str})
+        if categories is not None:
+            schema[-1]["categories"] = categories
+    row_count = len(next(iter(arrays.values()))) if arrays else 0
+    metadata = {
+        "format": COLUMNAR_FORMAT,
+        "format_version": COLUMNAR_FORMAT_VERSION,
+        "kind": kind,
+        "rows": row_count,
+        "schema": schema,
+        "constants_fingerprint": constants_fingerprint(),
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        **(extra_metadata or {}),
+    }
+
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension == ".npz":
+        with open(file_path, "wb") as out_file:
+            np.savez(out_file, **arrays, **{NPZ_METADATA_KEY: np.array(json.dumps(metadata))})
+    elif extension in (".arrow", ".feather", ".parquet"):
+        if not pyarrow:
+            raise RuntimeError("pyarrow library not found. Please install it using 'pip install pyarrow'")
+        table = pyarrow.table(arrays).replace_schema_metadata({"atlas_earth": json.dumps(metadata)})
+        if extension == ".parquet":
+            pyarrow.parquet.write_table(table, file_path)
+        else:
+            # Uncompressed Arrow IPC can be memory-mapped without copying
+            pyarrow.feather.write_feather(table, file_path, compression="uncompressed")
+    else:
+        raise ValueError(f"Unsupported columnar export format: {extension}")
+    return ExportStats(row_count, time.perf_counter() - start)
+
+
+def _memmap_npz_member(file_path, info):
+    """Memory-maps one uncompressed .npy member of a zip archive in place."""
+    with open(file_path, "rb") as npz_file:
+        # The member's data starts after its local file header, whose name/extra lengths
+        # can differ from the central directory's copy.
+        npz_file.seek(info.header_offset + 26)
+        name_length, extra_length = struct.unpack("<HH", npz_file.read(4))
+        npz_file.seek(info.header_offset + 30 + name_length + extra_length)
+        version = np.lib.format.read_magic(npz_file)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(npz_file)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(npz_file)
+        offset = npz_file.tell()
+    if dtype.hasobject:
+        raise ValueError(f"Column '{info.filename}' holds Python objects and cannot be memory-mapped.")
+    return np.memmap(file_path, dtype=dtype, mode="r", offset=offset, shape=shape,
+                     order="F" if fortran_order else "C")
+
+
+def load_columnar(file_path, mmap=True):
+    """
+    Loads a file written by write_columnar and returns (columns, metadata).
+    With mmap=True, .npz columns are read-only views memory-mapped straight from the file and
+    .arrow/.feather columns are zero-copy views of a memory-mapped Arrow table, so nothing is
+    parsed or copied until it is used. Parquet is always decoded into memory.
+    Text columns come back as codes; decode_column turns one into its values when needed.
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension == ".npz":
+        with zipfile.ZipFile(file_path) as archive:
+            infos = {os.path.splitext(info.filename)[0]: info for info in archive.infolist()}
+        with np.load(file_path, allow_pickle=False) as npz:
+            metadata = json.loads(str(npz[NPZ_METADATA_KEY]))
+            if not mmap:
+                return {name: npz[name] for name in npz.files if name != NPZ_METADATA_KEY}, metadata
+            # Members that were compressed by another tool can only be read into memory
+            columns = {name: npz[name] for name, info in infos.items()
+                       if name != NPZ_METADATA_KEY and info.compress_type != zipfile.ZIP_STORED}
+        for name, info in infos.items():
+            if name != NPZ_METADATA_KEY and name not in columns:
+                columns[name] = _memmap_npz_member(file_path, info)
+        return columns, metadata
+
+    if not pyarrow:
+        raise RuntimeError("pyarrow library not found. Please install it using 'pip install pyarrow'")
+    if extension == ".parquet":
+        table = pyarrow.parquet.read_table(file_path)
+    else:
+        table = pyarrow.feather.read_table(file_path, memory_map=mmap)
+    metadata = json.loads((table.schema.metadata or {}).get(b"atlas_earth", b"{}"))
+    columns = {name: table.column(name).to_numpy() for name in table.column_names}
+    return columns, metadata
+
+
+def decode_column(columns, metadata, name):
+    """Returns a dictionary-encoded text column from load_columnar as an array of its values."""
+    for field in metadata["schema"]:
+        if field["name"] == name and "categories" in field:
+            return np.asarray(field["categories"])[columns[name]]
+    return columns[name]
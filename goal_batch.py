@@ -0,0 +1,197 @@
+# goal_batch.py
+
+import csv
+import itertools
+import json
+import os
+
+import numpy as np
+
+import constants
+import utils
+import earnings_model
+
+# Columns accepted in a goal file. Only target_amount is required; the rest default
+# to what a fresh "Parcels for Goal" tab would use.
+GOAL_FILE_DEFAULTS = {
+    "account": "",
+    "target_amount": None,
+    "timeframe": "day",
+    "mode": "mixed",
+    "rarity": "common",
+    "assume_boosts": "",
+    "assumed_badges": "0",
+    "assumed_rent_boost": "0",
+}
+
+GOAL_CHUNK_ROWS = 100000
+
+
+def _read_goal_chunks(file_path, chunk_rows):
+    """
+    Yields the goals of a CSV (with header) or JSONL file in chunks, each chunk a dict
+    mapping column name to a list of strings, so the solver never holds the whole file.
+    """
+    if os.path.splitext(file_path)[1].lower() in (".jsonl", ".json"):
+        with open(file_path) as goal_file:
+            records = (json.loads(line) for line in goal_file if line.strip())
+            while True:
+                chunk = list(itertools.islice(records, chunk_rows))
+                if not chunk:
+                    return
+                yield {name: ["" if record.get(name) is None else str(record[name]) for record in chunk]
+                       for name in GOAL_FILE_DEFAULTS if any(name in record for record in chunk)}
+    else:
+        with open(file_path, newline='') as goal_file:
+            reader = csv.reader(goal_file)
+            header = [name.strip() for name in next(reader, [])]
+            rows = _padded_rows(reader, len(header))
+            while True:
+                chunk = list(itertools.islice(rows, chunk_rows))
+                if not chunk:
+                    return
+                yield dict(zip(header, (list(column) for column in zip(*chunk))))
+
+
+def _padded_rows(reader, width):
+    """
+    The non-blank rows of a csv.reader, each padded with empty values to the header's width so
+    a short row only leaves its own missing values to the defaults. Too many fields is an error.
+    """
+    for row in reader:
+        if not any(cell.strip() for cell in row):
+            continue
+        if len(row) > width:
+            raise ValueError(f"Line {reader.line_num}: {len(row)} values, but the header names only {width} columns.")
+        yield row + [""] * (width - len(row))
+
+
+def _column(chunk, name, size):
+    """Returns one column of a chunk with GOAL_FILE_DEFAULTS filled in for missing values."""
+    default = GOAL_FILE_DEFAULTS[name]
+    values = chunk.get(name)
+    if default is None:
+        if values is None or "" in values:
+            raise ValueError(f"Every goal row needs a value for '{name}'.")
+        return values
+    if values is None:
+        return [default] * size
+    return [value or default for value in values]
+
+
+def _csv_text(value):
+    """Quotes a text field the way csv.writer would, for the hand-joined output rows."""
+    if any(char in value for char in ',"\r\n'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def solve_goals(target_amount, timeframe, mode, rarity, assume_boosts, assumed_badges, assumed_rent_boost, mix=None):
+    """
+    Vectorized GoalCalculator._perform_goal_calculation plus the single-type answers of
+    "Show Other Parcel Compositions". Every argument except 'mix' (the rarity mix of 'mixed'
+    goals, default PARCEL_PROBABILITIES) is an array with one entry per goal.
+
+    Returns a dict of result columns. Goals whose effective boosted rate is zero (e.g. assumed
+    boosts with a 0x rent boost) get NaN instead of the GUI's error dialog.
+    """
+    target_amount = np.asarray(target_amount, dtype=np.float64)
+    assume_boosts = np.asarray(assume_boosts, dtype=bool)
+
+    seconds_lookup = {tf: utils.get_seconds_in_timeframe(tf) for tf in earnings_model.TIMEFRAMES}
+    unique_timeframes, timeframe_idx = np.unique(np.asarray(timeframe), return_inverse=True)
+    unknown = set(unique_timeframes.tolist()) - set(seconds_lookup)
+    if unknown:
+        raise ValueError(f"Invalid timeframe unit(s): {', '.join(sorted(unknown))}")
+    seconds = np.array([seconds_lookup[tf] for tf in unique_timeframes], dtype=np.float64)[timeframe_idx]
+
+    mode = np.asarray(mode)
+    rarity = np.asarray(rarity)
+    unknown = set(np.unique(mode).tolist()) - {"mixed", "specific"}
+    if unknown:
+        raise ValueError(f"Invalid mode(s): {', '.join(sorted(unknown))} (use 'mixed' or 'specific')")
+    unknown = set(np.unique(rarity).tolist()) - set(constants.PARCEL_RATES_PER_SECOND)
+    if unknown:
+        raise ValueError(f"Invalid parcel rarity(s): {', '.join(sorted(unknown))}")
+
+    effective_multiplier = np.where(
+        assume_boosts,
+        np.asarray(assumed_rent_boost, dtype=np.float64) *
+        earnings_model.passport_boost_multipliers(np.asarray(assumed_badges, dtype=np.int64)),
+        1.0)
+    target_per_second = target_amount / seconds
+
+    results = {"effective_multiplier": effective_multiplier}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for parcel_type, base_rate in constants.PARCEL_RATES_PER_SECOND.items():
+            boosted_rate = base_rate * effective_multiplier
+            results[f"only_{parcel_type}"] = np.where(boosted_rate > 0, target_per_second / boosted_rate, np.nan)
+
+        mixed_rate = utils.calculate_average_mixed_parcel_rate_per_second(mix) * effective_multiplier
+        mixed_needed = np.where(mixed_rate > 0, target_per_second / mixed_rate, np.nan)
+
+    is_mixed = mode == "mixed"
+    specific_needed = np.full(len(target_amount), np.nan)
+    for parcel_type in constants.PARCEL_RATES_PER_SECOND:
+        chosen = ~is_mixed & (rarity == parcel_type)
+        specific_needed[chosen] = results[f"only_{parcel_type}"][chosen]
+
+    results["total_parcels_needed"] = np.where(is_mixed, mixed_needed, specific_needed)
+    for parcel_type, prob in (mix if mix is not None else constants.PARCEL_PROBABILITIES).items():
+        results[f"mixed_{parcel_type}"] = np.where(is_mixed, mixed_needed * prob, np.nan)
+    return results
+
+
+def solve_goal_file(input_path, output_path, chunk_rows=GOAL_CHUNK_ROWS, progress=None, mix=None):
+    """
+    Solves every goal in input_path and streams the results to output_path
+    (CSV, or JSONL if output_path ends in .jsonl), one chunk of rows at a time.
+    'mix' is the rarity mix of 'mixed' goals, as in solve_goals().
+    If given, progress(solved) is called after each chunk; a background job uses it to report
+    progress and to stop early by raising. Returns the number of goals solved.
+    """
+    write_jsonl = os.path.splitext(output_path)[1].lower() == ".jsonl"
+    solved = 0
+
+    with open(output_path, 'w', newline='') as out_file:
+        header_written = False
+        for chunk in _read_goal_chunks(input_path, chunk_rows):
+            size = len(_column(chunk, "target_amount", 0))
+            text = {name: _column(chunk, name, size) for name in ("account", "timeframe", "mode", "rarity")}
+            assume_boosts_text = _column(chunk, "assume_boosts", size)
+            rent_boost = _column(chunk, "assumed_rent_boost", size)
+            # A row without an explicit assume_boosts flag assumes boosts whenever it gives a rent boost
+            assume_boosts = [flag.strip().lower() in ("1", "true", "yes") if flag else float(boost) != 0
+                             for flag, boost in zip(assume_boosts_text, rent_boost)]
+            target_amount = np.array(_column(chunk, "target_amount", size), dtype=np.float64)
+
+            results = solve_goals(target_amount, text["timeframe"], text["mode"], text["rarity"], assume_boosts,
+                                  np.array(_column(chunk, "assumed_badges", size), dtype=np.float64).astype(np.int64),
+                                  np.array(rent_boost, dtype=np.float64), mix)
+            numbers = {"target_amount": target_amount, **results}
+
+            # Formatting whole columns and joining rows by hand is several times faster than
+            # csv.writer or json.dumps per row, which is what keeps million-goal files to seconds.
+            encode_text = json.dumps if write_jsonl else _csv_text
+            missing = "null" if write_jsonl else ""
+            columns = []
+            for values in text.values():
+                encoded = {value: encode_text(value) for value in set(values)}
+                columns.append(list(map(encoded.__getitem__, values)))
+            for name, values in numbers.items():
+                number_format = "{:.6g}" if name == "effective_multiplier" else "{:.2f}"
+                columns.append([missing if value != value else number_format.format(value) for value in values.tolist()])
+
+            if write_jsonl:
+                row_template = "{{" + ", ".join(f'"{name}": {{}}' for name in [*text, *numbers]) + "}}\n"
+                out_file.writelines(row_template.format(*row) for row in zip(*columns))
+            else:
+                if not header_written:
+                    out_file.write(",".join([*text, *numbers]) + "\n")
+                    header_written = True
+                out_file.writelines(",".join(row) + "\n" for row in zip(*columns))
+            solved += size
+            if progress is not None:
+                progress(solved)
+
+    return solved
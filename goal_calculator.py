@@ -1,15 +1,36 @@
 # goal_calculator.py
 
+import csv
+import datetime
+import time
 import tkinter as tk
-from tkinter import ttk, messagebox
+from collections import deque, namedtuple
+from tkinter import ttk, messagebox, filedialog
+
+import numpy as np
 
 import constants
 import utils
+import earnings_model
+import goal_batch
+import portfolio_store
+import rate_epochs
+import target_solver
+import timeline
+
+# Results kept in the goal history
+GOAL_HISTORY_LIMIT = 100
+
+# One calculated goal, as shown in the results panel
+GoalResult = namedtuple("GoalResult", ["target_amount", "timeframe", "assume_boosts", "assumed_badges",
+                                       "assumed_rent_boost", "effective_multiplier", "mode", "parcel_type",
+                                       "total_needed", "breakdown"])
 
 class GoalCalculator:
-    def __init__(self, parent_frame, get_user_inputs_callback):
+    def __init__(self, parent_frame, get_user_inputs_callback, job_runner):
         self.parent_frame = parent_frame
         self.get_user_inputs_callback = get_user_inputs_callback
+        self.job_runner = job_runner
 
         self.target_amount_var = tk.StringVar(value="1.00")
         self.target_timeframe_var = tk.StringVar(value="day")
@@ -31,6 +52,20 @@ class GoalCalculator:
         self._last_calculation_mode = ""
         self._last_specific_parcel_type = ""
 
+        # Past results as data, newest first; the oldest drop off once the limit is reached
+        self._history = deque(maxlen=GOAL_HISTORY_LIMIT)
+        # The GoalResult in the results panel, which may be an older one picked from the history
+        self._shown_result = None
+
+        # Time to reach a balance: the main inputs plus a starting balance, SRB events and planned purchases
+        self.balance_target_var = tk.StringVar(value="100.00")
+        self.start_balance_var = tk.StringVar(value="0.00")
+        self.balance_start_date_var = tk.StringVar(value=datetime.date.today().isoformat())
+        self.balance_srb_events_var = tk.StringVar(value="")
+        self.purchase_cost_var = tk.StringVar(value="0.00")
+        # Planned purchases from the loaded file, as arrays from timeline.read_events_file
+        self._planned_events = None
+
         self._create_widgets()
 
     def _create_widgets(self):
@@ -81,12 +116,79 @@ class GoalCalculator:
         self.specific_parcel_combo.grid(row=row, column=2, sticky="ew", pady=2)
 
         row += 1
-        self.calculate_goal_button = ttk.Button(self.parent_frame, text="Calculate Parcels Needed", command=self._show_goal_results_window)
+        self.calculate_goal_button = ttk.Button(self.parent_frame, text="Calculate Parcels Needed", command=self._calculate_goal)
         self.calculate_goal_button.grid(row=row, column=0, columnspan=3, pady=10)
 
         self.goal_info_label = ttk.Label(self.parent_frame, text="Click 'Calculate Parcels Needed' to see results.")
         self.goal_info_label.grid(row=row+1, column=0, columnspan=3, sticky="w", pady=5)
-        
+
+        self.batch_goal_button = ttk.Button(self.parent_frame, text="Batch Solve Goals from File...", command=self._solve_goal_file)
+        self.batch_goal_button.grid(row=row+2, column=0, columnspan=3, pady=(5, 10))
+
+        # --- Results panel, built once and updated in place for every calculation ---
+        output_font = ("Courier", 10)
+        results_frame = ttk.LabelFrame(self.parent_frame, text="Goal Results")
+        results_frame.grid(row=row+3, column=0, columnspan=3, sticky="ew", padx=5, pady=5)
+        self.result_labels = {}
+        for result_row, (key, text) in enumerate([("target", "Target:"), ("boosts", "Boosts:"), ("total", "Parcels Needed:")]):
+            ttk.Label(results_frame, text=text, font=("Helvetica", 10, "bold")).grid(row=result_row, column=0, sticky="w", padx=5, pady=1)
+            self.result_labels[key] = ttk.Label(results_frame, text="N/A", font=output_font)
+            self.result_labels[key].grid(row=result_row, column=1, sticky="w", padx=5, pady=1)
+        self.breakdown_labels = {}
+        for result_row, parcel_type in enumerate(constants.PARCEL_RATES_PER_SECOND, start=3):
+            ttk.Label(results_frame, text=f"    - {parcel_type.capitalize()}:", font=output_font).grid(row=result_row, column=0, sticky="w", padx=5)
+            self.breakdown_labels[parcel_type] = ttk.Label(results_frame, text="-", font=output_font)
+            self.breakdown_labels[parcel_type].grid(row=result_row, column=1, sticky="w", padx=5)
+
+        self.alternatives_button = ttk.Button(results_frame, text="Show Other Parcel Compositions",
+                                              command=self._toggle_alternative_compositions)
+        self.alternatives_button.grid(row=7, column=0, columnspan=2, pady=(10, 5))
+        self.alternatives_frame = ttk.Frame(results_frame)
+        self.alternatives_frame.grid(row=8, column=0, columnspan=2, sticky="w", padx=5, pady=(0, 5))
+        ttk.Label(self.alternatives_frame, text="Required Parcels if acquiring ONLY one type:",
+                  font=("Helvetica", 10, "bold")).grid(row=0, column=0, columnspan=2, sticky="w")
+        self.alternative_labels = {}
+        for result_row, parcel_type in enumerate(constants.PARCEL_RATES_PER_SECOND, start=1):
+            ttk.Label(self.alternatives_frame, text=f"  - {parcel_type.capitalize()}:", font=output_font).grid(row=result_row, column=0, sticky="w")
+            self.alternative_labels[parcel_type] = ttk.Label(self.alternatives_frame, text="-", font=output_font)
+            self.alternative_labels[parcel_type].grid(row=result_row, column=1, sticky="w", padx=5)
+        self.alternatives_frame.grid_remove()
+
+        # --- History of past results (newest first); selecting one shows it in the panel ---
+        history_frame = ttk.LabelFrame(self.parent_frame, text=f"Recent Goals (last {GOAL_HISTORY_LIMIT})")
+        history_frame.grid(row=row+4, column=0, columnspan=3, sticky="nsew", padx=5, pady=5)
+        history_columns = ("target", "timeframe", "boosts", "mode", "total")
+        self.history_tree = ttk.Treeview(history_frame, columns=history_columns, show="headings", height=6)
+        for column, text, width in [("target", "Target", 90), ("timeframe", "Per", 70), ("boosts", "Boost Multiplier", 110),
+                                    ("mode", "Parcels", 80), ("total", "Parcels Needed", 120)]:
+            self.history_tree.heading(column, text=text)
+            self.history_tree.column(column, width=width, anchor="e" if column in ("target", "total") else "w")
+        self.history_tree.pack(fill="both", expand=True, padx=5, pady=5)
+        self.history_tree.bind("<<TreeviewSelect>>", self._on_history_select)
+
+        # --- Date on which the cumulative balance reaches a target ---
+        balance_frame = ttk.LabelFrame(self.parent_frame, text="When Will My Balance Reach a Target?")
+        balance_frame.grid(row=row+5, column=0, columnspan=3, sticky="ew", padx=5, pady=5)
+        for field_row, (text, var) in enumerate([("Target Balance ($):", self.balance_target_var),
+                                                 ("Balance on Start Date ($):", self.start_balance_var),
+                                                 ("Start Date (YYYY-MM-DD):", self.balance_start_date_var),
+                                                 ("SRB Events (YYYY-MM-DD:hours, ...):", self.balance_srb_events_var),
+                                                 ("Cost per Planned Parcel ($):", self.purchase_cost_var)]):
+            ttk.Label(balance_frame, text=text).grid(row=field_row, column=0, sticky="w", padx=5, pady=2)
+            ttk.Entry(balance_frame, width=40 if var is self.balance_srb_events_var else 12,
+                      textvariable=var).grid(row=field_row, column=1, sticky="w", padx=5, pady=2)
+        ttk.Label(balance_frame, text="(blank: SRB hours per month spread evenly)").grid(row=3, column=2, sticky="w", padx=5)
+        ttk.Button(balance_frame, text="Load Planned Purchases...", command=self._load_planned_purchases).grid(row=5, column=0, sticky="w", padx=5, pady=2)
+        self.planned_purchases_label = ttk.Label(balance_frame, text="No planned purchases.")
+        self.planned_purchases_label.grid(row=5, column=1, columnspan=2, sticky="w", padx=5, pady=2)
+        balance_button_frame = ttk.Frame(balance_frame)
+        balance_button_frame.grid(row=6, column=0, columnspan=3, pady=5)
+        ttk.Button(balance_button_frame, text="Solve Date", command=self._solve_balance_date).pack(side="left", padx=5)
+        self.fleet_target_button = ttk.Button(balance_button_frame, text="Batch Solve Fleet...", command=self._solve_fleet_dates)
+        self.fleet_target_button.pack(side="left", padx=5)
+        self.balance_result_label = ttk.Label(balance_frame, text="N/A", font=("Courier", 10))
+        self.balance_result_label.grid(row=7, column=0, columnspan=3, sticky="w", padx=5, pady=(0, 5))
+
         self.parent_frame.grid_columnconfigure(1, weight=1)
         self.parent_frame.grid_columnconfigure(2, weight=1)
 
@@ -132,40 +234,22 @@ class GoalCalculator:
             else:
                 self._last_effective_rate_multiplier = 1.0
 
-            seconds_in_target_timeframe = utils.get_seconds_in_timeframe(self._last_target_timeframe_str)
-            if seconds_in_target_timeframe == 0:
-                messagebox.showerror("Calculation Error", "Invalid target timeframe selected.")
+            # The 'mixed' rate follows the active profile's rarity mix
+            inputs = self.get_user_inputs_callback()
+            if inputs is None:
                 return False
-
-            self._last_target_earnings_per_second = self._last_target_amount / seconds_in_target_timeframe
-            
-            self._last_total_parcels_needed = 0
-            self._last_parcels_breakdown = {}
-
-            if self._last_calculation_mode == "mixed":
-                avg_parcel_base_rate = utils.calculate_average_mixed_parcel_rate_per_second()
-                avg_parcel_boosted_rate = avg_parcel_base_rate * self._last_effective_rate_multiplier
-
-                if avg_parcel_boosted_rate == 0:
+            try:
+                self._last_total_parcels_needed, self._last_parcels_breakdown = utils.calculate_parcels_for_goal(
+                    self._last_target_amount, self._last_target_timeframe_str, self._last_effective_rate_multiplier,
+                    self._last_calculation_mode, self._last_specific_parcel_type, inputs["rate_profile"].parcel_probabilities)
+            except ZeroDivisionError:
+                if self._last_calculation_mode == "mixed":
                     messagebox.showerror("Calculation Error", "Average boosted parcel rate is zero, cannot calculate. Check inputs or assumed boosts.")
-                    return False
-                
-                self._last_total_parcels_needed = self._last_target_earnings_per_second / avg_parcel_boosted_rate
-                
-                for parcel_type, prob in constants.PARCEL_PROBABILITIES.items():
-                    self._last_parcels_breakdown[parcel_type] = self._last_total_parcels_needed * prob
-                
-            elif self._last_calculation_mode == "specific":
-                parcel_base_rate = constants.PARCEL_RATES_PER_SECOND[self._last_specific_parcel_type]
-                parcel_boosted_rate = parcel_base_rate * self._last_effective_rate_multiplier
-
-                if parcel_boosted_rate == 0:
+                else:
                     messagebox.showerror("Calculation Error", f"Boosted rate for {self._last_specific_parcel_type} parcel is zero, cannot calculate. Check inputs or assumed boosts.")
-                    return False
-                
-                self._last_total_parcels_needed = self._last_target_earnings_per_second / parcel_boosted_rate
-                self._last_parcels_breakdown = {}
-                
+                return False
+            self._last_target_earnings_per_second = self._last_target_amount / utils.get_seconds_in_timeframe(self._last_target_timeframe_str)
+
             return True
 
         except ValueError:
@@ -175,103 +259,258 @@ class GoalCalculator:
             messagebox.showerror("Calculation Error", f"An unexpected error occurred: {e}")
             return False
 
-    def _show_goal_results_window(self):
+    def _calculate_goal(self):
+        """Calculates the goal, shows it in the results panel and adds it to the history."""
         if not self._perform_goal_calculation():
             return
+        result = GoalResult(self._last_target_amount, self._last_target_timeframe_str, self._last_assume_boosts,
+                            self._last_assumed_badges, self._last_assumed_rent_boost_percentage,
+                            self._last_effective_rate_multiplier, self._last_calculation_mode,
+                            self._last_specific_parcel_type, self._last_total_parcels_needed,
+                            dict(self._last_parcels_breakdown))
+
+        # The history deque and the history rows stay in the same order, newest first
+        self._history.appendleft(result)
+        self.history_tree.insert("", 0, values=(f"${result.target_amount:.2f}", result.timeframe,
+                                                f"x{result.effective_multiplier:.2f}" if result.assume_boosts else "None",
+                                                result.parcel_type if result.mode == "specific" else "mixed",
+                                                f"{result.total_needed:,.0f}"))
+        rows = self.history_tree.get_children()
+        if len(rows) > len(self._history):
+            self.history_tree.delete(*rows[len(self._history):])
+        self._show_goal_result(result)
+
+    def _on_history_select(self, event=None):
+        selection = self.history_tree.selection()
+        if selection:
+            self._show_goal_result(self._history[self.history_tree.index(selection[0])])
+
+    def _show_goal_result(self, result):
+        """Updates the results panel in place; no widgets are created per calculation."""
+        self._shown_result = result
+        self.goal_info_label.config(text=f"Showing goal of ${result.target_amount:.2f} per {result.timeframe}.")
+        self.result_labels["target"].config(text=f"${result.target_amount:.2f} per {result.timeframe}")
+        if result.assume_boosts:
+            assumed_passport_multiplier = utils.get_passport_boost_multiplier(result.assumed_badges)
+            self.result_labels["boosts"].config(
+                text=f"{result.assumed_badges} badges (x{assumed_passport_multiplier:.2f}), "
+                     f"{result.assumed_rent_boost:.0f}x rent boost (Effective Multiplier: x{result.effective_multiplier:.2f})")
+        else:
+            self.result_labels["boosts"].config(text="Calculating without assumed boosts.")
 
-        top = tk.Toplevel(self.parent_frame)
-        top.title("Parcels Needed for Goal")
-        top.geometry("550x450")
-        top.resizable(False, False)
-        top.grab_set()
-        top.focus_set()
-
-        frame = ttk.Frame(top, padding="15")
-        frame.pack(expand=True, fill="both")
+        if result.mode == "mixed":
+            self.result_labels["total"].config(text=f"{result.total_needed:,.0f} (mixed, based on probabilities)")
+            for parcel_type, label in self.breakdown_labels.items():
+                label.config(text=f"{result.breakdown.get(parcel_type, 0):,.0f}")
+        else:
+            self.result_labels["total"].config(text=f"{result.total_needed:,.0f} {result.parcel_type.capitalize()}")
+            for label in self.breakdown_labels.values():
+                label.config(text="-")
 
-        ttk.Label(frame, text="--- Goal Calculation Results ---", font=("Helvetica", 12, "bold")).pack(pady=(0, 10))
+        # Required parcels if acquiring only one type
+        target_earnings_per_second = result.target_amount / utils.get_seconds_in_timeframe(result.timeframe)
+        for parcel_type, base_rate in constants.PARCEL_RATES_PER_SECOND.items():
+            boosted_rate = base_rate * result.effective_multiplier
+            if boosted_rate == 0:
+                needed_parcels = "N/A (Rate is Zero)"
+            else:
+                needed_parcels = f"{target_earnings_per_second / boosted_rate:,.0f} parcels"
+            self.alternative_labels[parcel_type].config(text=needed_parcels)
 
-        ttk.Label(frame, text="Goal Summary:", font=("Helvetica", 10, "bold")).pack(anchor="w", pady=(0, 5))
-        ttk.Label(frame, text=f"  Target: ${self._last_target_amount:.2f} per {self._last_target_timeframe_str}").pack(anchor="w")
-        
-        if self._last_assume_boosts:
-            assumed_passport_multiplier = utils.get_passport_boost_multiplier(self._last_assumed_badges)
-            display_assumed_rent_boost = self._last_assumed_rent_boost_percentage
-            
-            ttk.Label(frame, text=f"  Assumed Badges: {self._last_assumed_badges} (Passport Boost: x{assumed_passport_multiplier:.2f})").pack(anchor="w")
-            ttk.Label(frame, text=f"  Assumed Rent Boost: {display_assumed_rent_boost:.0f}x (Effective Multiplier: x{self._last_effective_rate_multiplier:.2f})").pack(anchor="w")
+    def _toggle_alternative_compositions(self):
+        if self.alternatives_frame.winfo_ismapped():
+            self.alternatives_frame.grid_remove()
+            self.alternatives_button.config(text="Show Other Parcel Compositions")
         else:
-            ttk.Label(frame, text="  Calculating without assumed boosts.").pack(anchor="w")
+            self.alternatives_frame.grid()
+            self.alternatives_button.config(text="Hide Other Parcel Compositions")
+
+    def _solve_goal_file(self):
+        """Solves a CSV/JSONL file of goals and streams the answers to another file."""
+        input_path = filedialog.askopenfilename(filetypes=[("Goal files", "*.csv *.jsonl"), ("All files", "*.*")],
+                                                title="Open Goal File")
+        if not input_path:
+            return
+        output_path = filedialog.asksaveasfilename(defaultextension=".csv",
+                                                   filetypes=[("CSV files", "*.csv"), ("JSON Lines files", "*.jsonl")],
+                                                   title="Save Goal Results")
+        if not output_path:
+            return
+        inputs = self.get_user_inputs_callback()
+        if inputs is None:
+            return
 
-        ttk.Label(frame, text="\nParcels Needed:", font=("Helvetica", 10, "bold")).pack(anchor="w", pady=(5, 5))
-        output_font = ("Courier", 10)
+        start = time.perf_counter()
+        mix = inputs["rate_profile"].parcel_probabilities
 
-        if self._last_calculation_mode == "mixed":
-            ttk.Label(frame, text=f"  Total estimated parcels needed: {self._last_total_parcels_needed:,.0f}", font=output_font).pack(anchor="w")
-            ttk.Label(frame, text="\nBreakdown based on probabilities:", font=("Helvetica", 10, "bold")).pack(anchor="w")
-            for parcel_type, count in self._last_parcels_breakdown.items():
-                ttk.Label(frame, text=f"    - {parcel_type.capitalize():<9}: {count:,.0f}", font=output_font).pack(anchor="w")
-            
-        elif self._last_calculation_mode == "specific":
-            ttk.Label(frame, text=f"  Number of {self._last_specific_parcel_type.capitalize()} parcels needed: {self._last_total_parcels_needed:,.0f}", font=output_font).pack(anchor="w")
-            
-        ttk.Button(frame, text="Show Other Parcel Compositions", command=self._show_alternative_compositions).pack(pady=15)
-        ttk.Button(frame, text="Close", command=top.destroy).pack(pady=5)
-
-    def _show_alternative_compositions(self):
-        top = tk.Toplevel(self.parent_frame)
-        top.title("Alternative Parcel Compositions")
-        top.geometry("450x330")
-        top.resizable(False, False)
-        top.grab_set()
-        top.focus_set()
-
-        frame = ttk.Frame(top, padding="15")
-        frame.pack(expand=True, fill="both")
-
-        ttk.Label(frame, text="Target Goal Summary:", font=("Helvetica", 10, "bold")).pack(anchor="w", pady=(0, 5))
-        ttk.Label(frame, text=f"  Target Amount: ${self._last_target_amount:.2f} per {self._last_target_timeframe_str}").pack(anchor="w")
-        
-        if self._last_assume_boosts:
-            assumed_passport_multiplier = utils.get_passport_boost_multiplier(self._last_assumed_badges)
-            display_assumed_rent_boost = self._last_assumed_rent_boost_percentage
+        def solve(job):
+            # The job's progress report raises JobCancelled between chunks once Cancel is pressed
+            return goal_batch.solve_goal_file(input_path, output_path, mix=mix,
+                                              progress=lambda solved: job.report_progress(None, f"{solved:,} goals solved"))
 
-            ttk.Label(frame, text=f"  Assumed Badges: {self._last_assumed_badges} (Passport Boost: x{assumed_passport_multiplier:.2f})").pack(anchor="w")
-            ttk.Label(frame, text=f"  Assumed Rent Boost: {display_assumed_rent_boost:.0f}x (Effective Multiplier: x{self._last_effective_rate_multiplier:.2f})").pack(anchor="w")
-        else:
-            ttk.Label(frame, text="  No boosts assumed for this goal.").pack(anchor="w")
+        def on_done(job, solved):
+            self.batch_goal_button.config(state="normal")
+            elapsed = time.perf_counter() - start
+            messagebox.showinfo("Batch Goals Solved", f"Solved {solved:,} goals in {elapsed:.2f} s.\nResults saved to {output_path}")
 
-        ttk.Label(frame, text="\nRequired Parcels if acquiring ONLY one type:", font=("Helvetica", 10, "bold")).pack(anchor="w", pady=(10, 5))
+        def on_error(job, e):
+            self.batch_goal_button.config(state="normal")
+            if isinstance(e, (ValueError, KeyError)):
+                messagebox.showerror("Input Error", f"Could not solve the goal file: {e}")
+            else:
+                messagebox.showerror("Calculation Error", f"An unexpected error occurred: {e}")
 
-        output_font = ("Courier", 10)
+        self.batch_goal_button.config(state="disabled")
+        self.job_runner.run_in_thread("Solving goal file", solve, on_done=on_done, on_error=on_error,
+                                      on_cancelled=lambda job: self.batch_goal_button.config(state="normal"))
 
-        for parcel_type, base_rate in constants.PARCEL_RATES_PER_SECOND.items():
-            boosted_rate = base_rate * self._last_effective_rate_multiplier
-            
-            if boosted_rate == 0:
-                needed_parcels = "N/A (Rate is Zero)"
-            else:
-                needed_parcels = self._last_target_earnings_per_second / boosted_rate
-                needed_parcels = f"{needed_parcels:,.0f}"
+    def _load_planned_purchases(self):
+        file_path = filedialog.askopenfilename(filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+                                               title="Open Planned Purchases")
+        if not file_path:
+            return
+        try:
+            self._planned_events = timeline.read_events_file(file_path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Input Error", f"Could not read the planned purchases: {e}")
+            return
+        self.planned_purchases_label.config(text=f"{len(self._planned_events[0]):,} purchases from {file_path}")
+
+    def _read_balance_inputs(self):
+        """Returns (target, start balance, start date, SRB events or None, parcel cost); raises ValueError."""
+        target = float(self.balance_target_var.get())
+        start_balance = float(self.start_balance_var.get() or 0)
+        start_date = rate_epochs.parse_date(self.balance_start_date_var.get())
+        srb_text = self.balance_srb_events_var.get().strip()
+        srb_events = earnings_model.parse_srb_events(srb_text) if srb_text else None
+        parcel_cost = float(self.purchase_cost_var.get() or 0)
+        if parcel_cost < 0:
+            raise ValueError("The parcel cost cannot be negative.")
+        return target, start_balance, start_date, srb_events, parcel_cost
+
+    def _solve_balance_date(self):
+        """Solves the date the main account's balance reaches the target, with the planned purchases."""
+        inputs = self.get_user_inputs_callback()
+        if inputs is None:
+            return
+        try:
+            target, start_balance, start_date, srb_events, parcel_cost = self._read_balance_inputs()
+        except ValueError as e:
+            messagebox.showerror("Input Error", f"Please check the balance inputs: {e}")
+            return
 
-            text = f"  - {parcel_type.capitalize():<9}: {needed_parcels:>10} parcels"
-            ttk.Label(frame, text=text, font=output_font).pack(anchor="w")
+        fictive_multiplier = earnings_model.badge_multiplier(inputs) if inputs["fictive_badge_boost_enabled"] else None
+        account = timeline.AcquisitionTimeline(start_date, inputs["parcels"], inputs["badge_count"],
+                                               *(self._planned_events or ([], [], [])), inputs["selected_region"],
+                                               inputs["boost_hours"], inputs["srb_boost_enabled"], fictive_multiplier,
+                                               inputs["rate_profile"].srb_hours_per_month)
+        reached = target_solver.date_reaching(account, target, start_balance, inputs["boost_hours"],
+                                              inputs["srb_boost_enabled"], srb_events, parcel_cost,
+                                              inputs["rate_profile"].srb_hours_per_month)
+        if reached is None:
+            self.balance_result_label.config(text=f"${target:,.2f} is never reached: the balance stops growing below it.")
+        else:
+            self.balance_result_label.config(text=f"${target:,.2f} reached on {reached.isoformat()} "
+                                                  f"({(reached - start_date).days:,} days from {start_date.isoformat()})")
+
+    def _solve_fleet_dates(self):
+        """Solves the target date for every account of a portfolio store and writes them to a CSV file."""
+        try:
+            target, start_balance, start_date, srb_events, _ = self._read_balance_inputs()
+        except ValueError as e:
+            messagebox.showerror("Input Error", f"Please check the balance inputs: {e}")
+            return
+        # Accounts keep their own holdings and boosts; only the active profile's SRB hours are shared
+        inputs = self.get_user_inputs_callback()
+        if inputs is None:
+            return
+        srb_hours_per_month = inputs["rate_profile"].srb_hours_per_month
+        store_path = filedialog.askopenfilename(filetypes=[("Portfolio stores", "*.npy"), ("All files", "*.*")],
+                                                title="Open Portfolio Store")
+        if not store_path:
+            return
+        output_path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files", "*.csv")],
+                                                   title="Save Target Dates")
+        if not output_path:
+            return
+
+        def solve(job):
+            store = portfolio_store.PortfolioStore.open(store_path)
+            job.report_progress(None, f"Solving {len(store):,} accounts")
+            days = target_solver.fleet_days_to_target(store, target, start_date, start_balance, srb_events,
+                                                      srb_hours_per_month=srb_hours_per_month)
+            job.report_progress(None, "Writing dates")
+            start_day = start_date.toordinal()
+            with open(output_path, 'w', newline='') as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(["account", "date_reached", "days"])
+                for first in range(0, len(store), portfolio_store.IMPORT_CHUNK_ROWS):
+                    chunk = days[first:first + portfolio_store.IMPORT_CHUNK_ROWS]
+                    names = store.records["account"][first:first + portfolio_store.IMPORT_CHUNK_ROWS]
+                    for name, day in zip(names, chunk.tolist()):
+                        if np.isfinite(day):
+                            writer.writerow([name.decode("utf-8", "replace"),
+                                             datetime.date.fromordinal(int(np.ceil(day))).isoformat(), int(np.ceil(day)) - start_day])
+                        else:
+                            writer.writerow([name.decode("utf-8", "replace"), "never", ""])
+            return len(days), int(np.isfinite(days).sum())
+
+        def on_done(job, counts):
+            self.fleet_target_button.config(state="normal")
+            accounts, reached = counts
+            messagebox.showinfo("Fleet Solved", f"{reached:,} of {accounts:,} accounts reach ${target:,.2f}.\n"
+                                                f"Dates saved to {output_path}")
+
+        def on_error(job, e):
+            self.fleet_target_button.config(state="normal")
+            messagebox.showerror("Calculation Error", f"Could not solve the fleet: {e}")
+
+        self.fleet_target_button.config(state="disabled")
+        self.job_runner.run_in_thread("Solving fleet target dates", solve, on_done=on_done, on_error=on_error,
+                                      on_cancelled=lambda job: self.fleet_target_button.config(state="normal"))
+
+    def get_session_variables(self):
+        """Returns the tab's input variables, keyed by name, for session save/restore."""
+        return {
+            "target_amount": self.target_amount_var,
+            "target_timeframe": self.target_timeframe_var,
+            "assume_boosts": self.assume_boosts_var,
+            "assumed_badges": self.assumed_badges_var,
+            "assumed_rent_boost_percent": self.assumed_rent_boost_percent_var,
+            "calc_mode": self.calc_mode_var,
+            "specific_parcel_type": self.specific_parcel_type_var,
+            "balance_target": self.balance_target_var,
+            "start_balance": self.start_balance_var,
+            "balance_start_date": self.balance_start_date_var,
+            "balance_srb_events": self.balance_srb_events_var,
+            "purchase_cost": self.purchase_cost_var,
+        }
+
+    def refresh_input_states(self):
+        """Enables or disables the dependent entries to match restored input values."""
+        self._toggle_assumed_boosts_entries()
+        self._toggle_specific_parcel_combo()
 
-        ttk.Button(frame, text="Close", command=top.destroy).pack(pady=20)
-        
     def get_export_data(self):
-        """Returns the last calculated goal data in a dictionary format for export."""
+        """Returns the goal shown in the results panel (the last calculated one unless a history entry is selected) for export."""
+        result = self._shown_result
+        if result is None:
+            result = GoalResult(self._last_target_amount, self._last_target_timeframe_str, self._last_assume_boosts,
+                                self._last_assumed_badges, self._last_assumed_rent_boost_percentage,
+                                self._last_effective_rate_multiplier, self._last_calculation_mode,
+                                self._last_specific_parcel_type, self._last_total_parcels_needed,
+                                dict(self._last_parcels_breakdown))
         data = {
-            "target_amount": f"${self._last_target_amount:.2f}",
-            "target_timeframe": self._last_target_timeframe_str,
-            "assume_boosts_for_goal": self._last_assume_boosts,
-            "assumed_badges": self._last_assumed_badges,
-            "assumed_rent_boost_multiplier": f"{self._last_assumed_rent_boost_percentage:.0f}x",
-            "calculation_mode": self._last_calculation_mode,
-            "specific_parcel_type": self._last_specific_parcel_type,
-            "total_parcels_needed": f"{self._last_total_parcels_needed:,.0f}",
+            "target_amount": f"${result.target_amount:.2f}",
+            "target_timeframe": result.timeframe,
+            "assume_boosts_for_goal": result.assume_boosts,
+            "assumed_badges": result.assumed_badges,
+            "assumed_rent_boost_multiplier": f"{result.assumed_rent_boost:.0f}x",
+            "calculation_mode": result.mode,
+            "specific_parcel_type": result.parcel_type,
+            "total_parcels_needed": f"{result.total_needed:,.0f}",
         }
-        if self._last_calculation_mode == "mixed" and self._last_parcels_breakdown:
-            breakdown_data = {k: f"{v:,.0f}" for k, v in self._last_parcels_breakdown.items()}
+        if result.mode == "mixed" and result.breakdown:
+            breakdown_data = {k: f"{v:,.0f}" for k, v in result.breakdown.items()}
             data["parcels_breakdown"] = breakdown_data
         return data
\ No newline at end of file
@@ -2,16 +2,26 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import json
 import sys
 
 # Import our custom modules
 import constants
 import utils
-from widgets import IntegerEntry
+import calibration
+import rate_profile
+from widgets import IntegerEntry, JobStatusBar
+from workers import BackgroundJobRunner
+from session import SessionStore
 from current_earnings_calculator import CurrentEarningsCalculator
 from goal_calculator import GoalCalculator
 from next_tier_calculator import NextTierCalculator
 from custom_tier_calculator import CustomTierCalculator
+from payback_calculator import PaybackCalculator
+from reinvestment_calculator import ReinvestmentCalculator
+from scenario_calculator import ScenarioCalculator
+from boost_scheduler_calculator import BoostSchedulerCalculator
+from timeline_calculator import TimelineCalculator
 
 # External libraries for export (will need to be installed)
 try:
@@ -120,10 +130,24 @@ class AtlasEarthApp:
         self.fictive_badge_boost_enabled = tk.BooleanVar(value=False)
         self.fictive_badge_boost_percent_var = tk.StringVar(value="0.0")
         self.selected_region_var = tk.StringVar(value="United States")
+        # Profile fitted from a rent log (JSON from calibration.fit_rent_log); blank uses the constants defaults.
+        # The active RateProfile travels to the calculators in get_user_inputs()["rate_profile"].
+        self.rate_profile = rate_profile.DEFAULT_PROFILE
+        self.calibration_profile_var = tk.StringVar(value="")
+        self.calibration_profile_var.trace_add("write", lambda *args: self._apply_calibration_profile())
+
+        # --- Background Jobs ---
+        # Exports and heavy calculations run on worker threads so the window stays responsive
+        self.jobs = BackgroundJobRunner(master)
+        master.protocol("WM_DELETE_WINDOW", self._on_exit)
 
         # --- Setup Menu Bar ---
         self._create_menu_bar()
 
+        # --- Status Bar (packed before the canvas so it keeps its place at the bottom) ---
+        self.job_status_bar = JobStatusBar(master, self.jobs)
+        self.job_status_bar.pack(side="bottom", fill="x")
+
         # --- Setup Scrollable Frame ---
         self.main_canvas = tk.Canvas(master)
         self.main_canvas.pack(side="left", fill="both", expand=True)
@@ -181,6 +205,8 @@ class AtlasEarthApp:
                                     variable=self.srb_boost_enabled,
                                     command=self.update_all_calculations)
         srb_check.pack(side="left", padx=10)
+        self.profile_label = ttk.Label(boost_frame, text="Profile: Defaults")
+        self.profile_label.pack(side="left", padx=10)
 
         # Badges Owned Input and Fictive Badge Boost - NOW USING IntegerEntry for Badges Owned
         badge_frame = ttk.LabelFrame(input_frame, text="Badge Info")
@@ -212,7 +238,7 @@ class AtlasEarthApp:
         # Goal Calculator Tab
         self.goal_calculator_tab = ttk.Frame(self.notebook)
         self.notebook.add(self.goal_calculator_tab, text="Parcels for Goal")
-        self.goal_calculator = GoalCalculator(self.goal_calculator_tab, self.get_user_inputs)
+        self.goal_calculator = GoalCalculator(self.goal_calculator_tab, self.get_user_inputs, self.jobs)
 
         # Next Tier Tab
         self.next_tier_tab = ttk.Frame(self.notebook)
@@ -222,19 +248,66 @@ class AtlasEarthApp:
         # Placeholder Tabs
         self.custom_tier_tab = ttk.Frame(self.notebook)
         self.notebook.add(self.custom_tier_tab, text="Custom Tier")
-        self.custom_tier_calculator = CustomTierCalculator(self.custom_tier_tab, self.get_user_inputs) # Instantiate it
+        self.custom_tier_calculator = CustomTierCalculator(self.custom_tier_tab, self.get_user_inputs, self.jobs) # Instantiate it
+
+        # Payback Tab
+        self.payback_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.payback_tab, text="Payback / ROI")
+        self.payback_calculator = PaybackCalculator(self.payback_tab, self.get_user_inputs, self.jobs)
+
+        # Reinvestment Tab (compounding strategies compared side by side)
+        self.reinvestment_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.reinvestment_tab, text="Reinvestment")
+        self.reinvestment_calculator = ReinvestmentCalculator(self.reinvestment_tab, self.get_user_inputs)
+
+        # Scenarios Tab (what-if changes to the inputs compared side by side)
+        self.scenario_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.scenario_tab, text="Scenarios")
+        self.scenario_calculator = ScenarioCalculator(self.scenario_tab, self.get_user_inputs)
 
         self.additional_info_tab = ttk.Frame(self.notebook)
         self.notebook.add(self.additional_info_tab, text="Additional Info")
 
+        # Boost Schedule Tab (ad views and SRB windows through the day)
         self.srb_event_tab = ttk.Frame(self.notebook)
-        self.notebook.add(self.srb_event_tab, text="SRB Event")
+        self.notebook.add(self.srb_event_tab, text="Boost Schedule")
+        self.boost_scheduler_calculator = BoostSchedulerCalculator(self.srb_event_tab, self.get_user_inputs, self.jobs)
+
+        # Timeline Tab (cumulative earnings across dated purchases)
+        self.timeline_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.timeline_tab, text="Timeline")
+        self.timeline_calculator = TimelineCalculator(self.timeline_tab, self.get_user_inputs, self.jobs)
         
         # --- Buttons ---
         button_frame = ttk.Frame(self.content_frame)
         button_frame.pack(pady=10)
         ttk.Button(button_frame, text="Clear All", command=self.clear_all).pack(side="left", padx=5)
 
+        # --- Session Save/Restore ---
+        # Inputs are restored from the last run, then autosaved as they change
+        self.session = SessionStore(master)
+        self.session.register_all("main", {
+            **{f"{p_type}_parcels": var for p_type, var in self.parcel_vars.items()},
+            "badge_count": self.badge_count_var,
+            "boost_hours": self.boost_hours_var,
+            "srb_boost_enabled": self.srb_boost_enabled,
+            "fictive_badge_boost_enabled": self.fictive_badge_boost_enabled,
+            "fictive_badge_boost_percent": self.fictive_badge_boost_percent_var,
+            "selected_region": self.selected_region_var,
+            "calibration_profile": self.calibration_profile_var,
+        })
+        self.session.register_all("current_earnings", self.current_earnings_calculator.get_session_variables())
+        self.session.register_all("goal", self.goal_calculator.get_session_variables())
+        self.session.register_all("next_tier", self.next_tier_calculator.get_session_variables())
+        self.session.register_all("custom_tier", self.custom_tier_calculator.get_session_variables())
+        self.session.register_all("payback", self.payback_calculator.get_session_variables())
+        self.session.register_all("reinvestment", self.reinvestment_calculator.get_session_variables())
+        self.session.register_all("scenarios", self.scenario_calculator.get_session_variables())
+        self.session.register_all("boost_schedule", self.boost_scheduler_calculator.get_session_variables())
+        self.session.register_all("timeline", self.timeline_calculator.get_session_variables())
+        if self.session.restore():
+            self._refresh_input_states()
+
         # Initial calculation update
         self.update_all_calculations()
 
@@ -247,11 +320,19 @@ class AtlasEarthApp:
 
         file_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="File", menu=file_menu)
+        file_menu.add_command(label="Open Session...", command=self._open_session)
+        file_menu.add_command(label="Save Session As...", command=self._save_session_as)
+        file_menu.add_separator()
         file_menu.add_command(label="Export to XLSX", command=self._export_to_xlsx, state="normal" if openpyxl else "disabled")
         file_menu.add_command(label="Export to CSV", command=self._export_to_csv)
         file_menu.add_command(label="Export to PDF", command=self._export_to_pdf, state="normal" if FPDF else "disabled")
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.master.quit)
+        file_menu.add_command(label="Calibrate from Rent Log...", command=self._calibrate_from_rent_log)
+        file_menu.add_command(label="Open Profile...", command=self._open_profile)
+        file_menu.add_command(label="Save Profile As...", command=self._save_profile_as)
+        file_menu.add_command(label="Use Default Profile", command=lambda: self.calibration_profile_var.set(""))
+        file_menu.add_separator()
+        file_menu.add_command(label="Exit", command=self._on_exit)
 
         help_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Help", menu=help_menu)
@@ -261,6 +342,102 @@ class AtlasEarthApp:
         menubar.add_cascade(label="Settings", menu=settings_menu)
         settings_menu.add_command(label="API/AI Settings (Placeholder)", command=self._open_settings_dialog)
 
+    def _on_exit(self):
+        """Cancels running background jobs and saves the session before closing the window."""
+        self.jobs.shutdown()
+        try:
+            self.session.compact()
+        except OSError:
+            pass  # The journal written so far still restores the session
+        self.master.quit()
+
+    def _refresh_input_states(self):
+        """Matches the enabled/disabled entries to the current (e.g. just restored) input values."""
+        self.fictive_badge_boost_entry.config(state="normal" if self.fictive_badge_boost_enabled.get() else "disabled")
+        self.goal_calculator.refresh_input_states()
+
+    def _save_session_as(self):
+        file_path = filedialog.asksaveasfilename(defaultextension=".json",
+                                                filetypes=[("Session files", "*.json")],
+                                                title="Save Session As")
+        if not file_path:
+            return
+        try:
+            self.session.save_as(file_path)
+        except OSError as e:
+            messagebox.showerror("Session Error", f"Failed to save the session: {e}")
+
+    def _open_session(self):
+        file_path = filedialog.askopenfilename(filetypes=[("Session files", "*.json"), ("All files", "*.*")],
+                                              title="Open Session")
+        if not file_path:
+            return
+        try:
+            self.session.load(file_path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Session Error", f"Failed to open the session: {e}")
+            return
+        self._refresh_input_states()
+        self.update_all_calculations()
+
+    def _calibrate_from_rent_log(self):
+        """Fits SRB hours, realized boost hours and the rarity mix to a log of rent actually earned."""
+        file_path = filedialog.askopenfilename(filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+                                              title="Open Rent Log")
+        if not file_path:
+            return
+
+        def fit_log(job):
+            job.report_progress(None, "Reading the rent log")
+            log = calibration.read_rent_log(file_path)
+            job.report_progress(None, f"Fitting {len(log['days']):,} days")
+            return calibration.fit_rent_log(log)
+
+        def offer_profile(job, profile):
+            if messagebox.askyesno("Calibration Result", calibration.describe_profile(profile) +
+                                   "\n\nUse these values instead of the defaults? The ad boost hours input is set "
+                                   "to the realized hours (rounded to whole hours)."):
+                self.boost_hours_var.set(str(round(profile["boost_hours"])))
+                self.calibration_profile_var.set(json.dumps(profile))
+
+        self.jobs.run_in_thread(
+            "Rent log calibration", fit_log, on_done=offer_profile,
+            on_error=lambda job, e: messagebox.showerror("Calibration Error", f"Failed to calibrate from the rent log: {e}"))
+
+    def _open_profile(self):
+        """Uses a profile file saved here or by 'atlas_cli.py calibrate --save'."""
+        file_path = filedialog.askopenfilename(filetypes=[("Profile files", "*.json"), ("All files", "*.*")],
+                                              title="Open Profile")
+        if not file_path:
+            return
+        try:
+            profile = rate_profile.load_profile(file_path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Profile Error", f"Failed to open the profile: {e}")
+            return
+        self.calibration_profile_var.set(json.dumps(profile._asdict()))
+
+    def _save_profile_as(self):
+        """Saves the active profile for 'atlas_cli.py --profile' or another session."""
+        file_path = filedialog.asksaveasfilename(defaultextension=".json",
+                                                filetypes=[("Profile files", "*.json")],
+                                                title="Save Profile As")
+        if not file_path:
+            return
+        try:
+            rate_profile.save_profile(file_path, self.rate_profile)
+        except OSError as e:
+            messagebox.showerror("Profile Error", f"Failed to save the profile: {e}")
+
+    def _apply_calibration_profile(self):
+        """Makes the fitted profile (or the defaults when blank) the active one and recalculates."""
+        try:
+            self.rate_profile = rate_profile.profile_from_dict(json.loads(self.calibration_profile_var.get() or "null"))
+        except ValueError:
+            self.rate_profile = rate_profile.DEFAULT_PROFILE
+        self.profile_label.config(text=f"Profile: {rate_profile.describe_rate_profile(self.rate_profile)}")
+        self.update_all_calculations()
+
     def _show_about_dialog(self):
         about_text = (
             "Atlas Earth Calculator\n"
@@ -348,6 +525,7 @@ class AtlasEarthApp:
             "fictive_badge_boost_enabled": self.fictive_badge_boost_enabled.get(),
             "fictive_badge_boost_percent": fictive_badge_boost_percent,
             "selected_region": self.selected_region_var.get(),
+            "rate_profile": self.rate_profile,
         }
 
     def update_all_calculations(self):
@@ -360,6 +538,12 @@ class AtlasEarthApp:
             self.next_tier_calculator.update_display()
         if hasattr(self, 'custom_tier_calculator'): # Update the new custom tier tab
             self.custom_tier_calculator.update_display()
+        if hasattr(self, 'boost_scheduler_calculator'):
+            self.boost_scheduler_calculator.update_display()
+        if hasattr(self, 'timeline_calculator'):
+            self.timeline_calculator.update_display()
+        if hasattr(self, 'scenario_calculator'):
+            self.scenario_calculator.update_display()
 
     def _get_all_calculated_data(self):
         """Collects all relevant calculated data from the calculator modules."""
@@ -388,6 +572,7 @@ class AtlasEarthApp:
             "fictive_badge_boost_enabled": self.fictive_badge_boost_enabled.get(),
             "fictive_badge_boost_percent": self.fictive_badge_boost_percent_var.get(),
             "selected_region": self.selected_region_var.get(),
+            "rate_profile": rate_profile.describe_rate_profile(self.rate_profile),
         }
         return data
 
@@ -401,45 +586,58 @@ class AtlasEarthApp:
                                                 title="Save Calculations to Excel")
         if not file_path:
             return
+        self._run_export("XLSX", self._write_xlsx_report, file_path)
 
+    def _run_export(self, format_name, write_report, file_path):
+        """
+        Collects the data on the main thread (it reads Tk variables), then writes the file on a
+        worker thread so the window stays responsive while it is saved.
+        """
         try:
             data = self._get_all_calculated_data()
-            workbook = openpyxl.Workbook()
-            
-            # --- Input Data Sheet ---
-            input_sheet = workbook.active
-            input_sheet.title = "User Inputs"
-            input_sheet.append(["Input Type", "Value"])
-            for key, value in data["user_inputs"].items():
-                input_sheet.append([key.replace('_', ' ').title(), value])
-            
-            # --- Current Earnings Sheet ---
-            current_earnings_sheet = workbook.create_sheet("Current Earnings")
-            current_earnings_sheet.append(["Timeframe", "Base Earnings", "With Ad Boost"])
-            for tf, values in data["current_earnings"].items():
-                current_earnings_sheet.append([f"Per {tf.capitalize()}:", values['base'], values['boosted']])
-
-            # --- Goal Data Sheet ---
-            goal_sheet = workbook.create_sheet("Parcels for Goal")
-            goal_sheet.append(["Goal Type", "Value"])
-            for key, value in data["goal_data"].items():
-                if isinstance(value, dict): # For breakdown
-                    goal_sheet.append([key.replace('_', ' ').title(), ""])
-                    for sub_key, sub_value in value.items():
-                        goal_sheet.append([f"  {sub_key.replace('_', ' ').title()}", sub_value])
-                else:
-                    goal_sheet.append([key.replace('_', ' ').title(), value])
-
-            # --- Next Tier Info Sheet ---
-            next_tier_sheet = workbook.create_sheet("Next Tier Info")
-            next_tier_sheet.append(["Info Type", "Value"])
-            for key, value in data["next_tier_info"].items():
-                next_tier_sheet.append([key.replace('_', ' ').title(), value])
-
-            workbook.save(file_path)
-            messagebox.showinfo("Export Success", f"Data successfully exported to {file_path}")
         except Exception as e:
-            messagebox.showerror("Export Error", f"Failed to export to XLSX: {e}")
+            messagebox.showerror("Export Error", f"Failed to export to {format_name}: {e}")
+            return
+        self.jobs.run_in_thread(
+            f"Export to {format_name}", write_report, file_path, data,
+            on_done=lambda job, result: messagebox.showinfo("Export Success", f"Data successfully exported to {file_path}"),
+            on_error=lambda job, error: messagebox.showerror("Export Error", f"Failed to export to {format_name}: {error}"))
+
+    @staticmethod
+    def _write_xlsx_report(job, file_path, data):
+        workbook = openpyxl.Workbook()
+        
+        # --- Input Data Sheet ---
+        input_sheet = workbook.active
+        input_sheet.title = "User Inputs"
+        input_sheet.append(["Input Type", "Value"])
+        for key, value in data["user_inputs"].items():
+            input_sheet.append([key.replace('_', ' ').title(), value])
+        
+        # --- Current Earnings Sheet ---
+        current_earnings_sheet = workbook.create_sheet("Current Earnings")
+        current_earnings_sheet.append(["Timeframe", "Base Earnings", "With Ad Boost"])
+        for tf, values in data["current_earnings"].items():
+            current_earnings_sheet.append([f"Per {tf.capitalize()}:", values['base'], values['boosted']])
+
+        # --- Goal Data Sheet ---
+        goal_sheet = workbook.create_sheet("Parcels for Goal")
+        goal_sheet.append(["Goal Type", "Value"])
+        for key, value in data["goal_data"].items():
+            if isinstance(value, dict): # For breakdown
+                goal_sheet.append([key.replace('_', ' ').title(), ""])
+                for sub_key, sub_value in value.items():
+                    goal_sheet.append([f"  {sub_key.replace('_', ' ').title()}", sub_value])
+            else:
+                goal_sheet.append([key.replace('_', ' ').title(), value])
+
+        # --- Next Tier Info Sheet ---
+        next_tier_sheet = workbook.create_sheet("Next Tier Info")
+        next_tier_sheet.append(["Info Type", "Value"])
+        for key, value in data["next_tier_info"].items():
+            next_tier_sheet.append([key.replace('_', ' ').title(), value])
+
+        workbook.save(file_path)
 
     def _export_to_csv(self):
         file_path = filedialog.asksaveasfilename(defaultextension=".csv",
@@ -447,48 +645,45 @@ class AtlasEarthApp:
                                                 title="Save Calculations to CSV")
         if not file_path:
             return
+        self._run_export("CSV", self._write_csv_report, file_path)
 
-        try:
-            data = self._get_all_calculated_data()
-            with open(file_path, 'w', newline='') as csvfile:
-                import csv
-                writer = csv.writer(csvfile)
-
-                # User Inputs
-                writer.writerow(["--- User Inputs ---"])
-                writer.writerow(["Input Type", "Value"])
-                for key, value in data["user_inputs"].items():
-                    writer.writerow([key.replace('_', ' ').title(), value])
-                writer.writerow([])
-
-                # Current Earnings
-                writer.writerow(["--- Current Earnings ---"])
-                writer.writerow(["Timeframe", "Base Earnings", "With Ad Boost"])
-                for tf, values in data["current_earnings"].items():
-                    writer.writerow([f"Per {tf.capitalize()}:", values['base'], values['boosted']])
-                writer.writerow([])
-
-                # Goal Data
-                writer.writerow(["--- Parcels for Goal ---"])
-                writer.writerow(["Goal Type", "Value"])
-                for key, value in data["goal_data"].items():
-                    if isinstance(value, dict):
-                        writer.writerow([key.replace('_', ' ').title(), ""])
-                        for sub_key, sub_value in value.items():
-                            writer.writerow([f"  {sub_key.replace('_', ' ').title()}", sub_value])
-                    else:
-                        writer.writerow([key.replace('_', ' ').title(), value])
-                writer.writerow([])
-
-                # Next Tier Info
-                writer.writerow(["--- Next Tier Info ---"])
-                writer.writerow(["Info Type", "Value"])
-                for key, value in data["next_tier_info"].items():
+    @staticmethod
+    def _write_csv_report(job, file_path, data):
+        with open(file_path, 'w', newline='') as csvfile:
+            import csv
+            writer = csv.writer(csvfile)
+
+            # User Inputs
+            writer.writerow(["--- User Inputs ---"])
+            writer.writerow(["Input Type", "Value"])
+            for key, value in data["user_inputs"].items():
+                writer.writerow([key.replace('_', ' ').title(), value])
+            writer.writerow([])
+
+            # Current Earnings
+            writer.writerow(["--- Current Earnings ---"])
+            writer.writerow(["Timeframe", "Base Earnings", "With Ad Boost"])
+            for tf, values in data["current_earnings"].items():
+                writer.writerow([f"Per {tf.capitalize()}:", values['base'], values['boosted']])
+            writer.writerow([])
+
+            # Goal Data
+            writer.writerow(["--- Parcels for Goal ---"])
+            writer.writerow(["Goal Type", "Value"])
+            for key, value in data["goal_data"].items():
+                if isinstance(value, dict):
+                    writer.writerow([key.replace('_', ' ').title(), ""])
+                    for sub_key, sub_value in value.items():
+                        writer.writerow([f"  {sub_key.replace('_', ' ').title()}", sub_value])
+                else:
                     writer.writerow([key.replace('_', ' ').title(), value])
+            writer.writerow([])
 
-            messagebox.showinfo("Export Success", f"Data successfully exported to {file_path}")
-        except Exception as e:
-            messagebox.showerror("Export Error", f"Failed to export to CSV: {e}")
+            # Next Tier Info
+            writer.writerow(["--- Next Tier Info ---"])
+            writer.writerow(["Info Type", "Value"])
+            for key, value in data["next_tier_info"].items():
+                writer.writerow([key.replace('_', ' ').title(), value])
 
     def _export_to_pdf(self):
         if not FPDF:
@@ -500,56 +695,54 @@ class AtlasEarthApp:
                                                 title="Save Calculations to PDF")
         if not file_path:
             return
-
-        try:
-            data = self._get_all_calculated_data()
-            pdf = FPDF()
-            pdf.set_auto_page_break(auto=True, margin=15)
-            pdf.add_page()
-            pdf.set_font("Arial", "B", 16)
-            pdf.cell(0, 10, "Atlas Earth Calculator Report", 0, 1, "C")
-            pdf.ln(10)
-
-            def add_section(title, content_list):
-                pdf.set_font("Arial", "B", 12)
-                pdf.cell(0, 10, title, 0, 1, "L")
-                pdf.set_font("Arial", "", 10)
-                for item in content_list:
-                    pdf.cell(0, 7, item, 0, 1, "L")
-                pdf.ln(5)
-
-            user_inputs_content = []
-            for key, value in data["user_inputs"].items():
-                user_inputs_content.append(f"{key.replace('_', ' ').title()}: {value}")
-            add_section("User Inputs", user_inputs_content)
-
-            current_earnings_content = []
-            current_earnings_content.append(f"{'Timeframe':<15} {'Base Earnings':<20} {'With Ad Boost':<20}")
-            for tf, values in data["current_earnings"].items():
-                base_val = values['base'] if isinstance(values['base'], str) else f"{values['base']:.10f}"
-                boosted_val = values['boosted'] if isinstance(values['boosted'], str) else f"{values['boosted']:.10f}"
-                current_earnings_content.append(f"{f'Per {tf.capitalize()}:':<15} {base_val:<20} {boosted_val:<20}")
-            add_section("Current Earnings", current_earnings_content)
-
-            goal_data_content = []
-            for key, value in data["goal_data"].items():
-                if isinstance(value, dict):
-                    goal_data_content.append(f"{key.replace('_', ' ').title()}:")
-                    for sub_key, sub_value in value.items():
-                        goal_data_content.append(f"  {sub_key.replace('_', ' ').title()}: {sub_value}")
-                else:
-                    goal_data_content.append(f"{key.replace('_', ' ').title()}: {value}")
-            add_section("Parcels for Goal", goal_data_content)
-
-            next_tier_content = []
-            for key, value in data["next_tier_info"].items():
-                next_tier_content.append(f"{key.replace('_', ' ').title()}: {value}")
-            add_section("Next Tier Info", next_tier_content)
-
-            pdf.output(file_path)
-            messagebox.showinfo("Export Success", f"Data successfully exported to {file_path}")
-        except Exception as e:
-            messagebox.showerror("Export Error", f"Failed to export to PDF: {e}")
+        self._run_export("PDF", self._write_pdf_report, file_path)
+
+    @staticmethod
+    def _write_pdf_report(job, file_path, data):
+        pdf = FPDF()
+        pdf.set_auto_page_break(auto=True, margin=15)
+        pdf.add_page()
+        pdf.set_font("Arial", "B", 16)
+        pdf.cell(0, 10, "Atlas Earth Calculator Report", 0, 1, "C")
+        pdf.ln(10)
+
+        def add_section(title, content_list):
+            pdf.set_font("Arial", "B", 12)
+            pdf.cell(0, 10, title, 0, 1, "L")
+            pdf.set_font("Arial", "", 10)
+            for item in content_list:
+                pdf.cell(0, 7, item, 0, 1, "L")
+            pdf.ln(5)
+
+        user_inputs_content = []
+        for key, value in data["user_inputs"].items():
+            user_inputs_content.append(f"{key.replace('_', ' ').title()}: {value}")
+        add_section("User Inputs", user_inputs_content)
+
+        current_earnings_content = []
+        current_earnings_content.append(f"{'Timeframe':<15} {'Base Earnings':<20} {'With Ad Boost':<20}")
+        for tf, values in data["current_earnings"].items():
+            base_val = values['base'] if isinstance(values['base'], str) else f"{values['base']:.10f}"
+            boosted_val = values['boosted'] if isinstance(values['boosted'], str) else f"{values['boosted']:.10f}"
+            current_earnings_content.append(f"{f'Per {tf.capitalize()}:':<15} {base_val:<20} {boosted_val:<20}")
+        add_section("Current Earnings", current_earnings_content)
+
+        goal_data_content = []
+        for key, value in data["goal_data"].items():
+            if isinstance(value, dict):
+                goal_data_content.append(f"{key.replace('_', ' ').title()}:")
+                for sub_key, sub_value in value.items():
+                    goal_data_content.append(f"  {sub_key.replace('_', ' ').title()}: {sub_value}")
+            else:
+                goal_data_content.append(f"{key.replace('_', ' ').title()}: {value}")
+        add_section("Parcels for Goal", goal_data_content)
+
+        next_tier_content = []
+        for key, value in data["next_tier_info"].items():
+            next_tier_content.append(f"{key.replace('_', ' ').title()}: {value}")
+        add_section("Next Tier Info", next_tier_content)
+
+        pdf.output(file_path)
 
 
     def clear_all(self):
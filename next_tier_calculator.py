@@ -5,12 +5,19 @@ from tkinter import ttk, messagebox
 
 import constants
 import utils
+import earnings_model
+from widgets import IntegerEntry
 
 class NextTierCalculator:
     def __init__(self, parent_frame, get_user_inputs_callback):
         self.parent_frame = parent_frame
         self.get_user_inputs_callback = get_user_inputs_callback
 
+        self.marginal_rarity_var = tk.StringVar(value="mixed")
+        self.marginal_max_parcels_var = tk.StringVar(value="10000")
+        self._last_cliffs = []
+        self._last_ladder = None
+
         self._create_widgets()
 
     def _create_widgets(self):
@@ -52,6 +59,52 @@ class NextTierCalculator:
         self.est_earnings_next_tier_label.grid(row=row, column=1, sticky="ew", padx=5, pady=1)
         row += 1
 
+        ttk.Label(self.parent_frame, text="--- Upcoming Tier Ladder ---", font=header_font).grid(row=row, column=0, columnspan=2, sticky="w", pady=(15, 5))
+        row += 1
+        ladder_columns = ("range", "multiplier", "parcels_needed", "cumulative_parcels", "daily", "monthly")
+        self.ladder_tree = ttk.Treeview(self.parent_frame, columns=ladder_columns, show="headings", height=8)
+        self.ladder_tree.heading("range", text="Tier Range")
+        self.ladder_tree.heading("multiplier", text="Multiplier")
+        self.ladder_tree.heading("parcels_needed", text="Parcels Needed")
+        self.ladder_tree.heading("cumulative_parcels", text="Cumulative From Now")
+        self.ladder_tree.heading("daily", text="Daily (Start / End)")
+        self.ladder_tree.heading("monthly", text="Monthly (Start / End)")
+        for column in ladder_columns:
+            self.ladder_tree.column(column, width=110, anchor="e")
+        self.ladder_tree.column("daily", width=170)
+        self.ladder_tree.column("monthly", width=170)
+        self.ladder_tree.grid(row=row, column=0, columnspan=2, sticky="ew", padx=5, pady=(5, 10))
+        row += 1
+
+        ttk.Label(self.parent_frame, text="--- Marginal Value of the Next Parcel ---", font=header_font).grid(row=row, column=0, columnspan=2, sticky="w", pady=(15, 5))
+        row += 1
+        marginal_input_frame = ttk.Frame(self.parent_frame)
+        marginal_input_frame.grid(row=row, column=0, columnspan=2, sticky="w", padx=5, pady=1)
+        ttk.Label(marginal_input_frame, text="Rarity:").pack(side="left")
+        rarity_combo = ttk.Combobox(marginal_input_frame, textvariable=self.marginal_rarity_var, width=10,
+                                    values=["mixed"] + list(constants.PARCEL_RATES_PER_SECOND.keys()), state="readonly")
+        rarity_combo.pack(side="left", padx=5)
+        rarity_combo.bind("<<ComboboxSelected>>", lambda event: self.update_display())
+        ttk.Label(marginal_input_frame, text="Up to Parcels:").pack(side="left", padx=(10, 0))
+        IntegerEntry(marginal_input_frame, width=8, textvariable=self.marginal_max_parcels_var).pack(side="left", padx=5)
+        row += 1
+        ttk.Label(self.parent_frame, text="Next Parcel Adds (Monthly):", font=value_font).grid(row=row, column=0, sticky="w", padx=5, pady=1)
+        self.next_parcel_marginal_label = ttk.Label(self.parent_frame, text="N/A", font=value_font)
+        self.next_parcel_marginal_label.grid(row=row, column=1, sticky="ew", padx=5, pady=1)
+        row += 1
+
+        # One row per earnings cliff, i.e. a parcel count where the next parcel lowers boosted earnings
+        cliff_columns = ("parcels", "multipliers", "monthly_loss", "parcels_to_recover")
+        self.cliffs_tree = ttk.Treeview(self.parent_frame, columns=cliff_columns, show="headings", height=6)
+        self.cliffs_tree.heading("parcels", text="Cliff After Parcel")
+        self.cliffs_tree.heading("multipliers", text="Ad Multiplier")
+        self.cliffs_tree.heading("monthly_loss", text="Monthly Loss")
+        self.cliffs_tree.heading("parcels_to_recover", text="Parcels to Recover")
+        for column in cliff_columns:
+            self.cliffs_tree.column(column, width=130, anchor="e")
+        self.cliffs_tree.grid(row=row, column=0, columnspan=2, sticky="ew", padx=5, pady=(5, 10))
+        row += 1
+
         self.parent_frame.grid_columnconfigure(1, weight=1)
 
     def update_display(self):
@@ -63,8 +116,6 @@ class NextTierCalculator:
         parcels = inputs["parcels"]
         total_parcels = inputs["total_parcels"]
         selected_region = inputs["selected_region"]
-        badge_count = inputs["badge_count"]
-        boost_hours = inputs["boost_hours"]
 
         region_data = constants.REGIONAL_AD_BOOST_DATA.get(selected_region)
         if not region_data:
@@ -75,21 +126,19 @@ class NextTierCalculator:
         # Calculate raw base earnings per second from current parcels
         raw_base_earnings_per_second = utils.calculate_base_earnings_per_second(parcels)
 
-        current_tier_info = None
-        next_tier_info = None
-        
-        # Find current tier and next tier
-        for i, tier in enumerate(region_data):
-            if tier['min'] <= total_parcels <= tier['max']:
-                current_tier_info = tier
-                if i + 1 < len(region_data):
-                    next_tier_info = region_data[i+1]
-                break
-        
-        # If no current tier found (e.g., 0 parcels), assume first tier is next
-        if not current_tier_info and total_parcels < region_data[0]['min']:
-            next_tier_info = region_data[0]
-            
+        # Average base rent per parcel drives every estimate on the ladder
+        if total_parcels > 0:
+            current_avg_base_rent_per_parcel = raw_base_earnings_per_second / total_parcels
+        else:
+            current_avg_base_rent_per_parcel = utils.calculate_average_mixed_parcel_rate_per_second(
+                inputs["rate_profile"].parcel_probabilities)
+
+        # Current tier by binary search over the compiled tier table; the next tier is the first ladder rung
+        current_tier_index = earnings_model.find_tier_index(selected_region, total_parcels)
+        current_tier_info = region_data[current_tier_index] if current_tier_index >= 0 else None
+        self._last_ladder = self.get_tier_ladder(inputs, current_avg_base_rent_per_parcel)
+        ladder = self._last_ladder
+
         # Update Current Tier Info
         self.current_parcel_count_label.config(text=f"{total_parcels:,}")
         if current_tier_info:
@@ -101,37 +150,64 @@ class NextTierCalculator:
             self.current_tier_max_label.config(text="N/A")
 
         # Update Next Tier Info
-        if next_tier_info:
-            parcels_to_next_tier = next_tier_info['min'] - total_parcels
-            if parcels_to_next_tier < 0: parcels_to_next_tier = 0 # Should not be negative if logic is correct
-            
-            self.parcels_to_next_tier_label.config(text=f"{parcels_to_next_tier:,}")
-            self.next_tier_multiplier_label.config(text=f"{next_tier_info['multiplier']}x")
-            self.next_tier_range_label.config(text=f"{next_tier_info['min']}-{next_tier_info['max']} parcels")
-
-            # Estimate earnings at the start of the next tier
-            current_avg_base_rent_per_parcel = 0
-            if total_parcels > 0:
-                current_avg_base_rent_per_parcel = raw_base_earnings_per_second / total_parcels
-            else:
-                current_avg_base_rent_per_parcel = utils.calculate_average_mixed_parcel_rate_per_second()
-            
-            est_raw_base_earnings_at_next_tier_min = current_avg_base_rent_per_parcel * next_tier_info['min']
-
-            badge_multiplier = utils.get_passport_boost_multiplier(badge_count)
-            next_tier_ad_boost_multiplier = next_tier_info['multiplier']
-
-            est_total_earnings_per_second_at_next_tier_min = \
-                est_raw_base_earnings_at_next_tier_min * badge_multiplier * next_tier_ad_boost_multiplier
-            
-            est_daily_earnings = utils.convert_seconds_to_timeframe(est_total_earnings_per_second_at_next_tier_min, 'day')
-            self.est_earnings_next_tier_label.config(text=f"${est_daily_earnings:.8f}")
+        if len(ladder["min"]) > 0:
+            self.parcels_to_next_tier_label.config(text=f"{ladder['cumulative_parcels'][0]:,}")
+            self.next_tier_multiplier_label.config(text=f"{ladder['multiplier'][0]:g}x")
+            self.next_tier_range_label.config(text=f"{ladder['min'][0]}-{ladder['max'][0]} parcels")
+            self.est_earnings_next_tier_label.config(text=f"${ladder['daily_start'][0]:.8f}")
         else:
             self.parcels_to_next_tier_label.config(text="N/A (Last Tier Reached)")
             self.next_tier_multiplier_label.config(text="N/A")
             self.next_tier_range_label.config(text="N/A")
             self.est_earnings_next_tier_label.config(text="N/A")
 
+        self.ladder_tree.delete(*self.ladder_tree.get_children())
+        for i in range(len(ladder["min"])):
+            self.ladder_tree.insert("", "end", values=(
+                f"{ladder['min'][i]:,}-{ladder['max'][i]:,}",
+                f"{ladder['multiplier'][i]:g}x",
+                f"{ladder['parcels_needed'][i]:,}",
+                f"{ladder['cumulative_parcels'][i]:,}",
+                f"${ladder['daily_start'][i]:.4f} / ${ladder['daily_end'][i]:.4f}",
+                f"${ladder['monthly_start'][i]:.4f} / ${ladder['monthly_end'][i]:.4f}",
+            ))
+
+        self._update_marginal_value(inputs)
+
+    def get_tier_ladder(self, inputs, avg_base_rent_per_parcel):
+        """
+        Returns every upcoming ad boost tier for the inputs' region as earnings_model.tier_ladder columns,
+        estimated with the given average base rent per parcel and the inputs' badge boost.
+        """
+        return earnings_model.tier_ladder(inputs["selected_region"], inputs["total_parcels"],
+                                          avg_base_rent_per_parcel, earnings_model.badge_multiplier(inputs))
+
+    def _update_marginal_value(self, inputs):
+        """Recomputes the marginal-value curve and its cliffs for the selected rarity."""
+        max_parcels_str = self.marginal_max_parcels_var.get()
+        max_parcels = int(max_parcels_str) if max_parcels_str.strip() != "" else 0
+        max_parcels = max(max_parcels, inputs["total_parcels"] + 1)
+
+        curve = earnings_model.marginal_value_curve(
+            inputs["selected_region"], self.marginal_rarity_var.get(), max_parcels,
+            badge_mult=earnings_model.badge_multiplier(inputs),
+            boost_hours=inputs["boost_hours"], srb_forced=inputs["srb_boost_enabled"],
+            srb_hours_per_month=inputs["rate_profile"].srb_hours_per_month, mix=inputs["rate_profile"].parcel_probabilities)
+        self._last_cliffs = curve["cliffs"]
+
+        next_parcel_change = curve["marginal"][inputs["total_parcels"]]
+        self.next_parcel_marginal_label.config(text=f"${next_parcel_change:+.8f}")
+
+        self.cliffs_tree.delete(*self.cliffs_tree.get_children())
+        for cliff in self._last_cliffs:
+            recover = cliff["parcels_to_recover"]
+            self.cliffs_tree.insert("", "end", values=(
+                f"{cliff['parcels']:,}",
+                f"{cliff['multiplier_before']:g}x -> {cliff['multiplier_after']:g}x",
+                f"-${cliff['monthly_loss']:.8f}",
+                f"{recover:,}" if recover is not None else "Not in range",
+            ))
+
     def _clear_labels(self):
         self.current_parcel_count_label.config(text="N/A")
         self.current_ad_boost_label.config(text="N/A")
@@ -140,7 +216,19 @@ class NextTierCalculator:
         self.next_tier_multiplier_label.config(text="N/A")
         self.next_tier_range_label.config(text="N/A")
         self.est_earnings_next_tier_label.config(text="N/A")
+        self.next_parcel_marginal_label.config(text="N/A")
+        self.ladder_tree.delete(*self.ladder_tree.get_children())
+        self._last_ladder = None
+        self.cliffs_tree.delete(*self.cliffs_tree.get_children())
+        self._last_cliffs = []
         
+    def get_session_variables(self):
+        """Returns the tab's input variables, keyed by name, for session save/restore."""
+        return {
+            "marginal_rarity": self.marginal_rarity_var,
+            "marginal_max_parcels": self.marginal_max_parcels_var,
+        }
+
     def get_export_data(self):
         """Returns the current and next tier info in a dictionary format for export."""
         data = {
@@ -0,0 +1,346 @@
+# payback_calculator.py
+
+import csv
+import time
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+
+import numpy as np
+
+import badge_planner
+import constants
+import earnings_model
+import exporters
+from widgets import IntegerEntry
+
+class PaybackCalculator:
+    def __init__(self, parent_frame, get_user_inputs_callback, job_runner):
+        self.parent_frame = parent_frame
+        self.get_user_inputs_callback = get_user_inputs_callback
+        self.job_runner = job_runner
+
+        self.parcel_cost_var = tk.StringVar(value="1.00")
+        self.batch_size_var = tk.StringVar(value="1")
+        self.size_from_var = tk.StringVar(value="0")
+        self.size_to_var = tk.StringVar(value="10000")
+        self.size_step_var = tk.StringVar(value="1")
+        self.rarity_var = tk.StringVar(value="mixed")
+        self.badge_cost_var = tk.StringVar(value="0.50")
+        self.compare_parcels_var = tk.StringVar(value="10")
+        self.plan_budget_var = tk.StringVar(value="50.00")
+        self.plan_horizon_var = tk.StringVar(value="12")
+
+        self._last_table = None
+        self._last_table_metadata = {}
+        self._calculation_job = None
+
+        self._create_widgets()
+
+    def _create_widgets(self):
+        input_frame = ttk.LabelFrame(self.parent_frame, text="Payback Inputs")
+        input_frame.pack(padx=10, pady=10, fill="x")
+
+        ttk.Label(input_frame, text="Parcel Cost ($):").grid(row=0, column=0, sticky="w", padx=5, pady=2)
+        ttk.Entry(input_frame, width=10, textvariable=self.parcel_cost_var).grid(row=0, column=1, sticky="w", padx=5, pady=2)
+        ttk.Label(input_frame, text="Parcels per Batch:").grid(row=0, column=2, sticky="w", padx=5, pady=2)
+        IntegerEntry(input_frame, width=8, textvariable=self.batch_size_var).grid(row=0, column=3, sticky="w", padx=5, pady=2)
+
+        ttk.Label(input_frame, text="Portfolio Sizes From:").grid(row=1, column=0, sticky="w", padx=5, pady=2)
+        IntegerEntry(input_frame, width=10, textvariable=self.size_from_var).grid(row=1, column=1, sticky="w", padx=5, pady=2)
+        ttk.Label(input_frame, text="To:").grid(row=1, column=2, sticky="w", padx=5, pady=2)
+        IntegerEntry(input_frame, width=10, textvariable=self.size_to_var).grid(row=1, column=3, sticky="w", padx=5, pady=2)
+        ttk.Label(input_frame, text="Step:").grid(row=1, column=4, sticky="w", padx=5, pady=2)
+        IntegerEntry(input_frame, width=6, textvariable=self.size_step_var).grid(row=1, column=5, sticky="w", padx=5, pady=2)
+
+        ttk.Label(input_frame, text="New Parcel Rarity:").grid(row=2, column=0, sticky="w", padx=5, pady=2)
+        ttk.Combobox(input_frame, textvariable=self.rarity_var, width=10, state="readonly",
+                     values=["mixed"] + list(constants.PARCEL_RATES_PER_SECOND.keys())).grid(row=2, column=1, sticky="w", padx=5, pady=2)
+
+        button_frame = ttk.Frame(self.parent_frame)
+        button_frame.pack(padx=10, fill="x")
+        ttk.Button(button_frame, text="Calculate Payback Table", command=self.calculate).pack(side="left", padx=5)
+        self.export_button = ttk.Button(button_frame, text="Export Table to CSV", command=self._export_table_to_csv, state="disabled")
+        self.export_button.pack(side="left", padx=5)
+        self.export_xlsx_button = ttk.Button(button_frame, text="Export Table to XLSX", command=self._export_table_to_xlsx, state="disabled")
+        self.export_xlsx_button.pack(side="left", padx=5)
+        self.export_columnar_button = ttk.Button(button_frame, text="Export Table (Binary)", command=self._export_table_to_columnar, state="disabled")
+        self.export_columnar_button.pack(side="left", padx=5)
+
+        self.status_label = ttk.Label(self.parent_frame, text="Click 'Calculate Payback Table' to see results.")
+        self.status_label.pack(padx=10, pady=5, anchor="w")
+
+        # Payback for the next batch at the user's current parcel count, one row per region
+        output_frame = ttk.LabelFrame(self.parent_frame, text="Payback at Your Current Parcel Count")
+        output_frame.pack(padx=10, pady=10, fill="both", expand=True)
+        columns = ("region", "monthly_gain", "payback_days")
+        self.summary_tree = ttk.Treeview(output_frame, columns=columns, show="headings", height=len(constants.REGIONAL_AD_BOOST_DATA))
+        self.summary_tree.heading("region", text="Region")
+        self.summary_tree.heading("monthly_gain", text="Monthly Gain of Batch")
+        self.summary_tree.heading("payback_days", text="Days to Recoup")
+        self.summary_tree.column("region", width=320, anchor="w")
+        self.summary_tree.column("monthly_gain", width=150, anchor="e")
+        self.summary_tree.column("payback_days", width=120, anchor="e")
+        self.summary_tree.pack(fill="both", expand=True, padx=5, pady=5)
+
+        # Next badge tier against more parcels, and the best mix of both within a budget
+        planner_frame = ttk.LabelFrame(self.parent_frame, text="Badges vs Parcels")
+        planner_frame.pack(padx=10, pady=10, fill="both", expand=True)
+        planner_inputs = ttk.Frame(planner_frame)
+        planner_inputs.pack(fill="x", padx=5, pady=2)
+        ttk.Label(planner_inputs, text="Cost per Badge ($):").grid(row=0, column=0, sticky="w", padx=5, pady=2)
+        ttk.Entry(planner_inputs, width=10, textvariable=self.badge_cost_var).grid(row=0, column=1, sticky="w", padx=5, pady=2)
+        ttk.Label(planner_inputs, text="Parcels to Compare:").grid(row=0, column=2, sticky="w", padx=5, pady=2)
+        IntegerEntry(planner_inputs, width=8, textvariable=self.compare_parcels_var).grid(row=0, column=3, sticky="w", padx=5, pady=2)
+        ttk.Label(planner_inputs, text="Budget ($):").grid(row=1, column=0, sticky="w", padx=5, pady=2)
+        ttk.Entry(planner_inputs, width=10, textvariable=self.plan_budget_var).grid(row=1, column=1, sticky="w", padx=5, pady=2)
+        ttk.Label(planner_inputs, text="Horizon (Months):").grid(row=1, column=2, sticky="w", padx=5, pady=2)
+        IntegerEntry(planner_inputs, width=8, textvariable=self.plan_horizon_var).grid(row=1, column=3, sticky="w", padx=5, pady=2)
+        ttk.Button(planner_inputs, text="Plan Badges vs Parcels", command=self.plan_badges_vs_parcels).grid(row=0, column=4, rowspan=2, padx=10, pady=2)
+
+        columns = ("option", "cost", "monthly_gain", "payback_days")
+        self.next_step_tree = ttk.Treeview(planner_frame, columns=columns, show="headings", height=3)
+        self.next_step_tree.heading("option", text="Next Step")
+        self.next_step_tree.heading("cost", text="Cost")
+        self.next_step_tree.heading("monthly_gain", text="Monthly Gain")
+        self.next_step_tree.heading("payback_days", text="Days to Recoup")
+        self.next_step_tree.column("option", width=320, anchor="w")
+        for column in columns[1:]:
+            self.next_step_tree.column(column, width=130, anchor="e")
+        self.next_step_tree.pack(fill="x", padx=5, pady=5)
+
+        self.plan_label = ttk.Label(planner_frame, text="Click 'Plan Badges vs Parcels' to compare.")
+        self.plan_label.pack(padx=5, pady=2, anchor="w")
+        columns = ("badges", "parcels", "cost", "monthly_gain", "net")
+        self.plan_tree = ttk.Treeview(planner_frame, columns=columns, show="headings", height=6)
+        self.plan_tree.heading("badges", text="Badges")
+        self.plan_tree.heading("parcels", text="Parcels Bought")
+        self.plan_tree.heading("cost", text="Cost")
+        self.plan_tree.heading("monthly_gain", text="Monthly Gain")
+        self.plan_tree.heading("net", text="Net over Horizon")
+        for column in columns:
+            self.plan_tree.column(column, width=130, anchor="e")
+        self.plan_tree.pack(fill="both", expand=True, padx=5, pady=5)
+
+    def _read_payback_inputs(self):
+        """Parses the tab's inputs, or returns None after showing an error."""
+        try:
+            parcel_cost = float(self.parcel_cost_var.get())
+            batch_size = int(self.batch_size_var.get())
+            size_from = int(self.size_from_var.get())
+            size_to = int(self.size_to_var.get())
+            size_step = int(self.size_step_var.get())
+        except ValueError:
+            messagebox.showerror("Input Error", "Please enter valid numbers for the parcel cost, batch size and portfolio sizes.")
+            return None
+        if parcel_cost <= 0 or batch_size < 1 or size_step < 1 or size_to < size_from:
+            messagebox.showerror("Input Error", "Parcel cost, batch size and step must be positive, and 'To' must not be below 'From'.")
+            return None
+        return parcel_cost, batch_size, np.arange(size_from, size_to + 1, size_step)
+
+    def calculate(self):
+        inputs = self.get_user_inputs_callback()
+        payback_inputs = self._read_payback_inputs()
+        if inputs is None or payback_inputs is None:
+            return
+        parcel_cost, batch_size, sizes = payback_inputs
+
+        regions = list(constants.REGIONAL_AD_BOOST_DATA.keys())
+        # The active profile's SRB hours and rarity mix travel with the arguments to the worker thread
+        profile = dict(rarity=self.rarity_var.get(), badge_mult=earnings_model.badge_multiplier(inputs),
+                       boost_hours=inputs["boost_hours"], srb_forced=inputs["srb_boost_enabled"],
+                       batch_size=batch_size, srb_hours_per_month=inputs["rate_profile"].srb_hours_per_month,
+                       mix=dict(inputs["rate_profile"].parcel_probabilities))
+
+        # The summary at the current count is a single row per region, so it is shown right away
+        current = earnings_model.payback_table(parcel_cost, [inputs["total_parcels"]], regions, **profile)
+        self.summary_tree.delete(*self.summary_tree.get_children())
+        for region, gain, days in zip(current["region"], current["monthly_gain"], current["payback_days"]):
+            days_text = f"{days:,.1f}" if np.isfinite(days) else "Never (tier cliff)"
+            self.summary_tree.insert("", "end", values=(region, f"${gain:+.8f}", days_text))
+
+        # The full table is computed on a worker thread, one region at a time so it can be cancelled;
+        # each region's rows are handed back as they finish, so the tab holds what is done so far
+        if self._calculation_job is not None:
+            self._calculation_job.cancel()
+        self._set_export_buttons("disabled")
+        self._last_table = None
+        start = time.perf_counter()
+        chunks = []
+
+        def compute_table(job):
+            for index, region in enumerate(regions):
+                job.report_partial(earnings_model.payback_table(parcel_cost, sizes, [region], **profile))
+                job.report_progress((index + 1) / len(regions), f"{index + 1} of {len(regions)} regions")
+            return len(regions)
+
+        def on_partial(job, chunk):
+            chunks.append(chunk)
+            rows = sum(len(done["portfolio_size"]) for done in chunks)
+            self.status_label.config(text=f"Computed {len(chunks)} of {len(regions)} regions ({rows:,} rows so far)...")
+
+        def on_done(job, region_count):
+            self._calculation_job = None
+            self._last_table = {key: np.concatenate([chunk[key] for chunk in chunks]) for key in chunks[0]}
+            self._last_table_metadata = {"parcel_cost": parcel_cost, **profile}
+            elapsed = time.perf_counter() - start
+            row_count = len(self._last_table["portfolio_size"])
+            self.status_label.config(text=f"Computed {row_count:,} rows ({len(sizes):,} sizes x {len(regions)} regions) in {elapsed * 1000:.1f} ms.")
+            self._set_export_buttons("normal")
+
+        def on_error(job, e):
+            self._calculation_job = None
+            self.status_label.config(text="Calculation failed.")
+            messagebox.showerror("Calculation Error", f"An unexpected error occurred: {e}")
+
+        def on_cancelled(job):
+            if self._calculation_job is job:
+                self._calculation_job = None
+                self.status_label.config(text="Calculation cancelled.")
+
+        self.status_label.config(text=f"Calculating {len(sizes):,} sizes x {len(regions)} regions...")
+        self._calculation_job = self.job_runner.run_in_thread(
+            "Payback table", compute_table,
+            on_partial=on_partial, on_done=on_done, on_error=on_error, on_cancelled=on_cancelled)
+
+    def _read_planner_inputs(self):
+        """Parses the Badges vs Parcels inputs, or returns None after showing an error."""
+        try:
+            parcel_cost = float(self.parcel_cost_var.get())
+            badge_cost = float(self.badge_cost_var.get())
+            parcels_to_compare = int(self.compare_parcels_var.get())
+            budget = float(self.plan_budget_var.get())
+            horizon_months = int(self.plan_horizon_var.get())
+        except ValueError:
+            messagebox.showerror("Input Error", "Please enter valid numbers for the parcel and badge costs, parcels to compare, budget and horizon.")
+            return None
+        if parcel_cost <= 0 or badge_cost < 0 or parcels_to_compare < 1 or budget < 0 or horizon_months < 1:
+            messagebox.showerror("Input Error", "Parcel cost, parcels to compare and horizon must be positive; badge cost and budget must not be negative.")
+            return None
+        return parcel_cost, badge_cost, parcels_to_compare, budget, horizon_months
+
+    def plan_badges_vs_parcels(self):
+        """Compares the next badge tier with buying parcels, and finds the best mix of both within the budget."""
+        inputs = self.get_user_inputs_callback()
+        planner_inputs = self._read_planner_inputs()
+        if inputs is None or planner_inputs is None:
+            return
+        parcel_cost, badge_cost, parcels_to_compare, budget, horizon_months = planner_inputs
+        # The planner works from the real badge count, since the fictive boost has no badge tiers to climb
+        portfolio = dict(parcel_counts=inputs["parcels"], badge_count=inputs["badge_count"], region=inputs["selected_region"],
+                         boost_hours=inputs["boost_hours"], srb_forced=inputs["srb_boost_enabled"],
+                         srb_hours_per_month=inputs["rate_profile"].srb_hours_per_month,
+                         rate_per_parcel=earnings_model.rarity_rate_per_second(self.rarity_var.get(),
+                                                                               inputs["rate_profile"].parcel_probabilities))
+
+        start = time.perf_counter()
+        steps = badge_planner.compare_next_steps(parcel_cost=parcel_cost, badge_cost=badge_cost,
+                                                 parcels_to_compare=parcels_to_compare, **portfolio)
+        plans = badge_planner.optimal_plan(parcel_cost=parcel_cost, badge_cost=badge_cost, budget=budget,
+                                           horizon_months=horizon_months, **portfolio)
+        elapsed = time.perf_counter() - start
+
+        self.next_step_tree.delete(*self.next_step_tree.get_children())
+        for step in steps:
+            days_text = f"{step['payback_days']:,.1f}" if np.isfinite(step["payback_days"]) else "Never (tier cliff)"
+            self.next_step_tree.insert("", "end", values=(step["option"], f"${step['cost']:,.2f}",
+                                                          f"${step['monthly_gain']:+.8f}", days_text))
+
+        self.plan_tree.delete(*self.plan_tree.get_children())
+        for plan in plans:
+            self.plan_tree.insert("", "end", values=(f"{plan['badge_count']:,} (+{plan['badges']:,})", f"{plan['parcels']:,}",
+                                                     f"${plan['cost']:,.2f}", f"${plan['monthly_gain']:+.4f}", f"${plan['net']:+,.2f}"))
+        best = plans[0]
+        if best["badges"] == 0 and best["parcels"] == 0:
+            summary = f"Best plan over {horizon_months} months: keep the budget, nothing recoups its cost in time."
+        else:
+            summary = (f"Best plan over {horizon_months} months: {best['badges']:,} more badges and {best['parcels']:,} more parcels "
+                       f"for ${best['cost']:,.2f}, netting ${best['net']:+,.2f}.")
+        self.plan_label.config(text=f"{summary} ({len(plans)} badge targets searched in {elapsed * 1000:.1f} ms)")
+
+    def _set_export_buttons(self, state):
+        self.export_button.config(state=state)
+        self.export_xlsx_button.config(state=state if exporters.openpyxl else "disabled")
+        self.export_columnar_button.config(state=state)
+
+    def _run_export(self, format_name, write_table, file_path):
+        """Writes the table on a worker thread; write_table(job, file_path, table) returns ExportStats or None."""
+        def on_done(job, stats):
+            details = f"\n{stats.rows:,} rows in {stats.seconds:.2f} s ({stats.rows / max(stats.seconds, 1e-9):,.0f} rows/s)" if stats else ""
+            messagebox.showinfo("Export Success", f"Data successfully exported to {file_path}{details}")
+
+        self.job_runner.run_in_thread(
+            f"Payback export to {format_name}", write_table, file_path, self._last_table, on_done=on_done,
+            on_error=lambda job, e: messagebox.showerror("Export Error", f"Failed to export to {format_name}: {e}"))
+
+    def _export_table_to_csv(self):
+        if self._last_table is None:
+            return
+        file_path = filedialog.asksaveasfilename(defaultextension=".csv",
+                                                filetypes=[("CSV files", "*.csv")],
+                                                title="Save Payback Table to CSV")
+        if not file_path:
+            return
+
+        self._run_export("CSV", self._write_csv, file_path)
+
+    @staticmethod
+    def _write_csv(job, file_path, table):
+        with open(file_path, 'w', newline='') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow([key.replace('_', ' ').title() for key in table])
+            total_rows = len(table["portfolio_size"])
+            for start in range(0, total_rows, exporters.EXPORT_CHUNK_ROWS):
+                job.report_progress(start / total_rows, f"{start:,} of {total_rows:,} rows")
+                chunk = slice(start, start + exporters.EXPORT_CHUNK_ROWS)
+                writer.writerows(zip(*(table[key][chunk].tolist() for key in table)))
+
+    def _export_table_to_xlsx(self):
+        if self._last_table is None:
+            return
+        file_path = filedialog.asksaveasfilename(defaultextension=".xlsx",
+                                                filetypes=[("Excel files", "*.xlsx")],
+                                                title="Save Payback Table to Excel")
+        if not file_path:
+            return
+
+        self._run_export("XLSX", self._write_xlsx, file_path)
+
+    @staticmethod
+    def _write_xlsx(job, file_path, table):
+        columns = {key.replace('_', ' ').title(): values for key, values in table.items()}
+        number_formats = {
+            "Portfolio Size": exporters.COUNT_FORMAT,
+            "Monthly Earnings": exporters.CURRENCY_FORMAT,
+            "Monthly Gain": exporters.CURRENCY_FORMAT,
+            "Payback Days": exporters.DAYS_FORMAT,
+        }
+        total_rows = len(table["portfolio_size"])
+        sheet = exporters.XlsxSheet("Payback", list(columns), exporters.iter_column_rows(columns), number_formats)
+        return exporters.write_xlsx_streaming(
+            file_path, [sheet], progress=lambda rows: job.report_progress(rows / total_rows, f"{rows:,} of {total_rows:,} rows"))
+
+    def _export_table_to_columnar(self):
+        if self._last_table is None:
+            return
+        file_path = filedialog.asksaveasfilename(defaultextension=".npz", filetypes=exporters.COLUMNAR_FILETYPES,
+                                                title="Save Payback Table (Columnar Binary)")
+        if not file_path:
+            return
+
+        metadata = dict(self._last_table_metadata)
+        self._run_export("binary", lambda job, path, table: exporters.write_columnar(path, table, "payback_table", metadata), file_path)
+
+    def get_session_variables(self):
+        """Returns the tab's input variables, keyed by name, for session save/restore."""
+        return {
+            "parcel_cost": self.parcel_cost_var,
+            "batch_size": self.batch_size_var,
+            "size_from": self.size_from_var,
+            "size_to": self.size_to_var,
+            "size_step": self.size_step_var,
+            "rarity": self.rarity_var,
+            "badge_cost": self.badge_cost_var,
+            "compare_parcels": self.compare_parcels_var,
+            "plan_budget": self.plan_budget_var,
+            "plan_horizon": self.plan_horizon_var,
+        }
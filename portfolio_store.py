@@ -0,0 +1,346 @@
+# portfolio_store.py
+
+import csv
+import time
+
+import numpy as np
+
+import constants
+import earnings_model
+
+# Regions are stored as their index in this list
+REGIONS = list(constants.REGIONAL_AD_BOOST_DATA)
+PARCEL_TYPES = list(constants.PARCEL_RATES_PER_SECOND)
+
+ACCOUNT_NAME_BYTES = 24
+
+# One packed record per account (50 bytes). 'parcels' holds one count per PARCEL_TYPES entry, so
+# store.records["parcels"] is an (accounts x rarities) matrix without any copying.
+PORTFOLIO_DTYPE = np.dtype([
+    ("account", f"S{ACCOUNT_NAME_BYTES}"),
+    ("parcels", "<i4", (len(PARCEL_TYPES),)),
+    ("badges", "<i4"),
+    ("region", "u1"),
+    ("boost_hours", "<f4"),
+    ("srb_forced", "?"),
+])
+
+# Rows read from a CSV file per step while importing, so a large file never sits in memory as dicts
+IMPORT_CHUNK_ROWS = 65_536
+
+# Badge counts where each passport boost tier starts, ascending; an account's badge tier is its position here
+BADGE_TIER_COUNTS = np.array(sorted(constants.BADGE_BOOST_TIERS), dtype=np.int64)
+
+# FleetIndex keys pack (region, tier bucket + 1, badge tier) into one int64, region first
+_REGION_SHIFT = 48
+_BUCKET_SHIFT = 16
+
+
+class PortfolioRow:
+    """A view of one account in a PortfolioStore; reads and writes go straight to the array."""
+    __slots__ = ("_records", "_index")
+
+    def __init__(self, records, index):
+        self._records = records
+        self._index = index
+
+    @property
+    def account(self):
+        return self._records["account"][self._index].decode("utf-8", "replace")
+
+    @property
+    def parcels(self):
+        """Parcel counts as the {"common": n, ...} mapping used by utils."""
+        return dict(zip(PARCEL_TYPES, self._records["parcels"][self._index].tolist()))
+
+    @parcels.setter
+    def parcels(self, parcel_counts):
+        self._records["parcels"][self._index] = [parcel_counts.get(p_type, 0) for p_type in PARCEL_TYPES]
+
+    @property
+    def total_parcels(self):
+        return int(self._records["parcels"][self._index].sum())
+
+    @property
+    def badges(self):
+        return int(self._records["badges"][self._index])
+
+    @badges.setter
+    def badges(self, value):
+        self._records["badges"][self._index] = value
+
+    @property
+    def region(self):
+        return REGIONS[self._records["region"][self._index]]
+
+    @region.setter
+    def region(self, value):
+        self._records["region"][self._index] = REGIONS.index(value)
+
+    @property
+    def boost_hours(self):
+        return float(self._records["boost_hours"][self._index])
+
+    @boost_hours.setter
+    def boost_hours(self, value):
+        self._records["boost_hours"][self._index] = value
+
+    @property
+    def srb_forced(self):
+        return bool(self._records["srb_forced"][self._index])
+
+    @srb_forced.setter
+    def srb_forced(self, value):
+        self._records["srb_forced"][self._index] = value
+
+    def __repr__(self):
+        return (f"PortfolioRow(account={self.account!r}, parcels={self.parcels}, badges={self.badges}, "
+                f"region={self.region!r}, boost_hours={self.boost_hours:g}, srb_forced={self.srb_forced})")
+
+
+class PortfolioStore:
+    """
+    Many accounts in one structured array (PORTFOLIO_DTYPE), usually memory-mapped from a .npy
+    file. Whole-fleet calculations use the columns directly. Indexing returns PortfolioRow
+    views for single accounts.
+    """
+    def __init__(self, records):
+        if records.dtype != PORTFOLIO_DTYPE:
+            raise ValueError("Not a portfolio store: unexpected record layout.")
+        self.records = records
+
+    @classmethod
+    def empty(cls, count):
+        return cls(np.zeros(count, dtype=PORTFOLIO_DTYPE))
+
+    @classmethod
+    def open(cls, file_path, mode="r"):
+        """Memory-maps a store saved with save(); mode 'r' is read-only, 'r+' writes changes back to the file."""
+        return cls(np.load(file_path, mmap_mode=mode, allow_pickle=False))
+
+    def save(self, file_path):
+        """Writes the store as a .npy file that open() can memory-map."""
+        output = np.lib.format.open_memmap(file_path, mode="w+", dtype=PORTFOLIO_DTYPE, shape=self.records.shape)
+        output[:] = self.records
+        output.flush()
+        del output
+
+    @classmethod
+    def from_fleet_file(cls, file_path):
+        """
+        Imports a CSV with the boost_scheduler fleet columns (account, common, rare, epic, legendary,
+        badges, region) plus optional boost_hours and srb_forced, IMPORT_CHUNK_ROWS rows at a time.
+        """
+        chunks = []
+        with open(file_path, newline='') as fleet_file:
+            reader = csv.reader(fleet_file)
+            header = [name.strip().lower() for name in next(reader, [])]
+            if "account" not in header:
+                raise ValueError("The fleet file needs an 'account' column.")
+            columns = {name: index for index, name in enumerate(header)}
+            region_codes = {region: code for code, region in enumerate(REGIONS)}
+            rows = []
+            for line_number, row in enumerate(reader, start=2):
+                if not any(cell.strip() for cell in row):
+                    continue
+                rows.append((line_number, row))
+                if len(rows) == IMPORT_CHUNK_ROWS:
+                    chunks.append(cls._records_from_rows(rows, columns, region_codes))
+                    rows = []
+            if rows or not chunks:
+                chunks.append(cls._records_from_rows(rows, columns, region_codes))
+        return cls(np.concatenate(chunks))
+
+    @staticmethod
+    def _records_from_rows(rows, columns, region_codes):
+        records = np.zeros(len(rows), dtype=PORTFOLIO_DTYPE)
+
+        def cell(row, name, default):
+            index = columns.get(name)
+            value = row[index].strip() if index is not None and index < len(row) else ""
+            return value or default
+
+        for position, (line_number, row) in enumerate(rows):
+            try:
+                account = cell(row, "account", "")
+                if not account:
+                    raise ValueError("every account needs a name in the 'account' column")
+                region = cell(row, "region", "United States")
+                if region not in region_codes:
+                    raise ValueError(f"unknown region '{region}'")
+                records[position] = (account.encode("utf-8")[:ACCOUNT_NAME_BYTES],
+                                     [int(cell(row, p_type, "0")) for p_type in PARCEL_TYPES],
+                                     int(cell(row, "badges", "0")), region_codes[region],
+                                     float(cell(row, "boost_hours", "0")),
+                                     cell(row, "srb_forced", "false").lower() in ("1", "true", "yes"))
+            except ValueError as e:
+                raise ValueError(f"Line {line_number}: {e}")
+        return records
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getitem__(self, index):
+        if not -len(self.records) <= index < len(self.records):
+            raise IndexError("portfolio index out of range")
+        return PortfolioRow(self.records, index % len(self.records))
+
+    def __iter__(self):
+        return (PortfolioRow(self.records, index) for index in range(len(self.records)))
+
+    def total_parcels(self):
+        return self.records["parcels"].sum(axis=1, dtype=np.int64)
+
+    def rent_and_multipliers(self, indices=None):
+        """
+        Badge-boosted rent per second and ad boost multiplier of every account (or of 'indices'),
+        one region at a time for the ad tiers. Returns (records, rent_per_second, ad_multiplier).
+        """
+        records = self.records if indices is None else self.records[indices]
+        rates = np.array([constants.PARCEL_RATES_PER_SECOND[p_type] for p_type in PARCEL_TYPES])
+        rent_per_second = (records["parcels"] @ rates) * earnings_model.passport_boost_multipliers(records["badges"])
+        total_parcels = records["parcels"].sum(axis=1, dtype=np.int64)
+        ad_multiplier = np.ones(len(records))
+        for code in np.unique(records["region"]):
+            in_region = records["region"] == code
+            ad_multiplier[in_region] = earnings_model.ad_boost_multipliers(total_parcels[in_region], REGIONS[code])
+        return records, rent_per_second, ad_multiplier
+
+    def monthly_earnings(self, indices=None, srb_hours_per_month=None):
+        """
+        Base and boosted monthly earnings of every account (or of 'indices'), computed straight
+        from the columns with the vectorized model. Returns (base, boosted) arrays.
+        srb_hours_per_month defaults to SRB_HOURS_PER_MONTH (see boosted_seconds_factor).
+        """
+        records, rent_per_second, ad_multiplier = self.rent_and_multipliers(indices)
+        base = rent_per_second * constants.AVG_DAYS_PER_MONTH * constants.SECONDS_PER_DAY
+        boosted = rent_per_second * earnings_model.boosted_seconds_factor(
+            ad_multiplier, records["boost_hours"].astype(np.float64), records["srb_forced"], "month",
+            srb_hours_per_month)
+        return base, boosted
+
+
+class FleetIndex:
+    """
+    The boosted monthly earnings of every account in a PortfolioStore, with the accounts sorted
+    by (region, tier bucket, badge tier). An account's tier bucket is the last tier row of its
+    region whose 'min' is at or below its parcel count (-1 below the first), so the buckets of a
+    region are consecutive parcel ranges and each (region, bucket) is one slice of the order.
+    Editing tier row i can only move accounts between buckets i-1 and i or change what bucket i
+    pays, so apply_tier_edit() recomputes the accounts of that one slice whose parcel count falls
+    in the old or new range of the row, and leaves every other account as it was.
+    The index describes the store as it was when built; rebuild it after changing accounts.
+    Tier edits go into the index's own copies of the tier tables (self.tier_tables), so they
+    stack on one index and never reach the shipped tables or other calculations.
+    srb_hours_per_month defaults to SRB_HOURS_PER_MONTH (see boosted_seconds_factor).
+    """
+    def __init__(self, store, srb_hours_per_month=None):
+        self.store = store
+        self.srb_hours_per_month = srb_hours_per_month
+        self.tier_tables = {}
+        records, self.rent_per_second, self.ad_multiplier = store.rent_and_multipliers()
+        self.total_parcels = store.total_parcels()
+        self.regions = records["region"].astype(np.int64)
+        self.badge_tiers = np.searchsorted(BADGE_TIER_COUNTS, records["badges"], side="right") - 1
+        self.boost_hours = records["boost_hours"].astype(np.float64)
+        self.srb_forced = records["srb_forced"].copy()
+        self.boosted = self.rent_per_second * earnings_model.boosted_seconds_factor(
+            self.ad_multiplier, self.boost_hours, self.srb_forced, "month", srb_hours_per_month)
+
+        buckets = np.empty(len(records), dtype=np.int64)
+        for code in np.unique(self.regions):
+            in_region = self.regions == code
+            buckets[in_region] = self._buckets(self.total_parcels[in_region], REGIONS[code])
+        keys = self._keys(self.regions, buckets, self.badge_tiers)
+        self.order = np.argsort(keys, kind="stable")
+        self.sorted_keys = keys[self.order]
+
+    def tier_table(self, region):
+        """The region's tiers as this index sees them: its edited copy, or the shipped table."""
+        return self.tier_tables.get(region) or earnings_model.compile_tier_table(region)
+
+    def _buckets(self, total_parcels, region):
+        return np.searchsorted(self.tier_table(region).mins, total_parcels, side="right") - 1
+
+    @staticmethod
+    def _keys(regions, buckets, badge_tiers):
+        return (regions << _REGION_SHIFT) | ((buckets + 1) << _BUCKET_SHIFT) | badge_tiers
+
+    def bucket_slice(self, region, first_bucket, last_bucket):
+        """The slice of self.order holding a region's accounts in tier buckets first_bucket..last_bucket."""
+        code = REGIONS.index(region)
+        bounds = self._keys(code, np.array([first_bucket, last_bucket + 1]), 0)
+        start, stop = np.searchsorted(self.sorted_keys, bounds)
+        return slice(int(start), int(stop))
+
+    def apply_tier_edit(self, region, row, tier_min, tier_max, multiplier):
+        """
+        Edits tier row 'row' of the index's copy of a region's tiers (earnings_model.edit_tier_row)
+        and recomputes only the accounts it can affect. Returns an impact report: the old and new
+        tier, how many accounts were checked and recomputed, the fleet's boosted monthly total
+        before and after, and one 'cells' entry per (tier bucket, badge tier) that changed, with
+        its accounts and totals.
+        """
+        start = time.perf_counter()
+        table = self.tier_table(region)
+        edited = earnings_model.edit_tier_row(table, row, tier_min, tier_max, multiplier)
+        old_tier = {'min': int(table.mins[row]), 'max': int(table.maxs[row]), 'multiplier': float(table.multipliers[row])}
+        self.tier_tables[region] = edited
+        checked = self.bucket_slice(region, row - 1, row)
+        positions = self.order[checked]
+        parcels = self.total_parcels[positions]
+        affected = positions[(parcels >= min(old_tier['min'], tier_min)) & (parcels <= max(old_tier['max'], tier_max))]
+
+        before = self.boosted[affected]
+        self.ad_multiplier[affected] = earnings_model.tier_table_multipliers(edited, self.total_parcels[affected])
+        self.boosted[affected] = self.rent_per_second[affected] * earnings_model.boosted_seconds_factor(
+            self.ad_multiplier[affected], self.boost_hours[affected], self.srb_forced[affected], "month",
+            self.srb_hours_per_month)
+        after = self.boosted[affected]
+
+        # Accounts crossing between buckets i-1 and i stay inside the slice, so only it is re-sorted
+        keys = self._keys(self.regions[positions], self._buckets(parcels, region), self.badge_tiers[positions])
+        resorted = np.argsort(keys, kind="stable")
+        self.order[checked] = positions[resorted]
+        self.sorted_keys[checked] = keys[resorted]
+
+        cell_keys = self._keys(self.regions[affected], self._buckets(self.total_parcels[affected], region), self.badge_tiers[affected])
+        cells, cell_of = np.unique(cell_keys, return_inverse=True)
+        cell_accounts = np.bincount(cell_of, minlength=len(cells))
+        cell_before = np.bincount(cell_of, weights=before, minlength=len(cells))
+        cell_after = np.bincount(cell_of, weights=after, minlength=len(cells))
+        fleet_after = float(self.boosted.sum())
+        return {
+            "region": region,
+            "row": row,
+            "old_tier": old_tier,
+            "new_tier": {'min': tier_min, 'max': tier_max, 'multiplier': multiplier},
+            "accounts_checked": len(positions),
+            "accounts_recomputed": len(affected),
+            "accounts_changed": int(np.count_nonzero(after != before)),
+            "fleet_before": fleet_after - float(after.sum() - before.sum()),
+            "fleet_after": fleet_after,
+            "cells": [{"tier_row": int(((key >> _BUCKET_SHIFT) & 0xFFFFFFFF) - 1),
+                       "badge_tier_start": int(BADGE_TIER_COUNTS[key & 0xFFFF]),
+                       "accounts": int(count), "before": float(total_before), "after": float(total_after)}
+                      for key, count, total_before, total_after in zip(cells.tolist(), cell_accounts, cell_before, cell_after)
+                      if total_before != total_after],
+            "seconds": time.perf_counter() - start,
+        }
+
+
+def describe_tier_edit(report):
+    """Multi-line impact report of FleetIndex.apply_tier_edit() for dialogs and the command line."""
+    old, new = report["old_tier"], report["new_tier"]
+    change = report["fleet_after"] - report["fleet_before"]
+    lines = [
+        f"{report['region']} tier row {report['row']}: {old['min']}-{old['max']} at {old['multiplier']:g}x "
+        f"-> {new['min']}-{new['max']} at {new['multiplier']:g}x",
+        f"Accounts recomputed: {report['accounts_recomputed']:,} of {report['accounts_checked']:,} checked "
+        f"({report['accounts_changed']:,} changed) in {report['seconds'] * 1000:.1f} ms",
+        f"Fleet monthly boosted earnings: ${report['fleet_before']:.8f} -> ${report['fleet_after']:.8f} ({change:+.8f})",
+    ]
+    for cell in report["cells"]:
+        lines.append(f"  Tier row {cell['tier_row']}, badges from {cell['badge_tier_start']}: {cell['accounts']:,} accounts, "
+                     f"${cell['before']:.8f} -> ${cell['after']:.8f} ({cell['after'] - cell['before']:+.8f})")
+    return "\n".join(lines)
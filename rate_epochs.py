@@ -0,0 +1,92 @@
+# rate_epochs.py
+
+import bisect
+import datetime
+import math
+
+import constants
+import utils
+
+
+def parse_date(value):
+    """Accepts a datetime.date or a 'YYYY-MM-DD' string."""
+    if isinstance(value, datetime.date):
+        return value
+    return datetime.datetime.strptime(value.strip(), "%Y-%m-%d").date()
+
+
+def epoch_start_days(epochs=None):
+    """
+    Start of each epoch as a day number (date ordinal). The first epoch has no start date and
+    covers all earlier days, so any day works as its origin; 0 is used.
+    """
+    epochs = epochs or constants.RATE_EPOCHS
+    starts = [0]
+    for epoch in epochs[1:]:
+        starts.append(parse_date(epoch["start"]).toordinal())
+    if any(later <= earlier for earlier, later in zip(starts[1:], starts[2:])):
+        raise ValueError("RATE_EPOCHS must be listed oldest first, with distinct start dates.")
+    return starts
+
+
+class EarningsProjection:
+    """
+    Cumulative earnings of one account across rate epochs. Each epoch's daily earnings are
+    computed once from its own tables, and prefix sums over the epochs give the total earned
+    up to the start of each one, so any date-range total is one binary search plus a
+    multiply-add per end point, however long the range is.
+    """
+    def __init__(self, parcel_counts, badge_count, boost_hours, srb_forced, region,
+                 fictive_badge_multiplier=None, epochs=None, srb_hours_per_month=None):
+        epochs = epochs or constants.RATE_EPOCHS
+        self.starts = epoch_start_days(epochs)
+        self.base_daily = []
+        self.boosted_daily = []
+        for epoch in epochs:
+            badge_multiplier = fictive_badge_multiplier or utils.get_passport_boost_multiplier(badge_count, epoch["badge_tiers"])
+            earnings, _ = utils.calculate_timeframe_earnings(parcel_counts, badge_multiplier, boost_hours,
+                                                             srb_forced, region, epoch, srb_hours_per_month)
+            # The monthly figure spreads the monthly SRB hours over the month, so use its daily share
+            base_monthly, boosted_monthly = earnings["month"]
+            self.base_daily.append(base_monthly / constants.AVG_DAYS_PER_MONTH)
+            self.boosted_daily.append(boosted_monthly / constants.AVG_DAYS_PER_MONTH)
+
+        self._base_prefix = self._prefix_sums(self.base_daily)
+        self._boosted_prefix = self._prefix_sums(self.boosted_daily)
+
+    def _prefix_sums(self, daily):
+        """Earnings from the first epoch's origin to the start of each epoch."""
+        prefix = [0.0]
+        for index in range(1, len(self.starts)):
+            prefix.append(prefix[-1] + daily[index - 1] * (self.starts[index] - self.starts[index - 1]))
+        return prefix
+
+    def _cumulative(self, day, daily, prefix):
+        index = max(bisect.bisect_right(self.starts, day) - 1, 0)
+        return prefix[index] + daily[index] * (day - self.starts[index])
+
+    def earnings_between(self, start_date, end_date, boosted=True):
+        """Total earned from the start of start_date to the start of end_date (i.e. end_date excluded)."""
+        daily, prefix = (self.boosted_daily, self._boosted_prefix) if boosted else (self.base_daily, self._base_prefix)
+        start_day, end_day = parse_date(start_date).toordinal(), parse_date(end_date).toordinal()
+        return self._cumulative(end_day, daily, prefix) - self._cumulative(start_day, daily, prefix)
+
+    def date_reaching(self, amount, start_date, boosted=True):
+        """
+        The first date by which 'amount' has been earned since start_date, or None if the rate is
+        zero from some point on and the amount is never reached. Searches the prefix sums, not days.
+        """
+        daily, prefix = (self.boosted_daily, self._boosted_prefix) if boosted else (self.base_daily, self._base_prefix)
+        start_day = parse_date(start_date).toordinal()
+        if amount <= 0:
+            return datetime.date.fromordinal(start_day)
+        target = self._cumulative(start_day, daily, prefix) + amount
+        # Prefix sums never decrease, so the epoch in which the target falls is found by bisection
+        index = max(bisect.bisect_right(prefix, target) - 1, bisect.bisect_right(self.starts, start_day) - 1, 0)
+        if daily[index] <= 0:
+            # Only the last epoch can be flat here: an earlier one would end below the target
+            return None
+        day = math.ceil(self.starts[index] + (target - prefix[index]) / daily[index])
+        if day > datetime.date.max.toordinal():
+            return None
+        return datetime.date.fromordinal(max(start_day, day))
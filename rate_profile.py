@@ -0,0 +1,56 @@
+# rate_profile.py
+
+import json
+from collections import namedtuple
+
+import constants
+
+# The effective SRB hours per month and rarity mix ('mixed' parcels) that calculations use.
+# main.py owns the active profile and passes it along with the inputs; the model functions
+# take it as srb_hours_per_month= and mix= arguments, so the constants always stay as shipped.
+RateProfile = namedtuple("RateProfile", ["srb_hours_per_month", "parcel_probabilities"])
+
+DEFAULT_PROFILE = RateProfile(constants.SRB_HOURS_PER_MONTH, dict(constants.PARCEL_PROBABILITIES))
+
+
+def profile_from_dict(data):
+    """
+    Builds a RateProfile from a dict with 'srb_hours_per_month' and 'parcel_probabilities', such
+    as a calibration.fit_rent_log() result or a saved profile file. Raises ValueError if invalid.
+    """
+    try:
+        srb_hours_per_month = float(data["srb_hours_per_month"])
+        mix = {p_type: float(share) for p_type, share in data["parcel_probabilities"].items()}
+    except (KeyError, TypeError, AttributeError, ValueError):
+        raise ValueError("A profile needs 'srb_hours_per_month' and a 'parcel_probabilities' mapping.")
+    if not 0 <= srb_hours_per_month <= constants.AVG_DAYS_PER_MONTH * 24:
+        raise ValueError("The profile's SRB hours per month must be between 0 and the hours in a month.")
+    if set(mix) != set(constants.PARCEL_RATES_PER_SECOND) or min(mix.values()) < 0 or sum(mix.values()) <= 0:
+        raise ValueError("The profile's rarity mix needs a non-negative share for each of "
+                         f"{', '.join(constants.PARCEL_RATES_PER_SECOND)}.")
+    return RateProfile(srb_hours_per_month, mix)
+
+
+def load_profile(file_path):
+    """Reads a profile saved with save_profile() (or any JSON holding a fitted profile)."""
+    with open(file_path) as profile_file:
+        try:
+            data = json.load(profile_file)
+        except ValueError as e:
+            raise ValueError(f"Not a profile file: {e}")
+    return profile_from_dict(data)
+
+
+def save_profile(file_path, data):
+    """Writes a profile (a RateProfile, or a dict such as a fitted profile) as JSON for load_profile()."""
+    if isinstance(data, RateProfile):
+        data = data._asdict()
+    with open(file_path, "w") as profile_file:
+        json.dump(data, profile_file, indent=2)
+
+
+def describe_rate_profile(profile):
+    """One line naming the profile, e.g. for a status label."""
+    if profile == DEFAULT_PROFILE:
+        return "Defaults"
+    return f"Calibrated ({profile.srb_hours_per_month:.1f} SRB h/month)"
@@ -0,0 +1,164 @@
+# reinvestment.py
+
+from collections import namedtuple
+
+import numpy as np
+
+import constants
+import earnings_model
+import utils
+
+# One reinvestment strategy: the share of earnings put back into parcels, the rarity mix
+# bought (e.g. {"common": 70, "rare": 30}) and the daily ad boost hours
+Strategy = namedtuple("Strategy", ["name", "reinvest_fraction", "mix", "boost_hours"])
+
+# No strategy buys past this count, so very cheap parcels cannot run the simulation away
+MAX_SIMULATED_PARCELS = 1_000_000
+
+_EULER_GAMMA = 0.5772156649015329
+
+# Recurrence steps taken before the asymptotic series, which is then accurate to ~1e-12
+_DIGAMMA_SHIFT = 16
+
+
+def harmonic(x):
+    """
+    H(x) = 1 + 1/2 + ... + 1/x for integer x >= 0, extended to real x > -1 as digamma(x + 1) + gamma,
+    so H(x + 1) - H(x) = 1 / (x + 1) holds for fractional x too.
+    """
+    z = np.asarray(x, dtype=np.float64) + 1.0
+    shift = np.zeros_like(z)
+    for step in range(_DIGAMMA_SHIFT):
+        shift += 1.0 / (z + step)
+    z = z + _DIGAMMA_SHIFT
+    inverse_square = 1.0 / (z * z)
+    digamma = np.log(z) - 0.5 / z - inverse_square * (1.0 / 12 - inverse_square * (1.0 / 120 - inverse_square / 252))
+    return digamma - shift + _EULER_GAMMA
+
+
+def harmonic_floor_inverse(value, offset=0.0):
+    """The largest integer n >= 0 with H(n + offset) <= value, for arrays of values and offsets."""
+    value = np.asarray(value, dtype=np.float64)
+    offset = np.asarray(offset, dtype=np.float64)
+    # Newton steps on the real inverse, starting from H(x) ~ ln(x + 0.5) + gamma
+    with np.errstate(over="ignore"):
+        x = np.clip(np.exp(value - _EULER_GAMMA) - 0.5, 0.0, 2.0 ** 62)
+    for _ in range(3):
+        x = np.clip(x - (harmonic(x) - value) * (x + 0.5), 0.0, 2.0 ** 62)
+    n = np.maximum(np.floor(x - offset), 0)
+    # Within one of the answer now; settle it against H itself
+    for _ in range(2):
+        n = np.where(harmonic(n + offset) > value, np.maximum(n - 1, 0), n)
+        n = np.where(harmonic(n + 1 + offset) <= value, n + 1, n)
+    return n
+
+
+def _rate_segments(region, first, last):
+    """
+    Splits parcel counts first..last-1 into runs with one ad boost multiplier.
+    Returns (starts, ends, multipliers), with ends exclusive.
+    """
+    table = earnings_model.compile_tier_table(region)
+    breaks = np.unique(np.concatenate([[first, last], table.mins, table.maxs + 1]))
+    breaks = breaks[(breaks >= first) & (breaks <= last)]
+    starts, ends = breaks[:-1], breaks[1:]
+    return starts, ends, earnings_model.ad_boost_multipliers(starts, region)
+
+
+def simulate_reinvestment(strategies, parcel_counts, starting_balance, parcel_cost, horizon_days, region,
+                          badge_mult=1.0, srb_forced=False, max_parcels=MAX_SIMULATED_PARCELS, srb_hours_per_month=None):
+    """
+    Simulates every strategy side by side for horizon_days, starting from the holdings in
+    parcel_counts. The reinvested share of earnings fills a balance that buys one parcel of the
+    strategy's mix as soon as it reaches parcel_cost.
+    Within a tier the daily earnings at m parcels are k x (m + offset): k is the mix rate
+    and the offset accounts for the rarities already held. Buying at count m therefore takes
+    parcel_cost / (fraction x k x (m + offset)) days, and crossing a whole tier takes a
+    difference of harmonic numbers. The count held at the horizon comes from inverting H.
+    Each tier is one closed-form jump for all strategies at once, with no stepping by day
+    or by parcel, and each tier re-evaluates the ad boost multiplier (including tier drops).
+
+    Returns a dict of per-strategy arrays: 'final_parcels', 'final_daily' (boosted daily
+    earnings at the horizon), 'total_earned', 'cash_out' (the share not reinvested) and
+    'balance' (left towards the next parcel). Also returns 'tier_mins' (the tiers above the
+    starting count) and 'tier_days' (strategies x tiers, the day each tier was reached,
+    inf if it was not reached within the horizon).
+    """
+    if parcel_cost <= 0:
+        raise ValueError("Parcel cost must be greater than zero.")
+    starting_parcels = sum(parcel_counts.values())
+    starting_rate = utils.calculate_base_earnings_per_second(parcel_counts)
+    if starting_parcels < 1 or starting_rate <= 0:
+        raise ValueError("Reinvesting needs at least one parcel to start from.")
+    fractions = np.clip(np.array([s.reinvest_fraction for s in strategies], dtype=np.float64), 0.0, 1.0)
+    mix_rates = np.array([earnings_model.mix_rate_per_second(s.mix) for s in strategies])
+    boost_hours = np.array([s.boost_hours for s in strategies], dtype=np.float64)
+
+    # The starting balance buys what it can right away; the rest goes towards the next parcel
+    free_parcels = min(int(starting_balance // parcel_cost), max(max_parcels - starting_parcels, 0))
+    parcels = np.full(len(strategies), starting_parcels + free_parcels, dtype=np.int64)
+    balance = starting_balance - free_parcels * parcel_cost
+    offsets = starting_rate / mix_rates - starting_parcels
+
+    def daily_per_parcel(ad_multiplier):
+        """k: daily earnings per unit of (count + offset) at this ad multiplier."""
+        return mix_rates * badge_mult * earnings_model.boosted_seconds_factor(
+            ad_multiplier, boost_hours, srb_forced, "month", srb_hours_per_month) / constants.AVG_DAYS_PER_MONTH
+
+    day = np.zeros(len(strategies))
+    total_earned = np.zeros(len(strategies))
+
+    table = earnings_model.compile_tier_table(region)
+    tier_mins = table.mins[(table.mins > starting_parcels) & (table.mins <= max_parcels)]
+    tier_days = np.where(tier_mins <= parcels[:1], 0.0, np.inf) * np.ones((len(strategies), 1))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # The first purchase only needs what the starting balance does not cover
+        first_daily = (parcels + offsets) * daily_per_parcel(earnings_model.ad_boost_multipliers(parcels, region))
+        first_gap = np.where(parcels < max_parcels, (parcel_cost - balance) / (fractions * first_daily), np.inf)
+        running = first_gap <= horizon_days
+        total_earned += np.where(running, first_daily * first_gap, 0.0)
+        day = np.where(running, first_gap, day)
+        tier_days[:, tier_mins == parcels[0] + 1] = np.where(running, day, np.inf)[:, None]
+        parcels = parcels + running
+
+        for seg_start, seg_end, ad_multiplier in zip(*_rate_segments(region, parcels.min(), max_parcels)):
+            active = running & (parcels >= seg_start) & (parcels < seg_end)
+            if not active.any():
+                continue
+            # Days per unit of harmonic number while buying inside this segment
+            scale = parcel_cost / (fractions * daily_per_parcel(ad_multiplier))
+            to_end = scale * (harmonic(seg_end - 1 + offsets) - harmonic(parcels - 1 + offsets))
+            crosses = active & (day + to_end <= horizon_days)
+            tier_column = tier_mins == seg_end
+            tier_days[:, tier_column] = np.where(crosses[:, None], (day + to_end)[:, None], tier_days[:, tier_column])
+            # Every purchase interval earns exactly parcel_cost / fraction before the next parcel
+            total_earned += np.where(crosses, (seg_end - parcels) * parcel_cost / fractions, 0.0)
+            day = np.where(crosses, day + to_end, day)
+            parcels = np.where(crosses, seg_end, parcels)
+            running = running & ~(active & ~crosses)
+
+    # Whatever count is held when the horizon (or the parcel cap) stops the buying
+    k = daily_per_parcel(earnings_model.ad_boost_multipliers(parcels, region))
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        scale = parcel_cost / (fractions * k)
+        target = harmonic(parcels - 1 + offsets) + (horizon_days - day) / scale
+        reachable = harmonic_floor_inverse(np.where(np.isfinite(target), target, 0.0), offsets) + 1
+        can_buy = np.isfinite(scale) & (parcels < max_parcels)
+        held = np.maximum(np.where(can_buy, np.minimum(reachable, max_parcels), parcels), parcels).astype(np.int64)
+        bought = held > parcels
+        held_since = day + np.where(bought, scale * (harmonic(held - 1 + offsets) - harmonic(parcels - 1 + offsets)), 0.0)
+        total_earned += np.where(bought, (held - parcels) * parcel_cost / fractions, 0.0)
+    final_daily = (held + offsets) * k
+    total_earned += final_daily * (horizon_days - held_since)
+
+    purchased_cost = (held - starting_parcels) * parcel_cost
+    return {
+        "final_parcels": held,
+        "final_daily": final_daily,
+        "total_earned": total_earned,
+        "cash_out": total_earned * (1.0 - fractions),
+        "balance": starting_balance + total_earned * fractions - purchased_cost,
+        "tier_mins": tier_mins,
+        "tier_days": tier_days,
+    }
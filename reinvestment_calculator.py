@@ -0,0 +1,203 @@
+# reinvestment_calculator.py
+
+import json
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+import numpy as np
+
+import constants
+import earnings_model
+import reinvestment
+
+# Strategies shown until the user edits the list: (name, reinvest %, mix %, boost hours)
+DEFAULT_STRATEGIES = [
+    ("Reinvest All", 100, {"common": 100}, 4.0),
+    ("Reinvest Half", 50, {"common": 100}, 4.0),
+    ("Cash Out", 0, {"common": 100}, 4.0),
+]
+
+class ReinvestmentCalculator:
+    def __init__(self, parent_frame, get_user_inputs_callback):
+        self.parent_frame = parent_frame
+        self.get_user_inputs_callback = get_user_inputs_callback
+
+        self.parcel_cost_var = tk.StringVar(value="1.00")
+        self.starting_balance_var = tk.StringVar(value="0.00")
+        self.horizon_years_var = tk.StringVar(value="3")
+
+        # The strategy list lives in a StringVar (as JSON) so that sessions save and restore it
+        self.strategies_var = tk.StringVar(value=json.dumps([
+            {"name": name, "reinvest_percent": percent, "mix": mix, "boost_hours": hours}
+            for name, percent, mix, hours in DEFAULT_STRATEGIES]))
+        self.strategy_name_var = tk.StringVar(value="")
+        self.reinvest_percent_var = tk.StringVar(value="100")
+        self.mix_vars = {p_type: tk.StringVar(value="100" if p_type == "common" else "0")
+                         for p_type in constants.PARCEL_RATES_PER_SECOND}
+        self.strategy_boost_hours_var = tk.StringVar(value="4")
+
+        self._create_widgets()
+        self.strategies_var.trace_add("write", lambda *args: self._show_strategies())
+        self._show_strategies()
+
+    def _create_widgets(self):
+        input_frame = ttk.LabelFrame(self.parent_frame, text="Reinvestment Inputs (starting from your current parcels)")
+        input_frame.pack(padx=10, pady=10, fill="x")
+        ttk.Label(input_frame, text="Parcel Cost ($):").grid(row=0, column=0, sticky="w", padx=5, pady=2)
+        ttk.Entry(input_frame, width=10, textvariable=self.parcel_cost_var).grid(row=0, column=1, sticky="w", padx=5, pady=2)
+        ttk.Label(input_frame, text="Starting Balance ($):").grid(row=0, column=2, sticky="w", padx=5, pady=2)
+        ttk.Entry(input_frame, width=10, textvariable=self.starting_balance_var).grid(row=0, column=3, sticky="w", padx=5, pady=2)
+        ttk.Label(input_frame, text="Years:").grid(row=0, column=4, sticky="w", padx=5, pady=2)
+        ttk.Entry(input_frame, width=6, textvariable=self.horizon_years_var).grid(row=0, column=5, sticky="w", padx=5, pady=2)
+
+        strategy_frame = ttk.LabelFrame(self.parent_frame, text="Strategies")
+        strategy_frame.pack(padx=10, pady=5, fill="x")
+        edit_frame = ttk.Frame(strategy_frame)
+        edit_frame.pack(fill="x", padx=5, pady=2)
+        ttk.Label(edit_frame, text="Name:").pack(side="left")
+        ttk.Entry(edit_frame, width=14, textvariable=self.strategy_name_var).pack(side="left", padx=(2, 8))
+        ttk.Label(edit_frame, text="Reinvest %:").pack(side="left")
+        ttk.Entry(edit_frame, width=5, textvariable=self.reinvest_percent_var).pack(side="left", padx=(2, 8))
+        for p_type, var in self.mix_vars.items():
+            ttk.Label(edit_frame, text=f"{p_type.capitalize()} %:").pack(side="left")
+            ttk.Entry(edit_frame, width=5, textvariable=var).pack(side="left", padx=(2, 8))
+        ttk.Label(edit_frame, text="Boost Hours:").pack(side="left")
+        ttk.Entry(edit_frame, width=5, textvariable=self.strategy_boost_hours_var).pack(side="left", padx=(2, 8))
+
+        button_frame = ttk.Frame(strategy_frame)
+        button_frame.pack(fill="x", padx=5, pady=2)
+        ttk.Button(button_frame, text="Add / Update Strategy", command=self._add_strategy).pack(side="left", padx=5)
+        ttk.Button(button_frame, text="Remove Selected", command=self._remove_selected).pack(side="left", padx=5)
+        ttk.Button(button_frame, text="Simulate", command=self.calculate).pack(side="left", padx=5)
+
+        # One row per strategy: its settings, then its results once simulated
+        columns = ("name", "reinvest", "mix", "boost_hours", "final_parcels", "final_daily", "total_earned", "cash_out")
+        self.strategy_tree = ttk.Treeview(strategy_frame, columns=columns, show="headings", height=6)
+        for column, text, width in [("name", "Strategy", 120), ("reinvest", "Reinvest", 70), ("mix", "Mix (C/R/E/L %)", 120),
+                                    ("boost_hours", "Boost h", 60), ("final_parcels", "Final Parcels", 100),
+                                    ("final_daily", "Final Daily", 110), ("total_earned", "Total Earned", 110),
+                                    ("cash_out", "Cashed Out", 110)]:
+            self.strategy_tree.heading(column, text=text)
+            self.strategy_tree.column(column, width=width, anchor="w" if column in ("name", "mix") else "e")
+        self.strategy_tree.pack(fill="x", padx=5, pady=5)
+        self.strategy_tree.bind("<<TreeviewSelect>>", self._on_select)
+
+        self.status_label = ttk.Label(self.parent_frame, text="Click 'Simulate' to compare the strategies.")
+        self.status_label.pack(padx=10, pady=5, anchor="w")
+
+        # Day each ad boost tier is reached: one row per tier, one column per strategy
+        tier_frame = ttk.LabelFrame(self.parent_frame, text="Days to Reach Each Tier")
+        tier_frame.pack(padx=10, pady=5, fill="both", expand=True)
+        self.tier_tree = ttk.Treeview(tier_frame, show="headings", height=8)
+        self.tier_tree.pack(fill="both", expand=True, padx=5, pady=5)
+
+    def _read_strategies(self):
+        try:
+            return json.loads(self.strategies_var.get())
+        except ValueError:
+            return []
+
+    def _show_strategies(self):
+        self.strategy_tree.delete(*self.strategy_tree.get_children())
+        for strategy in self._read_strategies():
+            mix = "/".join(f"{strategy['mix'].get(p_type, 0):g}" for p_type in constants.PARCEL_RATES_PER_SECOND)
+            self.strategy_tree.insert("", "end", iid=strategy["name"],
+                                      values=(strategy["name"], f"{strategy['reinvest_percent']:g}%", mix,
+                                              f"{strategy['boost_hours']:g}", "", "", "", ""))
+
+    def _on_select(self, event=None):
+        """Loads the selected strategy into the entry fields for editing."""
+        selection = self.strategy_tree.selection()
+        strategy = next((s for s in self._read_strategies() if selection and s["name"] == selection[0]), None)
+        if strategy is None:
+            return
+        self.strategy_name_var.set(strategy["name"])
+        self.reinvest_percent_var.set(f"{strategy['reinvest_percent']:g}")
+        for p_type, var in self.mix_vars.items():
+            var.set(f"{strategy['mix'].get(p_type, 0):g}")
+        self.strategy_boost_hours_var.set(f"{strategy['boost_hours']:g}")
+
+    def _add_strategy(self):
+        """Adds the strategy in the entry fields, replacing one with the same name."""
+        name = self.strategy_name_var.get().strip()
+        try:
+            reinvest_percent = float(self.reinvest_percent_var.get())
+            mix = {p_type: float(var.get() or 0) for p_type, var in self.mix_vars.items()}
+            boost_hours = float(self.strategy_boost_hours_var.get())
+        except ValueError:
+            messagebox.showerror("Input Error", "Please enter valid numbers for the strategy.")
+            return
+        if not name:
+            messagebox.showerror("Input Error", "Please give the strategy a name.")
+            return
+        if not 0 <= reinvest_percent <= 100 or not 0 <= boost_hours <= 24 or min(mix.values()) < 0 or sum(mix.values()) <= 0:
+            messagebox.showerror("Input Error", "Reinvest % must be 0-100, boost hours 0-24, and the mix must have a positive share.")
+            return
+        strategies = [s for s in self._read_strategies() if s["name"] != name]
+        strategies.append({"name": name, "reinvest_percent": reinvest_percent,
+                           "mix": {p_type: share for p_type, share in mix.items() if share}, "boost_hours": boost_hours})
+        self.strategies_var.set(json.dumps(strategies))
+
+    def _remove_selected(self):
+        selection = set(self.strategy_tree.selection())
+        self.strategies_var.set(json.dumps([s for s in self._read_strategies() if s["name"] not in selection]))
+
+    def calculate(self):
+        inputs = self.get_user_inputs_callback()
+        if inputs is None:
+            return
+        try:
+            parcel_cost = float(self.parcel_cost_var.get())
+            starting_balance = float(self.starting_balance_var.get() or 0)
+            horizon_years = float(self.horizon_years_var.get())
+        except ValueError:
+            messagebox.showerror("Input Error", "Please enter valid numbers for cost, balance and years.")
+            return
+        if parcel_cost <= 0 or starting_balance < 0 or horizon_years <= 0:
+            messagebox.showerror("Input Error", "Cost and years must be positive and the balance cannot be negative.")
+            return
+        strategy_settings = self._read_strategies()
+        if not strategy_settings:
+            messagebox.showinfo("No Strategies", "Add at least one strategy to simulate.")
+            return
+
+        strategies = [reinvestment.Strategy(s["name"], s["reinvest_percent"] / 100.0, s["mix"], s["boost_hours"])
+                      for s in strategy_settings]
+        try:
+            result = reinvestment.simulate_reinvestment(
+                strategies, inputs["parcels"], starting_balance, parcel_cost, horizon_years * constants.AVG_DAYS_PER_YEAR,
+                inputs["selected_region"], badge_mult=earnings_model.badge_multiplier(inputs),
+                srb_forced=inputs["srb_boost_enabled"], srb_hours_per_month=inputs["rate_profile"].srb_hours_per_month)
+        except ValueError as e:
+            messagebox.showerror("Input Error", str(e))
+            return
+
+        for index, strategy in enumerate(strategies):
+            self.strategy_tree.set(strategy.name, "final_parcels", f"{result['final_parcels'][index]:,}")
+            self.strategy_tree.set(strategy.name, "final_daily", f"${result['final_daily'][index]:.6f}")
+            self.strategy_tree.set(strategy.name, "total_earned", f"${result['total_earned'][index]:,.4f}")
+            self.strategy_tree.set(strategy.name, "cash_out", f"${result['cash_out'][index]:,.4f}")
+        capped = result["final_parcels"] >= reinvestment.MAX_SIMULATED_PARCELS
+        self.status_label.config(text=f"Simulated {len(strategies)} strategies over {horizon_years:g} years." +
+                                 (f" Some stopped buying at the {reinvestment.MAX_SIMULATED_PARCELS:,} parcel cap." if capped.any() else ""))
+
+        tier_columns = ["tier"] + [f"s{index}" for index in range(len(strategies))]
+        self.tier_tree.delete(*self.tier_tree.get_children())
+        self.tier_tree.config(columns=tier_columns)
+        self.tier_tree.heading("tier", text="Tier From")
+        self.tier_tree.column("tier", width=90, anchor="e")
+        for index, strategy in enumerate(strategies):
+            self.tier_tree.heading(f"s{index}", text=strategy.name)
+            self.tier_tree.column(f"s{index}", width=110, anchor="e")
+        for tier_index, tier_min in enumerate(result["tier_mins"]):
+            days = result["tier_days"][:, tier_index]
+            self.tier_tree.insert("", "end", values=[f"{tier_min:,}"] + [f"{d:,.0f}" if np.isfinite(d) else "-" for d in days])
+
+    def get_session_variables(self):
+        """Returns the tab's input variables, keyed by name, for session save/restore."""
+        return {
+            "parcel_cost": self.parcel_cost_var,
+            "starting_balance": self.starting_balance_var,
+            "horizon_years": self.horizon_years_var,
+            "strategies": self.strategies_var,
+        }
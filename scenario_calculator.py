@@ -0,0 +1,261 @@
+# scenario_calculator.py
+
+import json
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+import numpy as np
+
+import constants
+import earnings_model
+
+# Scenarios shown until the user edits the list. Field values follow the edit row: blank keeps
+# the current input, "+N"/"-N" changes it by N and a plain number replaces it.
+DEFAULT_SCENARIOS = [
+    {"name": "+20 Legendary", "legendary": "+20"},
+    {"name": "50 Badges", "badges": "50"},
+]
+
+SAME_REGION = "(Same)"
+
+# Rows of the comparison: (key, label, format)
+COMPARISON_ROWS = [
+    ("total_parcels", "Total Parcels", "{:,.0f}"),
+    ("badge_multiplier", "Badge Multiplier", "{:.2f}x"),
+    ("boost_hours", "Ad Boost Hours/Day", "{:g}"),
+    ("ad_multiplier", "Ad Boost Multiplier", "{:g}x"),
+    ("day_base", "Per Day (Base)", "${:,.6f}"),
+    ("day", "Per Day (Boosted)", "${:,.6f}"),
+    ("month", "Per Month (Boosted)", "${:,.4f}"),
+    ("year", "Per Year (Boosted)", "${:,.4f}"),
+]
+
+class ScenarioCalculator:
+    def __init__(self, parent_frame, get_user_inputs_callback):
+        self.parent_frame = parent_frame
+        self.get_user_inputs_callback = get_user_inputs_callback
+
+        # The scenario list lives in a StringVar (as JSON) so that sessions save and restore it
+        self.scenarios_var = tk.StringVar(value=json.dumps(DEFAULT_SCENARIOS))
+        self.scenario_name_var = tk.StringVar(value="")
+        self.parcel_change_vars = {p_type: tk.StringVar(value="") for p_type in constants.PARCEL_RATES_PER_SECOND}
+        self.badges_change_var = tk.StringVar(value="")
+        self.boost_hours_change_var = tk.StringVar(value="")
+        self.region_change_var = tk.StringVar(value=SAME_REGION)
+
+        # Evaluated rows of the comparison: the current inputs, and each scenario by name together
+        # with the settings it was evaluated from, so an edit only re-evaluates what changed
+        self._inputs = None
+        self._current = None
+        self._results = {}
+
+        self._create_widgets()
+        self.scenarios_var.trace_add("write", lambda *args: self._on_scenarios_changed())
+        self._show_scenarios()
+
+    def _create_widgets(self):
+        edit_frame = ttk.LabelFrame(self.parent_frame, text="Scenarios (blank = current input, +N/-N = change, N = set)")
+        edit_frame.pack(padx=10, pady=10, fill="x")
+        fields_frame = ttk.Frame(edit_frame)
+        fields_frame.pack(fill="x", padx=5, pady=2)
+        ttk.Label(fields_frame, text="Name:").pack(side="left")
+        ttk.Entry(fields_frame, width=14, textvariable=self.scenario_name_var).pack(side="left", padx=(2, 8))
+        for p_type, var in self.parcel_change_vars.items():
+            ttk.Label(fields_frame, text=f"{p_type.capitalize()}:").pack(side="left")
+            ttk.Entry(fields_frame, width=6, textvariable=var).pack(side="left", padx=(2, 8))
+        ttk.Label(fields_frame, text="Badges:").pack(side="left")
+        ttk.Entry(fields_frame, width=5, textvariable=self.badges_change_var).pack(side="left", padx=(2, 8))
+        ttk.Label(fields_frame, text="Boost h:").pack(side="left")
+        ttk.Entry(fields_frame, width=5, textvariable=self.boost_hours_change_var).pack(side="left", padx=(2, 8))
+
+        region_frame = ttk.Frame(edit_frame)
+        region_frame.pack(fill="x", padx=5, pady=2)
+        ttk.Label(region_frame, text="Region:").pack(side="left")
+        ttk.Combobox(region_frame, textvariable=self.region_change_var, state="readonly", width=24,
+                     values=[SAME_REGION] + list(constants.REGIONAL_AD_BOOST_DATA)).pack(side="left", padx=(2, 8))
+        ttk.Button(region_frame, text="Add / Update Scenario", command=self._add_scenario).pack(side="left", padx=5)
+        ttk.Button(region_frame, text="Remove Selected", command=self._remove_selected).pack(side="left", padx=5)
+
+        columns = ("name",) + tuple(self.parcel_change_vars) + ("badges", "boost_hours", "region")
+        self.scenario_tree = ttk.Treeview(edit_frame, columns=columns, show="headings", height=4)
+        for column in columns:
+            self.scenario_tree.heading(column, text=column.replace("_", " ").title())
+            self.scenario_tree.column(column, width=120 if column in ("name", "region") else 70,
+                                      anchor="w" if column in ("name", "region") else "e")
+        self.scenario_tree.pack(fill="x", padx=5, pady=5)
+        self.scenario_tree.bind("<<TreeviewSelect>>", self._on_select)
+
+        # One row per figure, one column for the current inputs and one per scenario
+        comparison_frame = ttk.LabelFrame(self.parent_frame, text="Comparison (change from current in brackets)")
+        comparison_frame.pack(padx=10, pady=5, fill="both", expand=True)
+        self.comparison_tree = ttk.Treeview(comparison_frame, show="headings", height=len(COMPARISON_ROWS))
+        self.comparison_tree.pack(fill="both", expand=True, padx=5, pady=5)
+
+    def _read_scenarios(self):
+        try:
+            return json.loads(self.scenarios_var.get())
+        except ValueError:
+            return []
+
+    def _show_scenarios(self):
+        self.scenario_tree.delete(*self.scenario_tree.get_children())
+        for scenario in self._read_scenarios():
+            self.scenario_tree.insert("", "end", iid=scenario["name"], values=[
+                scenario["name"], *[scenario.get(p_type, "") for p_type in self.parcel_change_vars],
+                scenario.get("badges", ""), scenario.get("boost_hours", ""), scenario.get("region", "")])
+
+    def _on_select(self, event=None):
+        """Loads the selected scenario into the entry fields for editing."""
+        selection = self.scenario_tree.selection()
+        scenario = next((s for s in self._read_scenarios() if selection and s["name"] == selection[0]), None)
+        if scenario is None:
+            return
+        self.scenario_name_var.set(scenario["name"])
+        for p_type, var in self.parcel_change_vars.items():
+            var.set(scenario.get(p_type, ""))
+        self.badges_change_var.set(scenario.get("badges", ""))
+        self.boost_hours_change_var.set(scenario.get("boost_hours", ""))
+        self.region_change_var.set(scenario.get("region") or SAME_REGION)
+
+    def _add_scenario(self):
+        """Adds the scenario in the entry fields, replacing one with the same name."""
+        name = self.scenario_name_var.get().strip()
+        if not name:
+            messagebox.showerror("Input Error", "Please give the scenario a name.")
+            return
+        scenario = {"name": name}
+        fields = {**self.parcel_change_vars, "badges": self.badges_change_var, "boost_hours": self.boost_hours_change_var}
+        for field, var in fields.items():
+            value = var.get().strip()
+            if value:
+                try:
+                    float(value)
+                except ValueError:
+                    messagebox.showerror("Input Error", f"'{value}' is not a number or a +N/-N change.")
+                    return
+                scenario[field] = value
+        if self.region_change_var.get() != SAME_REGION:
+            scenario["region"] = self.region_change_var.get()
+
+        scenarios = self._read_scenarios()
+        names = [s["name"] for s in scenarios]
+        if name in names:
+            scenarios[names.index(name)] = scenario
+        else:
+            scenarios.append(scenario)
+        self.scenarios_var.set(json.dumps(scenarios))
+
+    def _remove_selected(self):
+        selection = set(self.scenario_tree.selection())
+        self.scenarios_var.set(json.dumps([s for s in self._read_scenarios() if s["name"] not in selection]))
+
+    @staticmethod
+    def _apply_change(text, current):
+        """Blank keeps current, '+N'/'-N' adds to it and 'N' replaces it."""
+        text = (text or "").strip()
+        if not text:
+            return current
+        if text[0] in "+-":
+            return current + float(text)
+        return float(text)
+
+    def _resolve(self, scenarios, inputs):
+        """Per-scenario arrays for earnings_model.scenario_earnings, from the current inputs plus each scenario's changes."""
+        parcel_matrix = np.array([[max(int(self._apply_change(s.get(p_type), inputs["parcels"][p_type])), 0)
+                                   for p_type in constants.PARCEL_RATES_PER_SECOND] for s in scenarios], dtype=np.int64)
+        current_badge_mult = earnings_model.badge_multiplier(inputs)
+        # A scenario that sets badges uses their tier; otherwise the current (possibly fictive) boost applies
+        badge_mults = np.array([earnings_model.passport_boost_multipliers(
+            max(int(self._apply_change(s["badges"], inputs["badge_count"])), 0)) if s.get("badges") else current_badge_mult
+            for s in scenarios], dtype=np.float64)
+        boost_hours = np.clip([self._apply_change(s.get("boost_hours"), inputs["boost_hours"]) for s in scenarios], 0, 24)
+        regions = [s.get("region") or inputs["selected_region"] for s in scenarios]
+        return parcel_matrix, badge_mults, boost_hours, regions
+
+    def _evaluate(self, scenarios, inputs):
+        """Evaluates scenarios in one batched call; returns one {row key: value} dict per scenario."""
+        parcel_matrix, badge_mults, boost_hours, regions = self._resolve(scenarios, inputs)
+        total_parcels, ad_multipliers, earnings = earnings_model.scenario_earnings(
+            parcel_matrix, badge_mults, boost_hours, inputs["srb_boost_enabled"], regions,
+            inputs["rate_profile"].srb_hours_per_month)
+        columns = {
+            "total_parcels": total_parcels,
+            "badge_multiplier": badge_mults,
+            "boost_hours": boost_hours,
+            "ad_multiplier": ad_multipliers,
+            "day_base": earnings["day"][0],
+            "day": earnings["day"][1],
+            "month": earnings["month"][1],
+            "year": earnings["year"][1],
+        }
+        return [{key: float(values[index]) for key, values in columns.items()} for index in range(len(scenarios))]
+
+    def update_display(self):
+        """Re-evaluates the current inputs and every scenario together; called when the main inputs change."""
+        inputs = self.get_user_inputs_callback()
+        if inputs is None:
+            self._inputs, self._current, self._results = None, None, {}
+            self.comparison_tree.delete(*self.comparison_tree.get_children())
+            return
+        scenarios = self._read_scenarios()
+        # The current inputs are the first row of the batch: a scenario with no changes
+        evaluated = self._evaluate([{"name": "Current"}] + scenarios, inputs)
+        self._inputs, self._current = inputs, evaluated[0]
+        self._results = {s["name"]: (s, values) for s, values in zip(scenarios, evaluated[1:])}
+        self._show_comparison()
+
+    def _on_scenarios_changed(self):
+        """Evaluates only the scenarios that were added or edited, then redraws the comparison."""
+        self._show_scenarios()
+        if self._inputs is None:
+            return
+        scenarios = self._read_scenarios()
+        changed = [s for s in scenarios if self._results.get(s["name"], (None,))[0] != s]
+        names = {s["name"] for s in scenarios}
+        self._results = {name: result for name, result in self._results.items() if name in names}
+        if changed:
+            for scenario, values in zip(changed, self._evaluate(changed, self._inputs)):
+                self._results[scenario["name"]] = (scenario, values)
+        self._show_comparison(changed)
+
+    def _show_comparison(self, changed=None):
+        """
+        Fills the comparison table. With 'changed' given and the same columns as before, only
+        those scenarios' cells are rewritten.
+        """
+        names = [s["name"] for s in self._read_scenarios() if s["name"] in self._results]
+        column_ids = ["row", "current"] + [f"s{index}" for index in range(len(names))]
+        same_columns = (changed is not None and list(self.comparison_tree["columns"]) == column_ids
+                        and [self.comparison_tree.heading(c, "text") for c in column_ids[2:]] == names)
+        if same_columns:
+            for scenario in changed:
+                column = f"s{names.index(scenario['name'])}"
+                for key, _, _ in COMPARISON_ROWS:
+                    self.comparison_tree.set(key, column, self._format_cell(key, self._results[scenario["name"]][1]))
+            return
+
+        self.comparison_tree.delete(*self.comparison_tree.get_children())
+        self.comparison_tree.config(columns=column_ids)
+        self.comparison_tree.heading("row", text="")
+        self.comparison_tree.column("row", width=150, anchor="w")
+        self.comparison_tree.heading("current", text="Current")
+        self.comparison_tree.column("current", width=130, anchor="e")
+        for index, name in enumerate(names):
+            self.comparison_tree.heading(f"s{index}", text=name)
+            self.comparison_tree.column(f"s{index}", width=190, anchor="e")
+        for key, label, fmt in COMPARISON_ROWS:
+            self.comparison_tree.insert("", "end", iid=key, values=[label, fmt.format(self._current[key])] +
+                                        [self._format_cell(key, self._results[name][1]) for name in names])
+
+    def _format_cell(self, key, values):
+        """A scenario's value with its change from the current inputs."""
+        fmt = next(fmt for row_key, _, fmt in COMPARISON_ROWS if row_key == key)
+        delta = values[key] - self._current[key]
+        sign = "-" if delta < 0 else "+"
+        return f"{fmt.format(values[key])} ({sign}{fmt.format(abs(delta))})"
+
+    def get_session_variables(self):
+        """Returns the tab's input variables, keyed by name, for session save/restore."""
+        return {
+            "scenarios": self.scenarios_var,
+        }
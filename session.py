@@ -0,0 +1,160 @@
+# session.py
+
+import json
+import os
+
+# Where the autosaved session lives between runs
+SESSION_DIR = os.path.join(os.path.expanduser("~"), ".atlas_earth_calculator")
+SNAPSHOT_FILE = "session.json"
+JOURNAL_FILE = "session.journal"
+SESSION_FORMAT_VERSION = 1
+
+# Input changes within this window are written as one journal line
+AUTOSAVE_DELAY_MS = 400
+# Once the journal has this many lines it is folded into a fresh snapshot
+JOURNAL_COMPACT_LINES = 500
+
+# Compact JSON: no spaces after separators
+_JSON_SEPARATORS = (",", ":")
+
+
+def read_session_file(file_path):
+    """Reads a snapshot file and returns its {key: value} dict, or {} if it is missing or unreadable."""
+    try:
+        with open(file_path, encoding="utf-8") as snapshot_file:
+            snapshot = json.load(snapshot_file)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SESSION_FORMAT_VERSION:
+        return {}
+    return snapshot.get("values", {})
+
+
+def write_session_file(file_path, values):
+    """Writes a snapshot atomically (temporary file, then rename), so a crash never leaves half a file."""
+    temp_path = file_path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as snapshot_file:
+        json.dump({"version": SESSION_FORMAT_VERSION, "values": values}, snapshot_file, separators=_JSON_SEPARATORS)
+    os.replace(temp_path, file_path)
+
+
+def replay_journal(file_path, values):
+    """
+    Applies every journal line (a JSON object of changed inputs) to values in order and returns
+    the number of lines applied. A torn last line from a crash mid-write is ignored.
+    """
+    applied = 0
+    try:
+        with open(file_path, encoding="utf-8") as journal_file:
+            for line in journal_file:
+                try:
+                    changes = json.loads(line)
+                except ValueError:
+                    break
+                if isinstance(changes, dict):
+                    values.update(changes)
+                    applied += 1
+    except OSError:
+        pass
+    return applied
+
+
+class SessionStore:
+    """
+    Keeps the registered Tk variables saved between runs. Restoring reads the last snapshot and
+    replays the journal on top of it. After that, every change marks its key dirty, and one
+    'after' callback per AUTOSAVE_DELAY_MS appends only the dirty keys as a single journal line,
+    so a burst of keystrokes costs one small append. The journal is compacted into the snapshot
+    once it grows long and on exit.
+    """
+    def __init__(self, master, session_dir=SESSION_DIR):
+        self.master = master
+        self.session_dir = session_dir
+        self.snapshot_path = os.path.join(session_dir, SNAPSHOT_FILE)
+        self.journal_path = os.path.join(session_dir, JOURNAL_FILE)
+
+        self.variables = {}
+        self._dirty = set()
+        self._flush_scheduled = False
+        self._restoring = False
+        self._journal_lines = 0
+
+    def register(self, key, variable):
+        """Adds a Tk variable under a stable key, e.g. 'main.badge_count' or 'goal.target_amount'."""
+        self.variables[key] = variable
+        variable.trace_add("write", lambda *args, key=key: self._on_change(key))
+
+    def register_all(self, prefix, variables):
+        for name, variable in variables.items():
+            self.register(f"{prefix}.{name}", variable)
+
+    def values(self):
+        return {key: variable.get() for key, variable in self.variables.items()}
+
+    def restore(self):
+        """Loads the snapshot plus journal into the registered variables. Returns True if anything was restored."""
+        values = read_session_file(self.snapshot_path)
+        self._journal_lines = replay_journal(self.journal_path, values)
+        self.apply(values)
+        return bool(values)
+
+    def apply(self, values):
+        """Sets the registered variables from a {key: value} dict without journaling each write."""
+        self._restoring = True
+        try:
+            for key, value in values.items():
+                variable = self.variables.get(key)
+                if variable is None:
+                    continue  # An input from another version of the app
+                try:
+                    variable.set(value)
+                except Exception:
+                    pass  # Leave the default for a value the variable cannot hold
+        finally:
+            self._restoring = False
+
+    def save_as(self, file_path):
+        """Writes every registered input to a standalone session file (e.g. one per account)."""
+        write_session_file(file_path, self.values())
+
+    def load(self, file_path):
+        """Applies a session file written by save_as, and autosaves it as the current session."""
+        values = read_session_file(file_path)
+        if not values:
+            raise ValueError(f"{file_path} is not an Atlas Earth session file.")
+        self.apply(values)
+        self.compact()
+
+    def compact(self):
+        """Folds the journal into a fresh snapshot of every input and truncates the journal."""
+        self._dirty.clear()
+        os.makedirs(self.session_dir, exist_ok=True)
+        write_session_file(self.snapshot_path, self.values())
+        open(self.journal_path, "w").close()
+        self._journal_lines = 0
+
+    def _on_change(self, key):
+        if self._restoring:
+            return
+        self._dirty.add(key)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.master.after(AUTOSAVE_DELAY_MS, self.flush)
+
+    def flush(self):
+        """Appends the inputs changed since the last flush as one journal line."""
+        self._flush_scheduled = False
+        if not self._dirty:
+            return
+        changes = {key: self.variables[key].get() for key in self._dirty}
+        self._dirty.clear()
+        try:
+            if self._journal_lines >= JOURNAL_COMPACT_LINES:
+                self.compact()
+                return
+            os.makedirs(self.session_dir, exist_ok=True)
+            with open(self.journal_path, "a", encoding="utf-8") as journal_file:
+                journal_file.write(json.dumps(changes, separators=_JSON_SEPARATORS) + "\n")
+            self._journal_lines += 1
+        except OSError:
+            pass  # Autosave is best effort; a read-only home directory must not break the app
@@ -0,0 +1,172 @@
+# target_solver.py
+
+import datetime
+
+import numpy as np
+
+import constants
+import earnings_model
+
+# Account x segment cells evaluated per step in a fleet batch; small steps stay in cache and bound memory
+BATCH_CELLS = 1 << 16
+
+# Day number (date ordinal) of datetime64's day 0
+_UNIX_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+
+def first_crossing(segment_days, start_balances, daily_rates, lumps, targets):
+    """
+    First day on which piecewise-linear balances reach their targets, for many accounts sharing
+    the segment boundaries. segment_days (S,) are ascending day numbers and the last segment
+    runs forever; daily_rates (A, S) are the non-negative earnings per day within each segment,
+    and lumps (A, S) change a balance at the start of a segment (None for no changes).
+    The balance at every boundary is a running sum, the first segment whose end reaches the
+    target is one argmax, and the day inside it is solved from that segment's line.
+    Returns fractional day numbers, inf where a target is never reached.
+    """
+    segment_days = np.asarray(segment_days, dtype=np.float64)
+    daily_rates = np.atleast_2d(np.asarray(daily_rates, dtype=np.float64))
+    accounts = len(daily_rates)
+    start_balances = np.broadcast_to(np.asarray(start_balances, dtype=np.float64), (accounts,))
+    targets = np.broadcast_to(np.asarray(targets, dtype=np.float64), (accounts,))
+
+    accrued = daily_rates[:, :-1] * np.diff(segment_days)
+    starts = start_balances[:, np.newaxis] + np.zeros_like(daily_rates)
+    if lumps is not None:
+        starts += np.cumsum(np.broadcast_to(lumps, daily_rates.shape), axis=1)
+    starts[:, 1:] += np.cumsum(accrued, axis=1)
+    ends = np.empty_like(starts)
+    ends[:, :-1] = starts[:, :-1] + accrued
+    ends[:, -1] = np.where(daily_rates[:, -1] > 0, np.inf, starts[:, -1])
+
+    reached = ends >= targets[:, np.newaxis]
+    segment = np.argmax(reached, axis=1)
+    rows = np.arange(accounts)
+    gap = targets - starts[rows, segment]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        offset = np.where(gap > 0, gap / daily_rates[rows, segment], 0.0)
+    return np.where(reached.any(axis=1), segment_days[segment] + offset, np.inf)
+
+
+def daily_accrual(rent_per_second, ad_multiplier, boost_hours, srb_forced, srb_hours=None, srb_hours_per_month=None):
+    """
+    Boosted earnings per day; all arguments broadcast. Without srb_hours this is the monthly
+    model's daily share (srb_hours_per_month, by default SRB_HOURS_PER_MONTH, spread over the
+    month). With srb_hours, a day earns its ad boost plus that many SRB hours, which replace
+    unboosted time first and then boosted time, like boosted_seconds_factor. A forced SRB or
+    zero boost hours ignores them.
+    """
+    rent_per_second = np.asarray(rent_per_second, dtype=np.float64)
+    if srb_hours is None:
+        return rent_per_second * earnings_model.boosted_seconds_factor(
+            ad_multiplier, boost_hours, srb_forced, "month", srb_hours_per_month) / constants.AVG_DAYS_PER_MONTH
+
+    srb = constants.SUPER_RENT_BOOST_MULTIPLIER
+    ad_multiplier = np.asarray(ad_multiplier, dtype=np.float64)
+    boost_hours = np.clip(np.asarray(boost_hours, dtype=np.float64), 0, 24)
+    srb_hours = np.clip(np.asarray(srb_hours, dtype=np.float64), 0, 24)
+    day = rent_per_second * earnings_model.boosted_seconds_factor(ad_multiplier, boost_hours, srb_forced, "day")
+    over_unboosted = np.minimum(srb_hours, 24 - boost_hours)
+    over_boosted = np.minimum(srb_hours - over_unboosted, boost_hours)
+    extra = rent_per_second * constants.SECONDS_PER_HOUR * (over_unboosted * (srb - 1) + over_boosted * (srb - ad_multiplier))
+    return day + np.where(np.asarray(srb_forced, dtype=bool) | (boost_hours == 0), 0.0, extra)
+
+
+def srb_event_days(srb_events, start_day):
+    """
+    SRB hours per date from parse_srb_events output, summed per date and limited to dates
+    from start_day on. Returns (day numbers, hours) arrays.
+    """
+    dates, hours = srb_events
+    days = np.asarray(dates, dtype="datetime64[D]").astype(np.int64) + _UNIX_EPOCH_ORDINAL
+    keep = days >= start_day
+    unique_days, inverse = np.unique(days[keep], return_inverse=True)
+    return unique_days, np.bincount(inverse, weights=np.asarray(hours, dtype=np.float64)[keep], minlength=len(unique_days))
+
+
+def _srb_segments(start_day, srb_events):
+    """Shared boundaries for an SRB schedule: each event date is a one-day segment. Returns (days, srb hours)."""
+    event_days, event_hours = srb_event_days(srb_events, start_day)
+    days = np.unique(np.concatenate([[start_day], event_days, event_days + 1]))
+    hours = np.zeros(len(days))
+    hours[np.searchsorted(days, event_days)] = event_hours
+    return days.astype(np.int64), hours
+
+
+def timeline_schedule(timeline, boost_hours, srb_forced, srb_events=None, parcel_cost=0.0, srb_hours_per_month=None):
+    """
+    The piecewise-linear balance of one AcquisitionTimeline: its purchase segments, split
+    further on SRB event dates when srb_events is given. Parcels bought on an event date
+    after the start are paid from the balance at parcel_cost each (those on the start date
+    are part of the starting holdings). Returns (segment_days, daily_rates, lumps) for
+    first_crossing, with one row.
+    """
+    segment_days = timeline.segment_days
+    srb_hours = None
+    if srb_events is not None:
+        srb_days, srb_by_day = _srb_segments(timeline.start_day, srb_events)
+        segment_days = np.union1d(timeline.segment_days, srb_days)
+        srb_hours = np.zeros(len(segment_days))
+        srb_hours[np.searchsorted(segment_days, srb_days)] = srb_by_day
+    segment = np.searchsorted(timeline.segment_days, segment_days, side="right") - 1
+    daily_rates = daily_accrual(timeline.rent_per_second[segment], timeline.ad_multiplier[segment],
+                                boost_hours, srb_forced, srb_hours, srb_hours_per_month)
+
+    lumps = np.zeros(len(segment_days))
+    bought = np.maximum(np.diff(timeline.total_parcels), 0)
+    lumps[np.searchsorted(segment_days, timeline.segment_days[1:])] = -parcel_cost * bought
+    return segment_days, daily_rates[np.newaxis, :], lumps[np.newaxis, :]
+
+
+def date_reaching(timeline, target_balance, start_balance, boost_hours, srb_forced, srb_events=None, parcel_cost=0.0,
+                  srb_hours_per_month=None):
+    """
+    The first date on which the balance of one account (an AcquisitionTimeline with its planned
+    purchases) reaches target_balance, or None if it never does.
+    """
+    segment_days, daily_rates, lumps = timeline_schedule(timeline, boost_hours, srb_forced, srb_events, parcel_cost,
+                                                         srb_hours_per_month)
+    day = first_crossing(segment_days, start_balance, daily_rates, lumps, target_balance)[0]
+    if not np.isfinite(day) or day > datetime.date.max.toordinal():
+        return None
+    return datetime.date.fromordinal(int(np.ceil(day)))
+
+
+def batch_days_to_target(rent_per_second, ad_multiplier, boost_hours, srb_forced, start_day, targets,
+                         start_balances=0.0, srb_events=None, chunk_cells=BATCH_CELLS, srb_hours_per_month=None):
+    """
+    Day numbers on which many accounts (one array entry each) reach their target balances,
+    inf where they never do. Accounts keep their holdings; srb_events, shared by all of them,
+    splits the timeline into one-day SRB segments, and the accounts are solved chunk_cells
+    account-segments at a time.
+    """
+    rent_per_second = np.asarray(rent_per_second, dtype=np.float64)
+    accounts = len(rent_per_second)
+    columns = [np.broadcast_to(np.asarray(values), (accounts,))
+               for values in (ad_multiplier, boost_hours, srb_forced, targets, start_balances)]
+    ad_multiplier, boost_hours, srb_forced, targets, start_balances = columns
+    if srb_events is None:
+        segment_days, srb_hours = np.array([start_day]), None
+    else:
+        segment_days, srb_hours = _srb_segments(start_day, srb_events)
+
+    days = np.empty(accounts)
+    step = max(chunk_cells // len(segment_days), 1)
+    for first in range(0, accounts, step):
+        chunk = slice(first, first + step)
+        daily_rates = daily_accrual(rent_per_second[chunk, np.newaxis], ad_multiplier[chunk, np.newaxis],
+                                    boost_hours[chunk, np.newaxis], srb_forced[chunk, np.newaxis],
+                                    None if srb_hours is None else srb_hours[np.newaxis, :], srb_hours_per_month)
+        days[chunk] = first_crossing(segment_days, start_balances[chunk],
+                                     np.broadcast_to(daily_rates, (len(rent_per_second[chunk]), len(segment_days))),
+                                     None, targets[chunk])
+    return days
+
+
+def fleet_days_to_target(store, targets, start_date, start_balances=0.0, srb_events=None, indices=None,
+                         srb_hours_per_month=None):
+    """batch_days_to_target for the accounts of a PortfolioStore (or its 'indices'), with their own boost settings."""
+    records, rent_per_second, ad_multiplier = store.rent_and_multipliers(indices)
+    return batch_days_to_target(rent_per_second, ad_multiplier, records["boost_hours"].astype(np.float64),
+                                records["srb_forced"], start_date.toordinal(), targets, start_balances, srb_events,
+                                srb_hours_per_month=srb_hours_per_month)
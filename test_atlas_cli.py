@@ -0,0 +1,20 @@
+# test_atlas_cli.py
+
+import contextlib
+import io
+import unittest
+
+import atlas_cli
+
+
+class StartupBudgetTest(unittest.TestCase):
+    def test_cold_start_within_budget(self):
+        """A typical query starts within STARTUP_BUDGET_MS (best of STARTUP_CHECK_RUNS) without importing HEAVY_MODULES."""
+        report = io.StringIO()
+        with contextlib.redirect_stdout(report):
+            passed = atlas_cli.check_startup()
+        self.assertTrue(passed, report.getvalue().strip())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+# timeline.py
+
+import csv
+import datetime
+
+import numpy as np
+
+import constants
+import earnings_model
+
+# Columns of an events file: a date plus parcel and badge changes on that date (negative for sales)
+EVENT_FILE_COLUMNS = ["date"] + list(constants.PARCEL_RATES_PER_SECOND) + ["badges"]
+
+# Days evaluated per step when a series is generated, so long horizons never materialize at once
+SERIES_CHUNK_DAYS = 4096
+
+
+def read_events_file(file_path):
+    """
+    Reads a CSV of acquisition events (header from EVENT_FILE_COLUMNS; only 'date' is required,
+    missing counts are 0). Returns (event_days, parcel_deltas, badge_deltas) as NumPy arrays,
+    with days as date ordinals and parcel_deltas holding one column per rarity.
+    """
+    with open(file_path, newline='') as events_file:
+        reader = csv.reader(events_file)
+        header = [name.strip().lower() for name in next(reader, [])]
+        if "date" not in header:
+            raise ValueError("The events file needs a 'date' column (YYYY-MM-DD).")
+        columns = {name: index for index, name in enumerate(header)}
+        rows = [row for row in reader if any(cell.strip() for cell in row)]
+
+    event_days = np.empty(len(rows), dtype=np.int64)
+    deltas = np.zeros((len(rows), len(EVENT_FILE_COLUMNS) - 1), dtype=np.int64)
+    for row_index, row in enumerate(rows):
+        try:
+            event_days[row_index] = datetime.date.fromisoformat(row[columns["date"]].strip()).toordinal()
+            for col_index, name in enumerate(EVENT_FILE_COLUMNS[1:]):
+                if name in columns and row[columns[name]].strip():
+                    deltas[row_index, col_index] = int(row[columns[name]])
+        except (ValueError, IndexError) as e:
+            raise ValueError(f"Line {row_index + 2}: {e}")
+    return event_days, deltas[:, :-1], deltas[:, -1]
+
+
+class AcquisitionTimeline:
+    """
+    Cumulative earnings of an account whose holdings change on dated events.
+    Between events the rate is constant, so each segment integrates in closed form
+    (rate x days). The ad boost multiplier and badge tier are re-evaluated at every event
+    from the new total_parcels and badge count, and running sums of the segment earnings
+    give the cumulative total at any date with one binary search.
+    Daily rates use the monthly model (srb_hours_per_month included) divided by AVG_DAYS_PER_MONTH.
+    """
+    def __init__(self, start_date, initial_parcels, initial_badges, event_days, parcel_deltas, badge_deltas,
+                 region, boost_hours, srb_forced, fictive_badge_multiplier=None, srb_hours_per_month=None):
+        self.start_day = start_date.toordinal()
+        event_days = np.asarray(event_days, dtype=np.int64)
+        parcel_deltas = np.asarray(parcel_deltas, dtype=np.int64).reshape(len(event_days), len(constants.PARCEL_RATES_PER_SECOND))
+        badge_deltas = np.asarray(badge_deltas, dtype=np.int64)
+
+        # Events before the start date are already part of the initial holdings
+        keep = event_days >= self.start_day
+        event_days, parcel_deltas, badge_deltas = event_days[keep], parcel_deltas[keep], badge_deltas[keep]
+
+        # Merge events on the same day, then prepend the starting holdings as segment 0
+        order = np.argsort(event_days, kind="stable")
+        unique_days, first_index = np.unique(event_days[order], return_index=True)
+        if len(order):
+            parcel_changes = np.add.reduceat(parcel_deltas[order], first_index, axis=0)
+            badge_changes = np.add.reduceat(badge_deltas[order], first_index)
+        else:
+            parcel_changes = np.zeros((0, len(constants.PARCEL_RATES_PER_SECOND)), dtype=np.int64)
+            badge_changes = np.zeros(0, dtype=np.int64)
+        if len(unique_days) and unique_days[0] == self.start_day:
+            # Same-day events are folded into the starting segment
+            initial_change, initial_badge_change = parcel_changes[0], badge_changes[0]
+            unique_days, parcel_changes, badge_changes = unique_days[1:], parcel_changes[1:], badge_changes[1:]
+        else:
+            initial_change, initial_badge_change = 0, 0
+
+        initial = np.array([initial_parcels.get(p_type, 0) for p_type in constants.PARCEL_RATES_PER_SECOND],
+                           dtype=np.int64) + initial_change
+        holdings = np.maximum(np.cumsum(np.vstack([initial, parcel_changes]), axis=0), 0)
+        badges = np.maximum(np.cumsum(np.concatenate([[initial_badges + initial_badge_change], badge_changes])), 0)
+
+        self.segment_days = np.concatenate([[self.start_day], unique_days]).astype(np.int64)
+        self.total_parcels = holdings.sum(axis=1)
+        rates = np.array(list(constants.PARCEL_RATES_PER_SECOND.values()))
+        if fictive_badge_multiplier is not None:
+            badge_mult = np.full(len(badges), fictive_badge_multiplier)
+        else:
+            badge_mult = earnings_model.passport_boost_multipliers(badges)
+        self.rent_per_second = (holdings @ rates) * badge_mult
+
+        self.ad_multiplier = earnings_model.ad_boost_multipliers(self.total_parcels, region)
+        self.base_daily = self.rent_per_second * constants.SECONDS_PER_DAY
+        self.boosted_daily = self.rent_per_second * earnings_model.boosted_seconds_factor(
+            self.ad_multiplier, boost_hours, srb_forced, "month", srb_hours_per_month) / constants.AVG_DAYS_PER_MONTH
+
+        # Earnings from the start date to the start of each segment
+        segment_lengths = np.diff(self.segment_days)
+        self._base_prefix = np.concatenate([[0.0], np.cumsum(self.base_daily[:-1] * segment_lengths)])
+        self._boosted_prefix = np.concatenate([[0.0], np.cumsum(self.boosted_daily[:-1] * segment_lengths)])
+
+    def cumulative(self, days, boosted=True):
+        """Earnings from the start date to the start of each given day (date ordinals, any array shape)."""
+        daily, prefix = (self.boosted_daily, self._boosted_prefix) if boosted else (self.base_daily, self._base_prefix)
+        days = np.maximum(np.asarray(days, dtype=np.int64), self.start_day)
+        segment = np.searchsorted(self.segment_days, days, side="right") - 1
+        return prefix[segment] + daily[segment] * (days - self.segment_days[segment])
+
+    def iter_series(self, end_date, step="day", chunk_days=SERIES_CHUNK_DAYS):
+        """
+        Lazily yields (date, total_parcels, cumulative_base, cumulative_boosted) from the start date
+        to end_date, once per day or on the first of each month ('month'), a chunk at a time.
+        """
+        end_day = end_date.toordinal()
+        if step == "month":
+            chunk_points = self._month_starts(end_day, chunk_days)
+        else:
+            chunk_points = (np.arange(first, min(first + chunk_days, end_day + 1), dtype=np.int64)
+                            for first in range(self.start_day, end_day + 1, chunk_days))
+        for points in chunk_points:
+            segment = np.searchsorted(self.segment_days, points, side="right") - 1
+            base = self.cumulative(points, boosted=False)
+            boosted = self.cumulative(points)
+            for day, parcels, base_total, boosted_total in zip(points.tolist(), self.total_parcels[segment].tolist(),
+                                                               base.tolist(), boosted.tolist()):
+                yield datetime.date.fromordinal(day), parcels, base_total, boosted_total
+
+    def _month_starts(self, end_day, chunk_size):
+        """Yields arrays of the start day plus every first-of-month up to end_day, chunk_size at a time."""
+        start = datetime.date.fromordinal(self.start_day)
+        points = [self.start_day]
+        year, month = start.year, start.month
+        while True:
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+            day = datetime.date(year, month, 1).toordinal()
+            if day > end_day:
+                break
+            points.append(day)
+            if len(points) == chunk_size:
+                yield np.array(points, dtype=np.int64)
+                points = []
+        if points:
+            yield np.array(points, dtype=np.int64)
@@ -0,0 +1,194 @@
+# timeline_calculator.py
+
+import csv
+import datetime
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+
+import numpy as np
+
+import earnings_model
+import rate_epochs
+import timeline
+from widgets import EarningsChart
+
+class TimelineCalculator:
+    def __init__(self, parent_frame, get_user_inputs_callback, job_runner):
+        self.parent_frame = parent_frame
+        self.get_user_inputs_callback = get_user_inputs_callback
+        self.job_runner = job_runner
+
+        today = datetime.date.today()
+        self.start_date_var = tk.StringVar(value=today.isoformat())
+        self.end_date_var = tk.StringVar(value=today.replace(year=today.year + 3, day=min(today.day, 28)).isoformat())
+        self.export_step_var = tk.StringVar(value="Daily")
+
+        # Events from the loaded file, as arrays from timeline.read_events_file
+        self._events = None
+        self._events_path = ""
+        self._timeline = None
+
+        self._create_widgets()
+
+    def _create_widgets(self):
+        row = 0
+        header_font = ("Helvetica", 10, "bold")
+        value_font = ("Courier", 10)
+
+        ttk.Label(self.parent_frame, text="Parcel purchases and badge gains from an events file (date, common, rare, epic, legendary, badges),\n"
+                                          "on top of the holdings entered above as of the start date.").grid(row=row, column=0, columnspan=3, sticky="w", padx=5, pady=(5, 5))
+        row += 1
+
+        ttk.Button(self.parent_frame, text="Load Events File...", command=self._load_events_file).grid(row=row, column=0, sticky="w", padx=5, pady=2)
+        self.events_file_label = ttk.Label(self.parent_frame, text="No events loaded.")
+        self.events_file_label.grid(row=row, column=1, columnspan=2, sticky="w", padx=5, pady=2)
+        row += 1
+
+        ttk.Label(self.parent_frame, text="Start Date (YYYY-MM-DD):").grid(row=row, column=0, sticky="w", padx=5, pady=2)
+        start_entry = ttk.Entry(self.parent_frame, width=12, textvariable=self.start_date_var)
+        start_entry.grid(row=row, column=1, sticky="w", padx=5, pady=2)
+        start_entry.bind("<KeyRelease>", lambda event: self.update_display())
+        row += 1
+        ttk.Label(self.parent_frame, text="End Date (YYYY-MM-DD):").grid(row=row, column=0, sticky="w", padx=5, pady=2)
+        end_entry = ttk.Entry(self.parent_frame, width=12, textvariable=self.end_date_var)
+        end_entry.grid(row=row, column=1, sticky="w", padx=5, pady=2)
+        end_entry.bind("<KeyRelease>", lambda event: self.update_display())
+        row += 1
+
+        ttk.Label(self.parent_frame, text="--- Timeline Summary ---", font=header_font).grid(row=row, column=0, columnspan=3, sticky="w", pady=(15, 5))
+        row += 1
+        self.output_labels = {}
+        for key, text in [("events", "Events in Range:"), ("final_parcels", "Parcels at End Date:"),
+                          ("base_total", "Cumulative Earnings (Base):"), ("boosted_total", "Cumulative Earnings (Boosted):")]:
+            ttk.Label(self.parent_frame, text=text, font=value_font).grid(row=row, column=0, sticky="w", padx=5, pady=1)
+            self.output_labels[key] = ttk.Label(self.parent_frame, text="N/A", font=value_font)
+            self.output_labels[key].grid(row=row, column=1, columnspan=2, sticky="ew", padx=5, pady=1)
+            row += 1
+
+        chart_frame = ttk.LabelFrame(self.parent_frame, text="Cumulative Earnings by Day from Start")
+        chart_frame.grid(row=row, column=0, columnspan=3, sticky="nsew", padx=5, pady=(10, 5))
+        ttk.Label(chart_frame, text="(wheel: zoom, drag: pan, double-click: reset)").pack(anchor="w", padx=5)
+        self.chart = EarningsChart(chart_frame, fetch_series=self._fetch_series,
+                                   colors={"Base": "steelblue", "Boosted": "darkorange"})
+        self.chart.pack(fill="both", expand=True, padx=5, pady=5)
+        row += 1
+
+        export_frame = ttk.Frame(self.parent_frame)
+        export_frame.grid(row=row, column=0, columnspan=3, pady=(5, 10))
+        ttk.Combobox(export_frame, textvariable=self.export_step_var, values=["Daily", "Monthly"],
+                     state="readonly", width=8).pack(side="left", padx=5)
+        ttk.Button(export_frame, text="Export Series to CSV", command=self._export_series_to_csv).pack(side="left", padx=5)
+
+        self.parent_frame.grid_columnconfigure(1, weight=1)
+        self.parent_frame.grid_rowconfigure(row - 1, weight=1)
+
+    def _load_events_file(self):
+        file_path = filedialog.askopenfilename(filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+                                               title="Open Events File")
+        if not file_path:
+            return
+        try:
+            self._events = timeline.read_events_file(file_path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Input Error", f"Could not read the events file: {e}")
+            return
+        self._events_path = file_path
+        self.events_file_label.config(text=f"{len(self._events[0]):,} events from {file_path}")
+        self.update_display()
+
+    def _read_dates(self):
+        """Returns (start_date, end_date); raises ValueError for invalid or reversed dates."""
+        start_date = rate_epochs.parse_date(self.start_date_var.get())
+        end_date = rate_epochs.parse_date(self.end_date_var.get())
+        if end_date <= start_date:
+            raise ValueError("The end date must be after the start date.")
+        return start_date, end_date
+
+    def update_display(self):
+        """Rebuilds the timeline from the current inputs; cheap enough to follow every keystroke."""
+        inputs = self.get_user_inputs_callback()
+        try:
+            start_date, end_date = self._read_dates()
+        except ValueError:
+            inputs = None
+        if inputs is None:
+            self._timeline = None
+            self._clear_labels()
+            return
+
+        event_days, parcel_deltas, badge_deltas = self._events or ([], [], [])
+        fictive_multiplier = earnings_model.badge_multiplier(inputs) if inputs["fictive_badge_boost_enabled"] else None
+        self._timeline = timeline.AcquisitionTimeline(start_date, inputs["parcels"], inputs["badge_count"],
+                                                      event_days, parcel_deltas, badge_deltas,
+                                                      inputs["selected_region"], inputs["boost_hours"],
+                                                      inputs["srb_boost_enabled"], fictive_multiplier,
+                                                      inputs["rate_profile"].srb_hours_per_month)
+
+        end_day = end_date.toordinal()
+        segment = np.searchsorted(self._timeline.segment_days, end_day, side="right") - 1
+        self.output_labels["events"].config(text=f"{segment:,} event days")
+        self.output_labels["final_parcels"].config(text=f"{self._timeline.total_parcels[segment]:,}")
+        self.output_labels["base_total"].config(text=f"${float(self._timeline.cumulative(end_day, boosted=False)):.8f}")
+        self.output_labels["boosted_total"].config(text=f"${float(self._timeline.cumulative(end_day)):.8f}")
+        self.chart.set_range(0, end_day - self._timeline.start_day)
+
+    def _fetch_series(self, first, last, samples):
+        """
+        Chart callback: cumulative earnings for days first..last after the start date. They are
+        linear between purchase days, so about 'samples' days plus the purchase days draw them exactly.
+        """
+        if self._timeline is None:
+            return np.zeros(0), {}
+        if last - first + 1 <= samples:
+            x = np.arange(first, last + 1)
+        else:
+            events = self._timeline.segment_days - self._timeline.start_day
+            x = np.unique(np.concatenate([np.linspace(first, last, samples).round().astype(np.int64),
+                                          events[(events >= first) & (events <= last)]]))
+        days = self._timeline.start_day + x
+        return x, {"Base": self._timeline.cumulative(days, boosted=False), "Boosted": self._timeline.cumulative(days)}
+
+    def _export_series_to_csv(self):
+        if self._timeline is None:
+            messagebox.showinfo("Nothing to Export", "Enter valid inputs and dates first.")
+            return
+        file_path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files", "*.csv")],
+                                                 title="Save Earnings Timeline")
+        if not file_path:
+            return
+
+        # The series is generated lazily while writing, so a long horizon never sits in memory
+        series_timeline = self._timeline
+        end_date = rate_epochs.parse_date(self.end_date_var.get())
+        step = "month" if self.export_step_var.get() == "Monthly" else "day"
+        total_days = max(end_date.toordinal() - series_timeline.start_day, 1)
+
+        def export_series(job):
+            rows = 0
+            with open(file_path, 'w', newline='') as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(["Date", "Total Parcels", "Cumulative Base", "Cumulative Boosted"])
+                for day, parcels, base_total, boosted_total in series_timeline.iter_series(end_date, step):
+                    writer.writerow([day.isoformat(), parcels, f"{base_total:.8f}", f"{boosted_total:.8f}"])
+                    rows += 1
+                    if rows % timeline.SERIES_CHUNK_DAYS == 0:
+                        job.report_progress((day.toordinal() - series_timeline.start_day) / total_days, f"{rows:,} rows")
+            return rows
+
+        self.job_runner.run_in_thread(
+            "Timeline export", export_series,
+            on_done=lambda job, rows: messagebox.showinfo("Export Success", f"{rows:,} rows exported to {file_path}"),
+            on_error=lambda job, e: messagebox.showerror("Export Error", f"Failed to export the timeline: {e}"))
+
+    def _clear_labels(self):
+        for label in self.output_labels.values():
+            label.config(text="N/A")
+        self.chart.delete("all")
+
+    def get_session_variables(self):
+        """Returns the tab's input variables, keyed by name, for session save/restore."""
+        return {
+            "start_date": self.start_date_var,
+            "end_date": self.end_date_var,
+            "export_step": self.export_step_var,
+        }
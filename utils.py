@@ -2,10 +2,10 @@
 
 import constants
 
-def get_passport_boost_multiplier(num_passports):
+def get_passport_boost_multiplier(num_passports, badge_tiers=None):
     """
     Calculates the passport boost multiplier based on the number of passports.
-    Uses BADGE_BOOST_TIERS from constants.
+    Uses BADGE_BOOST_TIERS from constants unless another epoch's badge_tiers are given.
     """
     if num_passports < 1:
         return 1.0 # No boost for 0 passports
@@ -13,7 +13,7 @@ def get_passport_boost_multiplier(num_passports):
     # Iterate through sorted badge tiers to find the highest applicable boost
     # The tiers are defined as {badge_count: boost_percentage}
     tier_boost_percentage = 0.0
-    for tier_count, boost_percent in sorted(constants.BADGE_BOOST_TIERS.items()):
+    for tier_count, boost_percent in sorted((badge_tiers or constants.BADGE_BOOST_TIERS).items()):
         if num_passports >= tier_count:
             tier_boost_percentage = boost_percent
         else:
@@ -22,16 +22,17 @@ def get_passport_boost_multiplier(num_passports):
             break 
     return 1.0 + tier_boost_percentage
 
-def get_ad_boost_multiplier(total_parcels, region):
+def get_ad_boost_multiplier(total_parcels, region, ad_boost_data=None):
     """
     Returns the ad boost multiplier based on total parcels and selected region.
-    Uses REGIONAL_AD_BOOST_DATA from constants.
+    Uses REGIONAL_AD_BOOST_DATA from constants unless another epoch's ad_boost_data is given.
     """
-    region_data = constants.REGIONAL_AD_BOOST_DATA.get(region)
+    ad_boost_data = ad_boost_data or constants.REGIONAL_AD_BOOST_DATA
+    region_data = ad_boost_data.get(region)
     if not region_data:
         # Fallback to United States data if the selected region's data is missing
         # This should ideally not happen if REGIONAL_AD_BOOST_DATA is complete
-        region_data = constants.REGIONAL_AD_BOOST_DATA.get("United States", [])
+        region_data = ad_boost_data.get("United States", [])
         if not region_data: # If even US data is missing, return default 1x
             return 1.0
 
@@ -60,14 +61,16 @@ def get_total_rent_multiplier(total_parcels, badge_count, selected_region, force
 
     return ad_boost_multiplier * badge_multiplier_factor
 
-def calculate_base_earnings_per_second(parcel_counts):
+def calculate_base_earnings_per_second(parcel_counts, parcel_rates=None):
     """
     Calculates the raw base earnings per second from owned parcels,
     before any multipliers (ad boost, badge boost) are applied.
+    Uses PARCEL_RATES_PER_SECOND unless another epoch's parcel_rates are given.
     """
+    parcel_rates = parcel_rates or constants.PARCEL_RATES_PER_SECOND
     total_base_rent = 0
     for p_type, count in parcel_counts.items():
-        rate = constants.PARCEL_RATES_PER_SECOND.get(p_type, 0.0)
+        rate = parcel_rates.get(p_type, 0.0)
         total_base_rent += count * rate
     return total_base_rent
 
@@ -113,12 +116,154 @@ def get_seconds_in_timeframe(timeframe_unit):
     else:
         raise ValueError(f"Invalid timeframe unit: {timeframe_unit}")
 
-def calculate_average_mixed_parcel_rate_per_second():
+def calculate_average_mixed_parcel_rate_per_second(mix=None):
     """
     Calculates the weighted average base earnings per second for a 'mixed' parcel,
-    based on PARCEL_PROBABILITIES, before any boosts.
+    based on 'mix' (a profile's parcel_probabilities) or PARCEL_PROBABILITIES, before any boosts.
     """
+    probabilities = mix if mix is not None else constants.PARCEL_PROBABILITIES
     avg_rate = 0
     for parcel_type, rate in constants.PARCEL_RATES_PER_SECOND.items():
-        avg_rate += rate * constants.PARCEL_PROBABILITIES[parcel_type]
+        avg_rate += rate * probabilities.get(parcel_type, 0)
     return avg_rate
+
+def calculate_timeframe_earnings(parcel_counts, badge_multiplier, boost_hours, srb_forced, region, epoch=None,
+                                 srb_hours_per_month=None):
+    """
+    The Current Earnings model, shared by the GUI tab and the command-line tool.
+    Returns (earnings, rates): 'earnings' maps each timeframe ('second' ... 'year') to a
+    (base, boosted) pair, and 'rates' holds the per-second rates behind it
+    ('unboosted', 'ad_boosted', 'srb' and the time-averaged 'day_average').
+    'epoch' is an entry of constants.RATE_EPOCHS; by default the current tables are used.
+    srb_hours_per_month (a profile's SRB hours) defaults to SRB_HOURS_PER_MONTH.
+    """
+    total_parcels = sum(parcel_counts.values())
+    epoch = epoch or {}
+    if srb_hours_per_month is None:
+        srb_hours_per_month = constants.SRB_HOURS_PER_MONTH
+
+    # Earnings per second after the permanent badge boost (the base for boosted earnings)
+    earnings_per_second_after_badges = \
+        calculate_base_earnings_per_second(parcel_counts, epoch.get("parcel_rates")) * badge_multiplier
+
+    # Instantaneous ad boost multiplier; 1x without parcels
+    effective_ad_multiplier = 1.0
+    if total_parcels > 0:
+        if srb_forced:
+            effective_ad_multiplier = constants.SUPER_RENT_BOOST_MULTIPLIER
+        else:
+            effective_ad_multiplier = get_ad_boost_multiplier(total_parcels, region, epoch.get("ad_boost_data"))
+
+    # Short timeframes use the daily average of boosted and unboosted hours
+    final_boosted_earnings_per_second = earnings_per_second_after_badges
+    if boost_hours > 0:
+        rate_during_ad_boosted_time = earnings_per_second_after_badges * effective_ad_multiplier
+        boosted_seconds = min(boost_hours * constants.SECONDS_PER_HOUR, constants.SECONDS_PER_DAY)
+        unboosted_seconds = constants.SECONDS_PER_DAY - boosted_seconds
+        final_boosted_earnings_per_second = (rate_during_ad_boosted_time * boosted_seconds +
+                                             earnings_per_second_after_badges * unboosted_seconds) / constants.SECONDS_PER_DAY
+
+    earnings = {}
+    for tf in ["second", "minute", "hour", "day", "week"]:
+        earnings[tf] = (convert_seconds_to_timeframe(earnings_per_second_after_badges, tf),
+                        convert_seconds_to_timeframe(final_boosted_earnings_per_second, tf))
+
+    # Months and years also account for the global SRB hours, unless SRB is forced
+    rate_unboosted = earnings_per_second_after_badges
+    rate_ad_boosted = earnings_per_second_after_badges * effective_ad_multiplier
+    rate_srb = earnings_per_second_after_badges * constants.SUPER_RENT_BOOST_MULTIPLIER
+
+    for tf, days, srb_hours in [("month", constants.AVG_DAYS_PER_MONTH, srb_hours_per_month),
+                                ("year", constants.AVG_DAYS_PER_YEAR, srb_hours_per_month * 12)]:
+        if srb_forced:
+            # All of the user's boosted hours run at 50x; the global SRB hours are ignored
+            boosted_seconds_daily = min(boost_hours * constants.SECONDS_PER_HOUR, constants.SECONDS_PER_DAY)
+            unboosted_seconds_daily = constants.SECONDS_PER_DAY - boosted_seconds_daily
+            boosted = (rate_srb * boosted_seconds_daily * days) + (rate_unboosted * unboosted_seconds_daily * days)
+        elif boost_hours == 0:
+            boosted = convert_seconds_to_timeframe(earnings_per_second_after_badges, tf)
+        else:
+            # SRB time takes precedence, then the user's ad boost, then unboosted time
+            total_seconds = days * constants.SECONDS_PER_DAY
+            srb_seconds = srb_hours * constants.SECONDS_PER_HOUR
+            normal_boosted_seconds = min(boost_hours * constants.SECONDS_PER_HOUR * days, total_seconds - srb_seconds)
+            unboosted_seconds = max(0, total_seconds - srb_seconds - normal_boosted_seconds)
+            boosted = (rate_unboosted * unboosted_seconds) + (rate_ad_boosted * normal_boosted_seconds) + (rate_srb * srb_seconds)
+        earnings[tf] = (convert_seconds_to_timeframe(earnings_per_second_after_badges, tf), boosted)
+
+    rates = {
+        "unboosted": rate_unboosted,
+        "ad_boosted": rate_ad_boosted,
+        "srb": rate_srb,
+        "day_average": final_boosted_earnings_per_second,
+    }
+    return earnings, rates
+
+def calculate_parcels_for_goal(target_amount, timeframe_unit, effective_multiplier, mode="mixed", parcel_type="common",
+                               mix=None):
+    """
+    Parcels needed to earn target_amount per timeframe_unit at the given rate multiplier, either as
+    a probability-weighted mix ('mixed', over 'mix' or PARCEL_PROBABILITIES) or all of one parcel_type ('specific').
+    Returns (total_parcels_needed, breakdown); the breakdown by rarity is empty for 'specific'.
+    Raises ZeroDivisionError if the boosted rate is zero.
+    """
+    target_earnings_per_second = target_amount / get_seconds_in_timeframe(timeframe_unit)
+    if mode == "mixed":
+        boosted_rate = calculate_average_mixed_parcel_rate_per_second(mix) * effective_multiplier
+    else:
+        boosted_rate = constants.PARCEL_RATES_PER_SECOND[parcel_type] * effective_multiplier
+    if boosted_rate == 0:
+        raise ZeroDivisionError("The boosted parcel rate is zero.")
+
+    total_parcels_needed = target_earnings_per_second / boosted_rate
+    breakdown = {}
+    if mode == "mixed":
+        for p_type, prob in (mix if mix is not None else constants.PARCEL_PROBABILITIES).items():
+            breakdown[p_type] = total_parcels_needed * prob
+    return total_parcels_needed, breakdown
+
+def calculate_custom_tier_monthly(parcel_count, rate_per_parcel, badge_multiplier, boost_hours, srb_forced, region,
+                                  srb_hours_per_month=None):
+    """
+    Estimated monthly earnings for a hypothetical parcel count (the Custom Tier model).
+    srb_hours_per_month (a profile's SRB hours) defaults to SRB_HOURS_PER_MONTH.
+    Returns (ad_boost_multiplier, base_monthly, boosted_monthly).
+    """
+    if srb_hours_per_month is None:
+        srb_hours_per_month = constants.SRB_HOURS_PER_MONTH
+    base_rate_with_badge_per_second = rate_per_parcel * parcel_count * badge_multiplier
+    ad_boost_multiplier = get_ad_boost_multiplier(parcel_count, region)
+    if srb_forced:
+        fully_boosted_rate_per_second = base_rate_with_badge_per_second * constants.SUPER_RENT_BOOST_MULTIPLIER
+    else:
+        fully_boosted_rate_per_second = base_rate_with_badge_per_second * ad_boost_multiplier
+
+    base_monthly = convert_seconds_to_timeframe(base_rate_with_badge_per_second, 'month')
+
+    total_monthly_seconds = constants.AVG_DAYS_PER_MONTH * constants.SECONDS_PER_DAY
+    srb_seconds_monthly = srb_hours_per_month * constants.SECONDS_PER_HOUR
+    normal_ad_boost_seconds_monthly = max(0, min(boost_hours * constants.SECONDS_PER_HOUR * constants.AVG_DAYS_PER_MONTH,
+                                                 total_monthly_seconds - srb_seconds_monthly))
+    unboosted_seconds_monthly = max(0, total_monthly_seconds - srb_seconds_monthly - normal_ad_boost_seconds_monthly)
+
+    if srb_forced:
+        boosted_monthly = fully_boosted_rate_per_second * total_monthly_seconds
+    else:
+        boosted_monthly = (base_rate_with_badge_per_second * unboosted_seconds_monthly) + \
+                          (fully_boosted_rate_per_second * normal_ad_boost_seconds_monthly) + \
+                          (base_rate_with_badge_per_second * constants.SUPER_RENT_BOOST_MULTIPLIER * srb_seconds_monthly)
+    return ad_boost_multiplier, base_monthly, boosted_monthly
+
+def get_next_ad_boost_tier(total_parcels, region):
+    """
+    Returns (current_tier, next_tier) from REGIONAL_AD_BOOST_DATA for a parcel count, each a tier
+    dict ('min', 'max', 'multiplier') or None when there is no current or no higher tier.
+    """
+    region_data = constants.REGIONAL_AD_BOOST_DATA.get(region) or constants.REGIONAL_AD_BOOST_DATA.get("United States", [])
+    for index, tier in enumerate(region_data):
+        if tier['min'] <= total_parcels <= tier['max']:
+            return tier, region_data[index + 1] if index + 1 < len(region_data) else None
+    # Below the first tier the first one is next; above the last there is nothing left
+    if region_data and total_parcels < region_data[0]['min']:
+        return None, region_data[0]
+    return None, None
@@ -3,6 +3,8 @@
 import tkinter as tk
 from tkinter import ttk
 
+import numpy as np
+
 # Custom Entry widget for integer input with robust validation and cleaning
 class IntegerEntry(ttk.Entry):
     def __init__(self, master=None, **kwargs):
@@ -64,3 +66,298 @@ class IntegerEntry(ttk.Entry):
            hasattr(app_instance, 'next_tier_calculator') and \
            hasattr(app_instance, 'custom_tier_calculator'): # Also check for custom_tier_calculator
                 app_instance.update_all_calculations()
+
+
+def downsample_min_max(x, y, buckets):
+    """
+    Reduces a curve to at most two points per bucket (the bucket's minimum and maximum),
+    so a polyline of a few thousand points keeps every spike and cliff of millions of samples.
+    """
+    if len(x) <= 2 * buckets:
+        return x, y
+    edges = np.linspace(0, len(x), buckets + 1).astype(np.int64)[:-1]
+    # Take each bucket's first sample as its x and its extremes as the two y values
+    x_pairs = np.repeat(x[edges], 2)
+    y_pairs = np.empty(2 * len(edges), dtype=np.float64)
+    y_pairs[0::2] = np.minimum.reduceat(y, edges)
+    y_pairs[1::2] = np.maximum.reduceat(y, edges)
+    return x_pairs, y_pairs
+
+
+# Line chart on a Tk Canvas for large numeric series, with wheel zoom and drag to pan
+class EarningsChart(tk.Canvas):
+    MARGIN = 50
+
+    def __init__(self, master=None, fetch_series=None, colors=None, **kwargs):
+        """
+        fetch_series(first, last, samples) must return (x, {series_name: y}) for the visible window only;
+        it is called again whenever the window changes, so zooming never recomputes hidden points.
+        samples is the plot's width in pixels: a series that is linear between known breakpoints
+        can return about that many points plus its breakpoints instead of every x in the window.
+        """
+        kwargs.setdefault("background", "white")
+        kwargs.setdefault("height", 260)
+        super().__init__(master, **kwargs)
+        self.fetch_series = fetch_series
+        self.colors = colors or {}
+        self.full_range = None
+        self.visible_range = None
+        self._drag_start = None
+
+        self.bind("<Configure>", lambda event: self.redraw())
+        self.bind("<MouseWheel>", self._on_wheel)
+        self.bind("<Button-4>", lambda event: self._zoom(event.x, 0.8))
+        self.bind("<Button-5>", lambda event: self._zoom(event.x, 1.25))
+        self.bind("<ButtonPress-1>", self._on_drag_start)
+        self.bind("<B1-Motion>", self._on_drag)
+        self.bind("<Double-Button-1>", lambda event: self.set_range(*self.full_range) if self.full_range else None)
+
+    def set_range(self, first, last, reset_zoom=True):
+        """Sets the x range to plot; reset_zoom also makes it the range a double-click returns to."""
+        if reset_zoom:
+            self.full_range = (first, last)
+        self.visible_range = (first, last)
+        self.redraw()
+
+    def redraw(self):
+        self.delete("all")
+        if self.fetch_series is None or self.visible_range is None:
+            return
+        width, height = self.winfo_width(), self.winfo_height()
+        plot_width = width - 2 * self.MARGIN
+        plot_height = height - 2 * self.MARGIN
+        if plot_width <= 0 or plot_height <= 0:
+            return
+
+        x, series = self.fetch_series(*self.visible_range, plot_width)
+        if len(x) == 0:
+            return
+        reduced = {name: downsample_min_max(x, y, plot_width) for name, y in series.items()}
+        y_min = min(float(y.min()) for _, y in reduced.values())
+        y_max = max(float(y.max()) for _, y in reduced.values())
+        y_span = (y_max - y_min) or 1.0
+        x_first, x_last = self.visible_range
+        x_span = (x_last - x_first) or 1
+
+        self.create_rectangle(self.MARGIN, self.MARGIN, width - self.MARGIN, height - self.MARGIN, outline="grey")
+        for i, (name, (xs, ys)) in enumerate(reduced.items()):
+            px = self.MARGIN + (xs - x_first) / x_span * plot_width
+            py = height - self.MARGIN - (ys - y_min) / y_span * plot_height
+            coords = np.column_stack([px, py]).ravel().tolist()
+            color = self.colors.get(name, "black")
+            if len(coords) >= 4:
+                self.create_line(*coords, fill=color)
+            self.create_text(self.MARGIN + 5 + 160 * i, self.MARGIN / 2, text=name, fill=color, anchor="w")
+
+        axis_font = ("Courier", 8)
+        self.create_text(self.MARGIN, height - self.MARGIN + 12, text=f"{x_first:,}", anchor="w", font=axis_font)
+        self.create_text(width - self.MARGIN, height - self.MARGIN + 12, text=f"{x_last:,}", anchor="e", font=axis_font)
+        self.create_text(self.MARGIN - 4, self.MARGIN, text=f"${y_max:,.2f}", anchor="e", font=axis_font)
+        self.create_text(self.MARGIN - 4, height - self.MARGIN, text=f"${y_min:,.2f}", anchor="e", font=axis_font)
+
+    def _x_at(self, pixel_x):
+        x_first, x_last = self.visible_range
+        plot_width = max(self.winfo_width() - 2 * self.MARGIN, 1)
+        fraction = min(max((pixel_x - self.MARGIN) / plot_width, 0.0), 1.0)
+        return x_first + fraction * (x_last - x_first)
+
+    def _zoom(self, pixel_x, factor):
+        if self.visible_range is None:
+            return
+        x_first, x_last = self.visible_range
+        anchor = self._x_at(pixel_x)
+        new_first = int(round(anchor - (anchor - x_first) * factor))
+        new_last = int(round(anchor + (x_last - anchor) * factor))
+        full_first, full_last = self.full_range
+        new_first, new_last = max(new_first, full_first), min(new_last, full_last)
+        if new_last - new_first >= 10:
+            self.set_range(new_first, new_last, reset_zoom=False)
+
+    def _on_wheel(self, event):
+        self._zoom(event.x, 0.8 if event.delta > 0 else 1.25)
+
+    def _on_drag_start(self, event):
+        self._drag_start = (event.x, self.visible_range)
+
+    def _on_drag(self, event):
+        if self._drag_start is None or self.visible_range is None:
+            return
+        start_x, (x_first, x_last) = self._drag_start
+        plot_width = max(self.winfo_width() - 2 * self.MARGIN, 1)
+        shift = int(round((start_x - event.x) / plot_width * (x_last - x_first)))
+        full_first, full_last = self.full_range
+        shift = min(max(shift, full_first - x_first), full_last - x_last)
+        self.set_range(x_first + shift, x_last + shift, reset_zoom=False)
+
+
+# Color scale of HeatmapChart from the lowest to the highest value, as (position, RGB) anchors
+HEATMAP_COLORS = [(0.0, (68, 1, 84)), (0.25, (59, 82, 139)), (0.5, (33, 145, 140)),
+                  (0.75, (94, 201, 98)), (1.0, (253, 231, 37))]
+
+
+def colorize(values):
+    """Maps an array of values onto HEATMAP_COLORS; returns uint8 RGB with a trailing axis of 3."""
+    values = np.asarray(values, dtype=np.float64)
+    low, high = float(values.min()), float(values.max())
+    scaled = (values - low) / ((high - low) or 1.0)
+    positions = [position for position, _ in HEATMAP_COLORS]
+    channels = [np.interp(scaled, positions, [color[channel] for _, color in HEATMAP_COLORS]) for channel in range(3)]
+    return np.stack(channels, axis=-1).round().astype(np.uint8)
+
+
+# Heatmap on a Tk Canvas: the grid is evaluated at the plot's pixel resolution and drawn as one image
+class HeatmapChart(tk.Canvas):
+    MARGIN = 50
+
+    def __init__(self, master=None, fetch_grid=None, describe_point=None, fetch_markers=None,
+                 y_range=(0.0, 24.0), y_steps=49, **kwargs):
+        """
+        fetch_grid(x_values, y_values) must return the values as a (len(y_values), len(x_values))
+        array; x runs over the range given to set_range, y over y_range in y_steps rows.
+        describe_point(x, y) returns the text shown while hovering, and fetch_markers(first, last)
+        the x positions to mark with vertical lines (e.g. where a tier starts).
+        """
+        kwargs.setdefault("background", "white")
+        kwargs.setdefault("height", 260)
+        super().__init__(master, **kwargs)
+        self.fetch_grid = fetch_grid
+        self.describe_point = describe_point
+        self.fetch_markers = fetch_markers
+        self.y_range = y_range
+        self.y_steps = y_steps
+        self.visible_range = None
+        # Tk only shows a PhotoImage while Python holds a reference to it
+        self._image = None
+
+        self.bind("<Configure>", lambda event: self.redraw())
+        self.bind("<Motion>", self._on_motion)
+        self.bind("<Leave>", lambda event: self.delete("hover"))
+
+    def set_range(self, first, last):
+        self.visible_range = (first, last)
+        self.redraw()
+
+    def redraw(self):
+        self.delete("all")
+        if self.fetch_grid is None or self.visible_range is None:
+            return
+        width, height = self.winfo_width(), self.winfo_height()
+        plot_width = width - 2 * self.MARGIN
+        plot_height = height - 2 * self.MARGIN
+        if plot_width <= 0 or plot_height <= 0:
+            return
+
+        # One column per pixel and one row per y step, highest y at the top
+        x_first, x_last = self.visible_range
+        x_values = np.linspace(x_first, x_last, plot_width).round().astype(np.int64)
+        y_values = np.linspace(self.y_range[1], self.y_range[0], self.y_steps)
+        grid = np.asarray(self.fetch_grid(x_values, y_values), dtype=np.float64)
+        rows = colorize(grid)[np.arange(plot_height) * self.y_steps // plot_height]
+        header = f"P6 {plot_width} {plot_height} 255 ".encode("ascii")
+        self._image = tk.PhotoImage(width=plot_width, height=plot_height, data=header + rows.tobytes(), format="PPM")
+        self.create_image(self.MARGIN, self.MARGIN, image=self._image, anchor="nw")
+
+        if self.fetch_markers is not None:
+            x_span = (x_last - x_first) or 1
+            for marker in self.fetch_markers(x_first, x_last):
+                px = self.MARGIN + (marker - x_first) / x_span * plot_width
+                self.create_line(px, self.MARGIN, px, height - self.MARGIN, fill="white", dash=(2, 3))
+
+        axis_font = ("Courier", 8)
+        self.create_rectangle(self.MARGIN, self.MARGIN, width - self.MARGIN, height - self.MARGIN, outline="grey")
+        self.create_text(self.MARGIN, height - self.MARGIN + 12, text=f"{x_first:,}", anchor="w", font=axis_font)
+        self.create_text(width - self.MARGIN, height - self.MARGIN + 12, text=f"{x_last:,}", anchor="e", font=axis_font)
+        self.create_text(self.MARGIN - 4, self.MARGIN, text=f"{self.y_range[1]:g}", anchor="e", font=axis_font)
+        self.create_text(self.MARGIN - 4, height - self.MARGIN, text=f"{self.y_range[0]:g}", anchor="e", font=axis_font)
+        self.create_text(width - self.MARGIN, self.MARGIN / 2, anchor="e", font=axis_font,
+                         text=f"${grid.min():,.2f} (dark) to ${grid.max():,.2f} (bright)")
+
+    def _point_at(self, pixel_x, pixel_y):
+        """The (x, y) under a pixel, or None outside the plot."""
+        plot_width = self.winfo_width() - 2 * self.MARGIN
+        plot_height = self.winfo_height() - 2 * self.MARGIN
+        fx = (pixel_x - self.MARGIN) / max(plot_width, 1)
+        fy = (pixel_y - self.MARGIN) / max(plot_height, 1)
+        if self.visible_range is None or not (0 <= fx <= 1 and 0 <= fy <= 1):
+            return None
+        x_first, x_last = self.visible_range
+        y_low, y_high = self.y_range
+        # Snap y to the row drawn under the pointer, so the text matches the color
+        row = min(int(fy * self.y_steps), self.y_steps - 1)
+        y = y_high - row * (y_high - y_low) / (self.y_steps - 1)
+        return int(round(x_first + fx * (x_last - x_first))), y
+
+    def _on_motion(self, event):
+        self.delete("hover")
+        point = self._point_at(event.x, event.y)
+        if point is None or self.describe_point is None:
+            return
+        self.create_text(self.MARGIN, self.MARGIN / 2, text=self.describe_point(*point), anchor="w",
+                         font=("Courier", 9), tags="hover")
+
+
+class JobStatusBar(ttk.Frame):
+    """
+    Status bar for a BackgroundJobRunner: shows the most recent running job with its progress
+    and a Cancel button, and hides the progress bar when nothing is running.
+    """
+    def __init__(self, master, job_runner, **kwargs):
+        super().__init__(master, **kwargs)
+        self.job_runner = job_runner
+        self.message_var = tk.StringVar(value="Ready.")
+
+        ttk.Label(self, textvariable=self.message_var).pack(side="left", padx=5)
+        self.cancel_button = ttk.Button(self, text="Cancel", command=self._cancel_current, state="disabled")
+        self.cancel_button.pack(side="right", padx=5)
+        self.progress_bar = ttk.Progressbar(self, length=160, maximum=1.0)
+
+        job_runner.status_callback = self._on_job_event
+
+    def _current_job(self):
+        return self.job_runner.active_jobs[-1] if self.job_runner.active_jobs else None
+
+    def _cancel_current(self):
+        job = self._current_job()
+        if job is not None:
+            job.cancel()
+
+    def _on_job_event(self, event, job, payload):
+        if event == "progress":
+            fraction, message = payload
+            if job is self._current_job():
+                self._show_progress(fraction)
+                self.message_var.set(f"{job.name}: {message}" if message else f"{job.name}...")
+            return
+        if event == "partial":
+            # Partial results are for the job's own tab; its progress reports drive the bar
+            return
+
+        current = self._current_job()
+        if current is None:
+            self.progress_bar.stop()
+            self.progress_bar.pack_forget()
+            self.cancel_button.config(state="disabled")
+            outcome = {"done": "finished", "error": "failed", "cancelled": "cancelled"}.get(event, event)
+            self.message_var.set(f"{job.name} {outcome}.")
+            return
+
+        # A job started or another one ended while more are running: show the latest one
+        waiting = len(self.job_runner.active_jobs) - 1
+        self.message_var.set(f"{current.name}..." + (f" (+{waiting} more)" if waiting else ""))
+        self.cancel_button.config(state="normal")
+        if event == "started":
+            self._show_progress(None)
+
+    def _show_progress(self, fraction):
+        """Shows a determinate bar for a known fraction, or a bouncing one when the total is unknown."""
+        if not self.progress_bar.winfo_ismapped():
+            self.progress_bar.pack(side="right", padx=5)
+        if fraction is None:
+            if str(self.progress_bar.cget("mode")) != "indeterminate":
+                self.progress_bar.config(mode="indeterminate", maximum=100)
+                self.progress_bar.start(15)
+        else:
+            if str(self.progress_bar.cget("mode")) != "determinate":
+                self.progress_bar.stop()
+                self.progress_bar.config(mode="determinate", maximum=1.0)
+            self.progress_bar["value"] = fraction
@@ -0,0 +1,155 @@
+# workers.py
+
+import itertools
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# How often the Tk main loop drains job events while jobs are running
+POLL_INTERVAL_MS = 50
+
+_job_ids = itertools.count(1)
+
+
+class JobCancelled(Exception):
+    """Raised inside a job once it notices that it has been cancelled."""
+
+
+class Job:
+    """
+    Handle for one background job. Thread jobs receive it as their first argument and use it to
+    report progress and partial results; the GUI uses it to cancel.
+    """
+    def __init__(self, runner, name, callbacks):
+        self.id = next(_job_ids)
+        self.name = name
+        self._runner = runner
+        self._callbacks = callbacks
+        self._cancel_event = threading.Event()
+        self._futures = []
+        self.finished = False
+
+    @property
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    def cancel(self):
+        """Requests cancellation. A running job stops at its next report; a queued one never starts."""
+        self._cancel_event.set()
+        # A job that never started has no worker thread to report the cancellation, so report it here
+        if any([future.cancel() for future in self._futures]):
+            self._runner._post(self, "cancelled", None)
+
+    def check_cancelled(self):
+        if self._cancel_event.is_set():
+            raise JobCancelled()
+
+    def report_progress(self, fraction=None, message=""):
+        """Thread-safe progress report; fraction is 0..1, or None when the total is unknown."""
+        self.check_cancelled()
+        self._runner._post(self, "progress", (fraction, message))
+
+    def report_partial(self, result):
+        """Thread-safe hand-off of a finished piece of the result, for display before the job completes."""
+        self.check_cancelled()
+        self._runner._post(self, "partial", result)
+
+
+class BackgroundJobRunner:
+    """
+    Runs jobs off the Tk main thread on a small thread pool, for exports and for calculations that
+    release the GIL in NumPy. Workers never touch widgets; their events go through a queue that the main loop drains with 'after', and every callback
+    (on_progress, on_partial, on_done, on_error, on_cancelled) runs on the main thread.
+    """
+    def __init__(self, master, max_threads=2, poll_interval_ms=POLL_INTERVAL_MS):
+        self.master = master
+        self.poll_interval_ms = poll_interval_ms
+        self.active_jobs = []
+        # Called as status_callback(event, job, payload) for every event, e.g. by a status bar
+        self.status_callback = None
+
+        self._events = queue.Queue()
+        self._threads = ThreadPoolExecutor(max_workers=max_threads, thread_name_prefix="atlas-worker")
+        self._poll_scheduled = False
+
+    def run_in_thread(self, name, func, *args, **callbacks):
+        """Runs func(job, *args) on a worker thread; on_done receives its return value."""
+        job = self._start_job(name, callbacks)
+        job._futures.append(self._threads.submit(self._run_thread_job, job, func, args))
+        return job
+
+    def cancel_all(self):
+        for job in list(self.active_jobs):
+            job.cancel()
+
+    def shutdown(self):
+        """Cancels every job and stops the pool without waiting for running work."""
+        self.cancel_all()
+        self._threads.shutdown(wait=False, cancel_futures=True)
+
+    def _start_job(self, name, callbacks):
+        job = Job(self, name, callbacks)
+        self.active_jobs.append(job)
+        self._notify("started", job, None)
+        self._schedule_poll()
+        return job
+
+    def _run_thread_job(self, job, func, args):
+        try:
+            job.check_cancelled()
+            result = func(job, *args)
+            job.check_cancelled()
+        except JobCancelled:
+            self._post(job, "cancelled", None)
+        except Exception as e:
+            self._post(job, "error", e)
+        else:
+            self._post(job, "done", result)
+
+    def _post(self, job, event, payload):
+        self._events.put((job, event, payload))
+
+    def _schedule_poll(self):
+        # Only poll while something is running, so an idle app costs nothing
+        if not self._poll_scheduled:
+            self._poll_scheduled = True
+            self.master.after(self.poll_interval_ms, self._poll)
+
+    def _poll(self):
+        self._poll_scheduled = False
+        while True:
+            try:
+                job, event, payload = self._events.get_nowait()
+            except queue.Empty:
+                break
+            self._dispatch(job, event, payload)
+        if self.active_jobs:
+            self._schedule_poll()
+
+    def _dispatch(self, job, event, payload):
+        if job not in self.active_jobs:
+            return
+        if job.cancelled:
+            # Late events from a job that was cancelled meanwhile are dropped, and a late result is discarded
+            if event in ("progress", "partial"):
+                return
+            if event == "done":
+                event, payload = "cancelled", None
+
+        if event in ("done", "error", "cancelled"):
+            self.active_jobs.remove(job)
+            job.finished = True
+
+        callback = job._callbacks.get(f"on_{event}")
+        if callback is not None:
+            if event == "progress":
+                callback(job, *payload)
+            elif event == "cancelled":
+                callback(job)
+            else:
+                callback(job, payload)
+        self._notify(event, job, payload)
+
+    def _notify(self, event, job, payload):
+        if self.status_callback is not None:
+            self.status_callback(event, job, payload)